@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+インポート時間のベンチマーク
+
+CLI（src.main）と API サーバー（src.api.server）について、新しいプロセスで
+モジュールをインポートするのにかかる時間を計測する。各モジュールは
+python -X importtime の出力から、時間のかかった上位のモジュールも表示する。
+Supabase の接続情報なしで計測し、インポートだけでクライアントや重い依存
+（supabase・google.generativeai）が読み込まれていないことも確認する。
+
+使い方:
+    python scripts/bench_import_time.py [--repeat 5] [--top 10] [module ...]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+DEFAULT_MODULES = ["src.main", "src.api.server"]
+
+# インポートしただけでは読み込まれないはずの重い依存
+LAZY_MODULES = ["supabase", "google.generativeai"]
+
+# 計測時に外す環境変数（接続情報なしでインポートできることを確認する）
+UNSET_ENV = ["SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY"]
+
+
+def _env() -> dict:
+    env = {key: value for key, value in os.environ.items() if key not in UNSET_ENV}
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """新しいプロセスで Python のコードを実行"""
+    return subprocess.run(
+        [sys.executable, "-W", "ignore", *options, "-c", code],
+        cwd=BACKEND_DIR,
+        env=_env(),
+        capture_output=True,
+        text=True,
+    )
+
+
+def measure(module: str, repeat: int) -> float:
+    """インポートを含むプロセス全体の最速の実行時間（ミリ秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run_python(f"import {module}")
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(f"{module} のインポートに失敗しました:\n{result.stderr}")
+        best = min(best, elapsed)
+    return best * 1000
+
+
+def top_imports(module: str, top: int) -> list[tuple[int, str]]:
+    """-X importtime の累積時間（マイクロ秒）が大きいモジュール"""
+    result = run_python(f"import {module}", "-X", "importtime")
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        entries.append((int(parts[1]), parts[2].strip()))
+    entries.sort(reverse=True)
+    return entries[:top]
+
+
+def loaded_lazy_modules(module: str) -> list[str]:
+    """インポート後に読み込まれている重い依存"""
+    code = (
+        "import sys\n"
+        f"import {module}\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = run_python(code)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="インポート時間のベンチマーク")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="計測するモジュール")
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数（最速を採用）")
+    parser.add_argument("--top", type=int, default=10, help="表示する上位モジュール数")
+    args = parser.parse_args()
+
+    baseline = measure("sys", args.repeat)
+    print(f"Python の起動のみ: {baseline:.1f} ms\n")
+
+    for module in args.modules:
+        elapsed = measure(module, args.repeat)
+        print(f"{module}: {elapsed:.1f} ms （インポート分 {elapsed - baseline:.1f} ms）")
+        for cumulative, name in top_imports(module, args.top):
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+        loaded = loaded_lazy_modules(module)
+        print(f"  インポート時に読み込まれた重い依存: {', '.join(loaded) if loaded else 'なし'}\n")
+
+
+if __name__ == "__main__":
+    main()
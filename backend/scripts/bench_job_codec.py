@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+案件データの表現・変換のベンチマーク
+
+1万件あたりの、
+- JobInfo を保持するメモリ（__slots__ なしの dataclass との比較）
+- 変換（API 用 dict・DB レコード・DB レコード → API 用 dict）の処理時間
+  （従来の手書き変換 = job_info_to_dict → job_to_db_record の2段階と、
+  JobColumns による列ごとの一括変換・生成した1件ずつの変換の比較）
+- JSON エンコードの処理時間（標準 json と job_codec.dumps）
+を計測する。変換結果が従来と同じであることは tests/test_job_batch.py で確認する。
+
+使い方:
+    python scripts/bench_job_codec.py [--jobs 10000] [--repeat 5]
+"""
+
+import argparse
+import dataclasses
+import json
+import pickle
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import job_codec
+from src.models.job_batch import JobColumns
+from src.models.job import BudgetType, ClientInfo, JobCategory, JobInfo, JobStatus, JobType, Service
+
+
+def _unslotted(cls: type) -> type:
+    """同じフィールドを持つ __slots__ なしの frozen dataclass（比較用）"""
+    specs = []
+    for f in dataclasses.fields(cls):
+        kwargs = {}
+        if f.default is not dataclasses.MISSING:
+            kwargs["default"] = f.default
+        if f.default_factory is not dataclasses.MISSING:
+            kwargs["default_factory"] = f.default_factory
+        specs.append((f.name, f.type, dataclasses.field(**kwargs)))
+    legacy = dataclasses.make_dataclass(f"Legacy{cls.__name__}", specs, frozen=True)
+    legacy.__module__ = __name__  # pickle で参照できるように
+    return legacy
+
+
+LegacyClientInfo = _unslotted(ClientInfo)
+LegacyJobInfo = _unslotted(JobInfo)
+
+
+def legacy_to_dict(job) -> dict:
+    """従来の JobInfo.to_dict"""
+    return {
+        "title": job.title,
+        "description": job.description,
+        "category": job.category.value,
+        "budget_type": job.budget_type.value,
+        "job_id": job.job_id,
+        "job_type": job.job_type.value,
+        "status": job.status.value,
+        "budget_min": job.budget_min,
+        "budget_max": job.budget_max,
+        "deadline": job.deadline,
+        "remaining_days": job.remaining_days,
+        "required_skills": job.required_skills,
+        "tags": job.tags,
+        "feature_tags": job.feature_tags,
+        "proposal_count": job.proposal_count,
+        "recruitment_count": job.recruitment_count,
+        "source": job.source.value,
+        "url": job.url,
+        "client": {
+            "name": job.client.name,
+            "rating": job.client.rating,
+            "review_count": job.client.review_count,
+            "order_history": job.client.order_history,
+        } if job.client else None,
+        "scraped_at": job.scraped_at.isoformat(),
+    }
+
+
+def legacy_job_info_to_dict(job, category: str) -> dict:
+    """従来の定期実行スクリプトの JobInfo → dict"""
+    return {
+        "title": job.title,
+        "description": job.description,
+        "category": category,
+        "subcategory": job.category.value if job.category else None,
+        "budget_type": job.budget_type.value if job.budget_type else "unknown",
+        "job_id": job.job_id,
+        "job_type": job.job_type.value if job.job_type else "project",
+        "status": job.status.value if job.status else "open",
+        "budget_min": job.budget_min,
+        "budget_max": job.budget_max,
+        "deadline": job.deadline,
+        "remaining_days": job.remaining_days,
+        "required_skills": job.required_skills or [],
+        "tags": job.tags or [],
+        "feature_tags": job.feature_tags or [],
+        "proposal_count": job.proposal_count,
+        "recruitment_count": job.recruitment_count,
+        "source": job.source.value if job.source else "lancers",
+        "url": job.url,
+        "client": {
+            "name": job.client.name if job.client else None,
+            "rating": job.client.rating if job.client else None,
+            "order_history": job.client.order_history if job.client else None,
+        } if job.client else None,
+        "scraped_at": job.scraped_at.isoformat(),
+    }
+
+
+def legacy_job_to_db_record(job: dict) -> dict:
+    """従来の dict → DB レコード"""
+    client = job.get("client") or {}
+    return {
+        "job_id": job.get("job_id"),
+        "title": job.get("title", ""),
+        "description": job.get("description", ""),
+        "category": job.get("category", "other"),
+        "subcategory": job.get("subcategory"),
+        "budget_type": job.get("budget_type", "unknown"),
+        "job_type": job.get("job_type", "project"),
+        "status": job.get("status", "open"),
+        "budget_min": job.get("budget_min"),
+        "budget_max": job.get("budget_max"),
+        "deadline": job.get("deadline"),
+        "remaining_days": job.get("remaining_days"),
+        "required_skills": job.get("required_skills", []),
+        "tags": job.get("tags", []),
+        "feature_tags": job.get("feature_tags", []),
+        "proposal_count": job.get("proposal_count"),
+        "recruitment_count": job.get("recruitment_count"),
+        "source": job.get("source", "lancers"),
+        "url": job.get("url", ""),
+        "client_name": client.get("name") if isinstance(client, dict) else job.get("client_name"),
+        "client_rating": client.get("rating") if isinstance(client, dict) else job.get("client_rating"),
+        "client_review_count": client.get("review_count") if isinstance(client, dict) else job.get("client_review_count"),
+        "client_order_history": client.get("order_history") if isinstance(client, dict) else job.get("client_order_history"),
+        "scraped_at": job.get("scraped_at", datetime.now().isoformat()),
+    }
+
+
+def legacy_db_record_to_job(record: dict) -> dict:
+    """従来の DB レコード → API 用 dict"""
+    return {column: record.get(column, default) for column, default in job_codec.DB_COLUMNS}
+
+
+def build_jobs(job_cls: type, client_cls: type, count: int) -> list:
+    """count 件の案件を生成（説明文は共有しない）"""
+    categories = list(JobCategory)
+    scraped_at = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        job_cls(
+            title=f"Pythonでのスクレイピングツール開発 #{i}",
+            description=f"案件{i}の説明文。" + "ECサイトから商品データを取得します。" * 20,
+            category=categories[i % len(categories)],
+            budget_type=BudgetType.FIXED,
+            source=Service.LANCERS,
+            url=f"https://www.lancers.jp/work/detail/{5000000 + i}",
+            job_id=str(5000000 + i),
+            job_type=JobType.PROJECT,
+            status=JobStatus.OPEN,
+            budget_min=50000,
+            budget_max=100000,
+            deadline="2026年1月31日",
+            remaining_days=i % 14,
+            required_skills=["Python", "スクレイピング"],
+            tags=["システム開発"],
+            feature_tags=["急募"],
+            proposal_count=i % 30,
+            recruitment_count=1,
+            client=client_cls(name=f"client{i}", rating=4.8, review_count=12, order_history=30),
+            scraped_at=scraped_at,
+        )
+        for i in range(count)
+    ]
+
+
+def measure_memory(job_cls: type, client_cls: type, count: int) -> int:
+    """案件オブジェクト（説明文等の文字列を除く）の保持に使うバイト数"""
+    jobs = build_jobs(job_cls, client_cls, count)
+    strings = sum(sys.getsizeof(job.title) + sys.getsizeof(job.description) for job in jobs)
+    del jobs
+    tracemalloc.start()
+    jobs = build_jobs(job_cls, client_cls, count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del jobs
+    return current - strings
+
+
+def bench(label: str, fn: Callable[[], object], repeat: int, base: float = 0.0) -> float:
+    """最速の1回の処理時間（ミリ秒）を表示して返す"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    elapsed = best * 1000
+    ratio = f" ({base / elapsed:5.2f} 倍)" if base else ""
+    print(f"  {label:<36} {elapsed:9.2f} ms{ratio}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="案件データの表現・変換のベンチマーク")
+    parser.add_argument("--jobs", type=int, default=10000, help="案件数")
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数（最速を採用）")
+    args = parser.parse_args()
+    n = args.jobs
+
+    print(f"案件: {n}件 （orjson: {'あり' if job_codec.orjson else 'なし'}）")
+
+    print("\nメモリ（文字列を除くオブジェクト）")
+    legacy_bytes = measure_memory(LegacyJobInfo, LegacyClientInfo, n)
+    slotted_bytes = measure_memory(JobInfo, ClientInfo, n)
+    print(f"  {'dataclass':<36} {legacy_bytes / 1024 / 1024:9.2f} MB")
+    print(f"  {'dataclass + __slots__':<36} {slotted_bytes / 1024 / 1024:9.2f} MB")
+    print(f"  {'削減':<36} {(legacy_bytes - slotted_bytes) / 1024 / 1024:9.2f} MB")
+
+    legacy_jobs = build_jobs(LegacyJobInfo, LegacyClientInfo, n)
+    jobs = build_jobs(JobInfo, ClientInfo, n)
+
+    rows = JobColumns.from_jobs(jobs, "system").to_rows()
+
+    print("\nJobInfo → API 用 dict")
+    base = bench("従来（手書き）", lambda: [legacy_to_dict(j) for j in legacy_jobs], args.repeat)
+    bench("job_to_api_dict", lambda: [job_codec.job_to_api_dict(j) for j in jobs], args.repeat, base)
+
+    print("\nJobInfo → DB レコード")
+    base = bench(
+        "従来（dict → DB レコードの2段階）",
+        lambda: [legacy_job_to_db_record(legacy_job_info_to_dict(j, "system")) for j in legacy_jobs],
+        args.repeat,
+    )
+    bench("JobColumns（列のみ）", lambda: JobColumns.from_jobs(jobs, "system"), args.repeat, base)
+    bench(
+        "JobColumns（列 → 行）",
+        lambda: JobColumns.from_jobs(jobs, "system").to_rows(),
+        args.repeat,
+        base,
+    )
+
+    print("\nDB レコード → API 用 dict")
+    base = bench("dict.get のループ", lambda: [legacy_db_record_to_job(r) for r in rows], args.repeat)
+    bench("db_records_to_jobs", lambda: job_codec.db_records_to_jobs(rows), args.repeat, base)
+    bench("JobColumns（列 → 行）", lambda: JobColumns.from_records(rows).to_rows(), args.repeat, base)
+
+    print("\nJSON エンコード（API 用 dict の一覧）")
+    dicts = [job.to_dict() for job in jobs]
+    base = bench(
+        "json.dumps",
+        lambda: json.dumps(dicts, ensure_ascii=False).encode("utf-8"),
+        args.repeat,
+    )
+    bench("job_codec.dumps", lambda: job_codec.dumps(dicts), args.repeat, base)
+    bench("job_codec.dumps（JobInfo を直接）", lambda: job_codec.dumps(jobs), args.repeat, base)
+
+    print("\npickle（解析プロセスとの受け渡し）")
+    legacy_size = len(pickle.dumps(legacy_jobs[:1000]))
+    size = len(pickle.dumps(jobs[:1000]))
+    print(f"  {'dataclass':<36} {legacy_size / 1000:9.0f} バイト/件")
+    print(f"  {'dataclass + __slots__':<36} {size / 1000:9.0f} バイト/件")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+キーワード検出のベンチマーク
+
+カテゴリ判定（BaseScraper._categorize）とスキル抽出（match_skills）について、
+キーワードごとに `in` で検索する従来のループと、KeywordMatcher（str.find 走査 /
+pyahocorasick のオートマトン）の処理時間を比較する。キーワード数を増やした
+場合の比較も行う（--extra-keywords）。
+
+使い方:
+    python scripts/bench_keyword_matcher.py [--size 20000] [--docs 200] [--repeat 5]
+        [--extra-keywords 1000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.job import JobCategory
+from src.scrapers.base import BaseScraper
+from src.scrapers.lancers.constants import SKILL_KEYWORDS
+from src.utils.keyword_matcher import KeywordMatcher, ahocorasick
+
+# 案件説明文らしい文章の素材
+FRAGMENTS = [
+    "本案件ではPythonとDjangoを用いたWebアプリケーションの開発をお願いします。",
+    "既存のWordPressサイトの改修と、PHPによるプラグイン開発が中心です。",
+    "AWS上でDockerコンテナを運用しており、Kubernetesへの移行を検討しています。",
+    "ECサイトから商品データを自動取得するスクレイピングツールを作成してください。",
+    "機械学習モデルを使った需要予測と、BIツールでの可視化レポートを想定しています。",
+    "React Native / Flutter でのiOS・Androidアプリ開発経験がある方を歓迎します。",
+    "定期実行のバッチ処理とRPAによる業務効率化も合わせてご相談させてください。",
+    "ChatGPT APIを活用したLLMアプリケーションの試作をお願いしたいです。",
+    "納期は1ヶ月を予定しております。ご不明点があればお気軽にご質問ください。",
+    "Google スプレッドシートとの連携、Slack への通知機能もお願いします。",
+    "TypeScript と Next.js で管理画面を構築し、PostgreSQL にデータを保存します。",
+]
+
+
+def legacy_categorize(text: str) -> JobCategory:
+    """従来のカテゴリ判定（キーワードごとに in で検索）"""
+    text_lower = text.lower()
+    scores: dict[JobCategory, int] = {}
+    for category, keywords in BaseScraper.CATEGORY_KEYWORDS.items():
+        score = sum(1 for kw in keywords if kw.lower() in text_lower)
+        if score > 0:
+            scores[category] = score
+    if scores:
+        return max(scores, key=lambda k: scores[k])
+    return JobCategory.OTHER
+
+
+def legacy_match_skills(description: str) -> list[str]:
+    """従来のスキル抽出（キーワードごとに in で検索）"""
+    desc_lower = description.lower()
+    return [skill for skill in SKILL_KEYWORDS if skill.lower() in desc_lower]
+
+
+def build_documents(count: int, size: int, seed: int = 0) -> list[str]:
+    """size 文字程度の説明文を count 件生成"""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        parts: list[str] = []
+        length = 0
+        while length < size:
+            fragment = rng.choice(FRAGMENTS)
+            parts.append(fragment)
+            length += len(fragment)
+        documents.append("".join(parts))
+    return documents
+
+
+def bench(label: str, fn: Callable[[str], object], documents: list[str], repeat: int) -> float:
+    """最速の1回あたりの1文書の処理時間（ミリ秒）を表示して返す"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            fn(document)
+        best = min(best, time.perf_counter() - start)
+    per_doc = best / len(documents) * 1000
+    print(f"  {label:<28} {per_doc:8.3f} ms/件")
+    return per_doc
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="キーワード検出のベンチマーク")
+    parser.add_argument("--size", type=int, default=20000, help="説明文の文字数")
+    parser.add_argument("--docs", type=int, default=200, help="説明文の件数")
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数（最速を採用）")
+    parser.add_argument(
+        "--extra-keywords", type=int, default=1000, help="追加で比較するキーワード数"
+    )
+    args = parser.parse_args()
+
+    documents = build_documents(args.docs, args.size)
+
+    category_keywords = [
+        (keyword, category)
+        for category, keywords in BaseScraper.CATEGORY_KEYWORDS.items()
+        for keyword in keywords
+    ]
+    skill_keywords = [(skill, skill) for skill in SKILL_KEYWORDS]
+    backends = [("find", False)] + ([("automaton", True)] if ahocorasick else [])
+
+    print(f"説明文: {args.docs}件 × 約{args.size}文字")
+    if ahocorasick is None:
+        print("（pyahocorasick 未インストールのため str.find 走査のみ計測）")
+
+    print("\nカテゴリ判定")
+    base = bench("従来ループ", legacy_categorize, documents, args.repeat)
+    for name, use_automaton in backends:
+        matcher = KeywordMatcher(category_keywords, use_automaton=use_automaton)
+        elapsed = bench(f"KeywordMatcher ({name})", matcher.count_labels, documents, args.repeat)
+        print(f"  {'':<28} {base / elapsed:8.2f} 倍")
+
+    print("\nスキル抽出")
+    base = bench("従来ループ", legacy_match_skills, documents, args.repeat)
+    for name, use_automaton in backends:
+        matcher = KeywordMatcher(skill_keywords, use_automaton=use_automaton)
+        elapsed = bench(f"KeywordMatcher ({name})", matcher.find, documents, args.repeat)
+        print(f"  {'':<28} {base / elapsed:8.2f} 倍")
+
+    # キーワード数が多い場合（オートマトンはキーワード数によらず1回の走査で済む）
+    if args.extra_keywords:
+        rng = random.Random(1)
+        katakana = [chr(code) for code in range(ord("ァ"), ord("ヶ") + 1)]
+        extra = SKILL_KEYWORDS + [
+            "".join(rng.choice(katakana) for _ in range(rng.randint(3, 6)))
+            for _ in range(args.extra_keywords)
+        ]
+        print(f"\nスキル抽出（キーワード{len(extra)}語）")
+
+        def legacy_many(description: str) -> list[str]:
+            desc_lower = description.lower()
+            return [skill for skill in extra if skill.lower() in desc_lower]
+
+        base = bench("従来ループ", legacy_many, documents, args.repeat)
+        for name, use_automaton in backends:
+            matcher = KeywordMatcher([(kw, kw) for kw in extra], use_automaton=use_automaton)
+            elapsed = bench(f"KeywordMatcher ({name})", matcher.find, documents, args.repeat)
+            print(f"  {'':<28} {base / elapsed:8.2f} 倍")
+
+    # 単語境界の扱いによる結果の違い（"Django" 中の "Go" 等は従来ループのみ検出する）
+    matcher = KeywordMatcher(skill_keywords)
+    sample = "DjangoとGoogle Maps APIを使ったWebアプリ。mail送信も含みます。"
+    print(f"\n例: {sample}")
+    print(f"  従来ループ:     {legacy_match_skills(sample)}")
+    print(f"  KeywordMatcher: {matcher.find(sample)}")
+
+
+if __name__ == "__main__":
+    main()
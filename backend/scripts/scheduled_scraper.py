@@ -4,17 +4,32 @@
 import asyncio
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Optional
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
-from supabase import create_client
 
-from src.models.config import ScrapingConfig, HumanLikeConfig, TimeoutConfig
-from src.scrapers.lancers import LancersScraper
+from src.db import get_supabase_client
+from src.db.job_writer import save_job_records
+from src.models.job_batch import JobColumns
+from src.models.config import (
+    BrowserPoolConfig,
+    HumanLikeConfig,
+    ScrapingConfig,
+    ThrottleConfig,
+    TimeoutConfig,
+)
+from src.scrapers.lancers import LancersHttpScraper, LancersScraper
+from src.scrapers.lifecycle import shutdown_scrapers
+from src.scrapers.lancers.constants import SEARCH_PAGE_SIZE
+from src.scrapers.html_cache import get_html_cache
+from src.scrapers.resource_policy import block_stats
+from src.scrapers.retry import RetryBudget
+from src.scrapers.throttle import limiter_stats
 
 
 # 環境変数読み込み
@@ -23,109 +38,92 @@ load_dotenv()
 # 全体タイムアウト（GitHub Actions対策: デフォルト30分）
 MAX_EXECUTION_MINUTES = int(os.getenv("MAX_EXECUTION_MINUTES", "30"))
 
+# 詳細取得ワーカー数
+DETAIL_WORKERS = max(1, int(os.getenv("DETAIL_WORKERS", "3")))
 
-def get_supabase_client():
-    """Supabaseクライアントを取得"""
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not url or not key:
-        raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
-
-    return create_client(url, key)
-
-
-def job_to_db_record(job_data: dict) -> dict:
-    """案件データをDBレコード形式に変換"""
-    client = job_data.get("client") or {}
-    return {
-        "job_id": job_data.get("job_id"),
-        "title": job_data.get("title", ""),
-        "description": job_data.get("description", ""),
-        "category": job_data.get("category", "other"),
-        "subcategory": job_data.get("subcategory"),
-        "budget_type": job_data.get("budget_type", "unknown"),
-        "job_type": job_data.get("job_type", "project"),
-        "status": job_data.get("status", "open"),
-        "budget_min": job_data.get("budget_min"),
-        "budget_max": job_data.get("budget_max"),
-        "deadline": job_data.get("deadline"),
-        "remaining_days": job_data.get("remaining_days"),
-        "required_skills": job_data.get("required_skills", []),
-        "tags": job_data.get("tags", []),
-        "feature_tags": job_data.get("feature_tags", []),
-        "proposal_count": job_data.get("proposal_count"),
-        "recruitment_count": job_data.get("recruitment_count"),
-        "source": job_data.get("source", "lancers"),
-        "url": job_data.get("url", ""),
-        "client_name": client.get("name") if isinstance(client, dict) else None,
-        "client_rating": client.get("rating") if isinstance(client, dict) else None,
-        "client_review_count": client.get("review_count") if isinstance(client, dict) else None,
-        "client_order_history": client.get("order_history") if isinstance(client, dict) else None,
-        "scraped_at": job_data.get("scraped_at", datetime.now().isoformat()),
-    }
+# lancers.jp への開始時のリクエスト速度（件/秒）と同時リクエスト数の上限
+# 以降は応答（429/403/503・閲覧制限ページ・応答遅延）に応じて自動で増減する
+REQUESTS_PER_SECOND = float(os.getenv("REQUESTS_PER_SECOND", "1.0"))
+MAX_CONCURRENT_REQUESTS = max(1, int(os.getenv("MAX_CONCURRENT_REQUESTS", "6")))
 
+# 差分スクレイピング: 既知の案件は詳細を取り直さず、既知のみのページで打ち切る
+INCREMENTAL = os.getenv("INCREMENTAL", "true").lower() == "true"
 
-async def save_to_database(supabase, jobs: list[dict]) -> dict:
-    """Supabaseにデータを保存（upsert）"""
-    total_added = 0
-    total_updated = 0
+# 差分モードでも、この時間以上更新されていない既知案件は取り直す
+REFRESH_HOURS = float(os.getenv("INCREMENTAL_REFRESH_HOURS", "72"))
 
-    print(f"Supabase保存開始: {len(jobs)}件")
+# 既知案件の読み込み単位（PostgRESTの1リクエストあたり上限以下）
+KNOWN_JOBS_PAGE_SIZE = 1000
 
-    for job in jobs:
-        record = job_to_db_record(job)
-        job_id = record.get("job_id")
 
-        if not job_id:
-            continue
+def load_known_jobs(supabase) -> dict[str, dict]:
+    """詳細取得済みの既知案件を取得（job_id -> 一覧で変化しうる項目と最終取得日時）
 
-        try:
-            # 既存レコードをチェック
-            existing = supabase.table("jobs").select("id").eq("job_id", job_id).execute()
+    説明文が空の案件は詳細未取得とみなし、新規と同じ扱いにする。
+    """
+    known: dict[str, dict] = {}
+    start = 0
 
-            if existing.data:
-                supabase.table("jobs").update(record).eq("job_id", job_id).execute()
-                total_updated += 1
-            else:
-                supabase.table("jobs").insert(record).execute()
-                total_added += 1
-        except Exception as e:
-            print(f"  保存エラー: {job_id} - {e}")
-
-    print(f"Supabase保存完了: 追加{total_added}件, 更新{total_updated}件")
-    return {"added": total_added, "updated": total_updated}
-
-
-def job_info_to_dict(job, category: str) -> dict:
-    """JobInfoをdictに変換"""
-    return {
-        "title": job.title,
-        "description": job.description,
-        "category": category,  # Lancersの検索カテゴリを使用
-        "subcategory": job.category.value if job.category else None,  # 自動分類サブカテゴリ
-        "budget_type": job.budget_type.value if job.budget_type else "unknown",
-        "job_id": job.job_id,
-        "job_type": job.job_type.value if job.job_type else "project",
-        "status": job.status.value if job.status else "open",
-        "budget_min": job.budget_min,
-        "budget_max": job.budget_max,
-        "deadline": job.deadline,
-        "remaining_days": job.remaining_days,
-        "required_skills": job.required_skills or [],
-        "tags": job.tags or [],
-        "feature_tags": job.feature_tags or [],
-        "proposal_count": job.proposal_count,
-        "recruitment_count": job.recruitment_count,
-        "source": job.source.value if job.source else "lancers",
-        "url": job.url,
-        "client": {
-            "name": job.client.name if job.client else None,
-            "rating": job.client.rating if job.client else None,
-            "order_history": job.client.order_history if job.client else None,
-        } if job.client else None,
-        "scraped_at": datetime.now().isoformat(),
-    }
+    while True:
+        result = (
+            supabase.table("jobs")
+            .select("job_id, scraped_at, proposal_count, remaining_days")
+            .neq("description", "")
+            .order("job_id")
+            .range(start, start + KNOWN_JOBS_PAGE_SIZE - 1)
+            .execute()
+        )
+        rows = result.data or []
+        for row in rows:
+            known[row["job_id"]] = row
+        if len(rows) < KNOWN_JOBS_PAGE_SIZE:
+            break
+        start += KNOWN_JOBS_PAGE_SIZE
+
+    return known
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """DBのタイムスタンプ文字列を datetime に変換"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def classify_job(job_data: dict, known: dict[str, dict]) -> str:
+    """既知案件との比較結果を返す（"new" / "changed" / "unchanged"）"""
+    stored = known.get(job_data.get("job_id"))
+    if stored is None:
+        return "new"
+
+    for field in ("proposal_count", "remaining_days"):
+        if job_data.get(field) is not None and job_data.get(field) != stored.get(field):
+            return "changed"
+
+    scraped_at = _parse_timestamp(stored.get("scraped_at"))
+    if scraped_at is None or datetime.now(timezone.utc) - scraped_at > timedelta(hours=REFRESH_HOURS):
+        return "changed"
+
+    return "unchanged"
+
+
+async def save_to_database(supabase, jobs: list[dict]) -> dict:
+    """Supabaseにデータを保存（内容が変わった行のみ一括 upsert）"""
+    print(f"Supabase保存開始: {len(jobs)}件")
+
+    records = JobColumns.from_records(jobs).filter("job_id").to_rows()
+    result = await save_job_records(supabase, records)
+
+    print(
+        f"Supabase保存完了: 追加{result['added']}件, 更新{result['updated']}件, "
+        f"変更なし{result['unchanged']}件, 失敗{result['failed']}件 "
+        f"({result['requests']}リクエスト)"
+    )
+    return result
 
 
 async def fetch_job_detail(scraper: LancersScraper, job_data: dict) -> dict:
@@ -137,10 +135,8 @@ async def fetch_job_detail(scraper: LancersScraper, job_data: dict) -> dict:
     detail_url = f"https://www.lancers.jp/work/detail/{job_id}"
 
     try:
-        detail = await asyncio.wait_for(
-            scraper.scrape(detail_url),
-            timeout=30.0
-        )
+        # 1回の取得のタイムアウトと再試行はスクレイパー側で行う
+        detail = await scraper.scrape(detail_url)
 
         # 詳細情報で更新
         job_data["description"] = detail.description or job_data.get("description", "")
@@ -148,104 +144,125 @@ async def fetch_job_detail(scraper: LancersScraper, job_data: dict) -> dict:
         job_data["deadline"] = detail.deadline or job_data.get("deadline")
 
         if detail.client:
-            job_data["client"] = {
-                "name": detail.client.name,
-                "rating": detail.client.rating,
-                "order_history": detail.client.order_history,
-            }
+            job_data["client_name"] = detail.client.name
+            job_data["client_rating"] = detail.client.rating
+            job_data["client_review_count"] = detail.client.review_count
+            job_data["client_order_history"] = detail.client.order_history
 
         return job_data
 
-    except asyncio.TimeoutError:
-        print(f"    詳細取得タイムアウト: {job_id}")
-        return job_data
     except Exception as e:
         print(f"    詳細取得エラー: {job_id} - {e}")
         return job_data
 
 
+def is_over_budget(start_time: Optional[datetime]) -> bool:
+    """全体タイムアウトに達したか"""
+    if not start_time:
+        return False
+    elapsed_minutes = (datetime.now() - start_time).total_seconds() / 60
+    return elapsed_minutes > MAX_EXECUTION_MINUTES
+
+
+async def detail_worker(
+    worker_id: int,
+    queue: asyncio.Queue,
+    scraper: LancersScraper,
+    start_time: Optional[datetime] = None,
+) -> None:
+    """詳細取得ワーカー（キューが空になるまで案件を処理）"""
+    while True:
+        job_data = await queue.get()
+        try:
+            # 全体タイムアウト後はキューを空にするだけ
+            if is_over_budget(start_time):
+                continue
+
+            print(f"    [worker{worker_id}] 詳細取得中: {job_data.get('job_id')}")
+            await fetch_job_detail(scraper, job_data)
+        finally:
+            queue.task_done()
+
+
 async def scrape_category(
     category: str,
     job_types: list[str],
     max_pages: int,
     config: ScrapingConfig,
-    fetch_details: bool = False,
+    detail_queue: Optional[asyncio.Queue] = None,
     start_time: datetime = None,
+    known: Optional[dict[str, dict]] = None,
+    retry_budget: Optional[RetryBudget] = None,
 ) -> list[dict]:
-    """単一カテゴリをスクレイピング"""
-    scraper = LancersScraper(config)
+    """単一カテゴリをスクレイピング
+
+    一覧はHTTPで取得し、ブロック時のみブラウザにフォールバックする。
+    detail_queue が渡された場合、取得した案件をページ単位で詳細取得キューに
+    投入する（一覧取得と詳細取得を並行させる）。
+    known が渡された場合（差分モード）、変化のない既知案件は結果から除き、
+    新規案件を含まないページに達した時点で打ち切る。
+    取得できないページは再試行し、それでも失敗したページは飛ばして続ける。
+    """
+    scraper = LancersHttpScraper(config, retry_budget=retry_budget)
     results = []
 
     print(f"[{category}] スクレイピング開始...")
 
-    # 一覧取得フェーズ
-    for page_num in range(1, max_pages + 1):
-        # タイムアウトチェック
-        if start_time:
-            elapsed_minutes = (datetime.now() - start_time).total_seconds() / 60
-            if elapsed_minutes > MAX_EXECUTION_MINUTES:
-                print(f"  [{category}] 全体タイムアウト({MAX_EXECUTION_MINUTES}分)到達、中断します")
+    # 処理中のページと並行して次のページを先読みする
+    pages = scraper.iter_pages(
+        category=category,
+        job_types=job_types,
+        max_pages=max_pages,
+        open_only=True,
+        max_items=50,
+        page_timeout=60.0,
+    )
+    last_page = 0
+    try:
+        async for page_num, page_jobs in pages:
+            last_page = page_num
+            if not page_jobs:
+                print(f"  [{category}] {page_num}ページ目は空でした")
                 break
 
-        print(f"  [{category}] {page_num}ページ目を取得中...")
-
-        url = scraper.build_search_url(
-            category=category,
-            job_types=job_types,
-            open_only=True,
-            page=page_num,
-        )
-
-        try:
-            page_jobs = await asyncio.wait_for(
-                scraper.scrape_list(url=url, max_items=50),
-                timeout=60.0
-            )
-        except asyncio.TimeoutError:
-            print(f"  [{category}] タイムアウト: {page_num}ページ目")
-            break
-        except Exception as e:
-            print(f"  [{category}] エラー: {e}")
-            break
-
-        if not page_jobs:
-            print(f"  [{category}] {page_num}ページ目は空でした")
-            break
-
-        # JobInfoをdictに変換
-        for job in page_jobs:
-            results.append(job_info_to_dict(job, category))
-
-        print(f"  [{category}] {len(page_jobs)}件取得")
-
-        if len(page_jobs) < 20:
-            print(f"  [{category}] 最終ページと判断")
-            break
-
-        # ページ間の短い待機（1秒）
-        await asyncio.sleep(1)
-
-    # 詳細取得フェーズ
-    if fetch_details and results:
-        print(f"  [{category}] 詳細取得開始: {len(results)}件")
-
-        for idx, job_data in enumerate(results):
-            # タイムアウトチェック
-            if start_time:
-                elapsed_minutes = (datetime.now() - start_time).total_seconds() / 60
-                if elapsed_minutes > MAX_EXECUTION_MINUTES:
-                    print(f"  [{category}] 全体タイムアウト到達、詳細取得を中断 ({idx}/{len(results)}件完了)")
+            # JobInfoをDBレコード形式に変換し、詳細取得キューへ投入
+            counts = {"new": 0, "changed": 0, "unchanged": 0}
+            for job_data in JobColumns.from_jobs(page_jobs, category).rows():
+                status = classify_job(job_data, known) if known is not None else "new"
+                counts[status] += 1
+                if status == "unchanged":
+                    continue
+
+                results.append(job_data)
+                if detail_queue is not None and job_data.get("job_id"):
+                    await detail_queue.put(job_data)
+
+            if known is not None:
+                print(
+                    f"  [{category}] {page_num}ページ目: {len(page_jobs)}件取得 "
+                    f"(新規{counts['new']}件, 変更{counts['changed']}件, 変更なし{counts['unchanged']}件)"
+                )
+                # 新着順のため、既知案件だけのページ以降に新規案件はない
+                if counts["new"] == 0:
+                    print(f"  [{category}] 新規案件がないため打ち切り")
                     break
+            else:
+                print(f"  [{category}] {page_num}ページ目: {len(page_jobs)}件取得")
 
-            print(f"    [{category}] 詳細取得中: {idx + 1}/{len(results)}")
-            results[idx] = await fetch_job_detail(scraper, job_data)
-
-            # 詳細取得間の待機（1.5秒）
-            await asyncio.sleep(1.5)
+            if len(page_jobs) < SEARCH_PAGE_SIZE:
+                print(f"  [{category}] 最終ページと判断")
+                break
 
-        print(f"  [{category}] 詳細取得完了")
+            if is_over_budget(start_time):
+                print(f"  [{category}] 全体タイムアウト({MAX_EXECUTION_MINUTES}分)到達、中断します")
+                break
+    except Exception as e:
+        # 飛ばせるページ数（config.retry.skip_pages）を超えて失敗した場合
+        print(f"  [{category}] {last_page + 1}ページ目以降を中断: {e}")
+    finally:
+        await pages.aclose()
 
-    print(f"[{category}] 完了: {len(results)}件")
+    print(f"[{category}] 一覧取得完了: {len(results)}件")
     return results
 
 
@@ -263,32 +280,74 @@ async def run_scheduled_scrape():
     print(f"  案件形式: {job_types}")
     print(f"  最大ページ数: {max_pages}")
     print(f"  詳細取得: {'有効' if fetch_details else '無効'}")
+    print(f"  詳細取得ワーカー数: {DETAIL_WORKERS}")
+    print(f"  差分モード: {'有効' if INCREMENTAL else '無効'}")
+    print(f"  リクエスト速度: 開始{REQUESTS_PER_SECOND}件/秒 (同時{MAX_CONCURRENT_REQUESTS}件まで自動調整)")
     print(f"  最大実行時間: {MAX_EXECUTION_MINUTES}分")
     print(f"  実行時刻: {datetime.now().isoformat()}")
     print("=" * 50)
 
     # スクレイパー設定（高速化: human_like無効）
+    # 同時に使うページ数（一覧 + 詳細ワーカー）をプールに確保する
     config = ScrapingConfig(
         human_like=HumanLikeConfig(enabled=False),
         timeout=TimeoutConfig(page_load=30000, element_wait=5000),
+        pool=BrowserPoolConfig(contexts_per_browser=len(categories) + DETAIL_WORKERS),
+        throttle=ThrottleConfig(
+            initial_delay=1 / REQUESTS_PER_SECOND,
+            max_concurrency=MAX_CONCURRENT_REQUESTS,
+        ),
     )
 
     start_time = datetime.now()
-
-    # 並列でスクレイピング実行（最大2並列）
+    block_stats.reset()
+    # 全カテゴリ・詳細取得で共有するリトライ予算
+    retry_budget = RetryBudget(config.retry.budget)
+
+    # 差分モード: 既知案件を先に読み込む
+    supabase = None
+    known: Optional[dict[str, dict]] = None
+    if INCREMENTAL:
+        supabase = get_supabase_client()
+        known = load_known_jobs(supabase)
+        print(f"既知案件: {len(known)}件")
+
+    # 詳細取得ワーカーを起動（一覧取得と並行して処理）
+    detail_queue: Optional[asyncio.Queue] = None
+    workers: list[asyncio.Task] = []
+    if fetch_details:
+        detail_queue = asyncio.Queue(maxsize=DETAIL_WORKERS * 10)
+        detail_scraper = LancersHttpScraper(config, retry_budget=retry_budget)
+        workers = [
+            asyncio.create_task(detail_worker(i + 1, detail_queue, detail_scraper, start_time))
+            for i in range(DETAIL_WORKERS)
+        ]
+
+    # 全カテゴリの一覧取得を並列実行（リクエスト間隔はホスト単位で制御）
     tasks = [
         scrape_category(
             category,
             job_types,
             max_pages,
             config,
-            fetch_details=fetch_details,
+            detail_queue=detail_queue,
             start_time=start_time,
+            known=known,
+            retry_budget=retry_budget,
         )
-        for category in categories[:2]  # 安全のため2カテゴリまで
+        for category in categories
     ]
 
     results_list = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 残りの詳細取得を待ってワーカーを停止
+    if detail_queue is not None:
+        await detail_queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        print("詳細取得完了")
+
     elapsed = (datetime.now() - start_time).total_seconds()
 
     # 結果を集約
@@ -301,15 +360,48 @@ async def run_scheduled_scrape():
 
     print(f"\n合計: {len(all_results)}件 (実行時間: {elapsed:.1f}秒)")
 
+    blocked = block_stats.snapshot()
+    print(
+        f"リソースブロック: {blocked['blocked_requests']}件遮断 {blocked['blocked_by_type']}, "
+        f"受信{blocked['allowed_requests']}件 / {blocked['allowed_bytes'] / 1024:.0f}KB"
+    )
+    cache = get_html_cache(config.cache)
+    if cache is not None:
+        cached = cache.stats()
+        print(
+            f"詳細キャッシュ: ヒット{cached['hits']}件, 期限切れ{cached['stale']}件 "
+            f"(304で再利用{cached['revalidated']}件), 保存{cached['stores']}件, "
+            f"削除{cached['evictions']}件, {cached['bytes'] / 1024 / 1024:.1f}MB"
+        )
+    retries = retry_budget.stats()
+    print(f"リトライ: {retries['used']}/{retries['limit']}回 {retries['by_error']}")
+    for throttle in limiter_stats():
+        print(
+            f"リクエスト制御 [{throttle['host']}]: {throttle['requests']}件, "
+            f"最終 {throttle['rate']}件/秒 (同時{throttle['concurrency']}件, 間隔{throttle['delay']}秒), "
+            f"ブロック{throttle['blocked']}件, 遅延{throttle['slow']}件"
+        )
+
     # Supabaseに保存
     if all_results:
-        supabase = get_supabase_client()
+        supabase = supabase or get_supabase_client()
         result = await save_to_database(supabase, all_results)
-        print(f"\n保存結果: 追加{result['added']}件, 更新{result['updated']}件")
+        print(
+            f"\n保存結果: 追加{result['added']}件, 更新{result['updated']}件, "
+            f"変更なし{result['unchanged']}件"
+        )
 
     print("\n定期スクレイピング完了!")
     return all_results
 
 
+async def main():
+    """エントリーポイント（終了時に共有リソースを閉じる）"""
+    try:
+        return await run_scheduled_scrape()
+    finally:
+        await shutdown_scrapers()
+
+
 if __name__ == "__main__":
-    asyncio.run(run_scheduled_scrape())
+    asyncio.run(main())
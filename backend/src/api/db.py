@@ -1,109 +1,55 @@
 """Database operations for jobs"""
 
-from datetime import datetime
+import asyncio
+import base64
+import json
+from datetime import datetime, timedelta
 from typing import Optional
 
+from src.db.job_repository import get_job_repository
+from src.db.executor import run_db
+from src.db.job_writer import save_job_records
 from src.db.supabase_client import get_supabase_client
+from src.models.errors import DatabaseTimeoutError
+from src.models.job_batch import COLUMNS, JobColumns
+from src.models.job_codec import db_records_to_jobs
+from src.utils.ttl_cache import TTLCache
 
+# 一覧の並び順（キーセットページングのキー）
+JOB_PAGE_KEYS = ("scraped_at", "job_id")
 
-def job_to_db_record(job: dict) -> dict:
-    """案件データをDBレコード形式に変換"""
-    client = job.get("client") or {}
-    return {
-        "job_id": job.get("job_id"),
-        "title": job.get("title", ""),
-        "description": job.get("description", ""),
-        "category": job.get("category", "other"),
-        "subcategory": job.get("subcategory"),
-        "budget_type": job.get("budget_type", "unknown"),
-        "job_type": job.get("job_type", "project"),
-        "status": job.get("status", "open"),
-        "budget_min": job.get("budget_min"),
-        "budget_max": job.get("budget_max"),
-        "deadline": job.get("deadline"),
-        "remaining_days": job.get("remaining_days"),
-        "required_skills": job.get("required_skills", []),
-        "tags": job.get("tags", []),
-        "feature_tags": job.get("feature_tags", []),
-        "proposal_count": job.get("proposal_count"),
-        "recruitment_count": job.get("recruitment_count"),
-        "source": job.get("source", "lancers"),
-        "url": job.get("url", ""),
-        "client_name": client.get("name") if isinstance(client, dict) else job.get("client_name"),
-        "client_rating": client.get("rating") if isinstance(client, dict) else job.get("client_rating"),
-        "client_review_count": client.get("review_count") if isinstance(client, dict) else job.get("client_review_count"),
-        "client_order_history": client.get("order_history") if isinstance(client, dict) else job.get("client_order_history"),
-        "scraped_at": job.get("scraped_at", datetime.now().isoformat()),
-    }
+# 統計に常に含めるカテゴリ（件数0でも返す）
+STATS_CATEGORIES = ["system", "web", "writing", "design", "multimedia", "business", "translation"]
 
+# 統計のキャッシュ期間（秒）。API からの保存・削除時は破棄する
+STATS_CACHE_TTL = 60.0
 
-def db_record_to_job(record: dict) -> dict:
-    """DBレコードを案件データ形式に変換"""
-    return {
-        "job_id": record.get("job_id"),
-        "title": record.get("title", ""),
-        "description": record.get("description", ""),
-        "category": record.get("category", "other"),
-        "subcategory": record.get("subcategory"),
-        "budget_type": record.get("budget_type", "unknown"),
-        "job_type": record.get("job_type", "project"),
-        "status": record.get("status", "open"),
-        "budget_min": record.get("budget_min"),
-        "budget_max": record.get("budget_max"),
-        "deadline": record.get("deadline"),
-        "remaining_days": record.get("remaining_days"),
-        "required_skills": record.get("required_skills", []),
-        "tags": record.get("tags", []),
-        "feature_tags": record.get("feature_tags", []),
-        "proposal_count": record.get("proposal_count"),
-        "recruitment_count": record.get("recruitment_count"),
-        "source": record.get("source", "lancers"),
-        "url": record.get("url", ""),
-        "client_name": record.get("client_name"),
-        "client_rating": record.get("client_rating"),
-        "client_review_count": record.get("client_review_count"),
-        "client_order_history": record.get("client_order_history"),
-        "scraped_at": record.get("scraped_at"),
-    }
+_stats_cache: TTLCache[str, dict] = TTLCache(STATS_CACHE_TTL, max_entries=4)
+
+
+def invalidate_job_caches(job_ids: Optional[list[str]] = None) -> None:
+    """案件の保存・削除後にキャッシュ（案件・統計）を破棄"""
+    get_job_repository().invalidate(job_ids)
+    _stats_cache.clear()
 
 
 async def save_to_database(jobs: list[dict]) -> dict:
-    """案件データをデータベースに保存（upsert）"""
+    """案件データをデータベースに保存（内容が変わった行のみ一括 upsert）"""
     if not jobs:
-        return {"success": True, "added": 0, "updated": 0}
+        return {"success": True, "added": 0, "updated": 0, "unchanged": 0}
 
     try:
         supabase = get_supabase_client()
-        records = [job_to_db_record(job) for job in jobs]
-
-        # 既存のjob_idを取得
-        job_ids = [r["job_id"] for r in records if r["job_id"]]
-        existing_result = supabase.table("jobs").select("job_id").in_("job_id", job_ids).execute()
-        existing_ids = {r["job_id"] for r in existing_result.data}
-
-        # 新規と更新を分類
-        new_records = [r for r in records if r["job_id"] not in existing_ids]
-        update_records = [r for r in records if r["job_id"] in existing_ids]
-
-        added_count = 0
-        updated_count = 0
-
-        # 新規追加
-        if new_records:
-            supabase.table("jobs").insert(new_records).execute()
-            added_count = len(new_records)
-
-        # 更新（upsert）
-        if update_records:
-            for record in update_records:
-                supabase.table("jobs").upsert(record, on_conflict="job_id").execute()
-            updated_count = len(update_records)
-
-        return {"success": True, "added": added_count, "updated": updated_count}
+        batch = JobColumns.from_records(jobs)
+        result = await save_job_records(supabase, batch.to_rows())
+        invalidate_job_caches(batch["job_id"])
+        return {"success": True, **result}
 
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"データベース保存エラー: {e}")
-        return {"success": False, "error": str(e), "added": 0, "updated": 0}
+        return {"success": False, "error": str(e), "added": 0, "updated": 0, "unchanged": 0}
 
 
 async def fetch_from_database(
@@ -123,21 +69,212 @@ async def fetch_from_database(
             query = query.in_("job_type", job_types)
 
         query = query.order("scraped_at", desc=True).limit(limit)
-        result = query.execute()
+        result = await run_db(query.execute)
 
-        return [db_record_to_job(record) for record in result.data]
+        return db_records_to_jobs(result.data or [])
 
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"データベース取得エラー: {e}")
         return []
 
 
+def encode_job_cursor(job: dict) -> str:
+    """一覧の最後の案件から次ページのカーソルを作る"""
+    payload = json.dumps([job["scraped_at"], job["job_id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_job_cursor(cursor: str) -> tuple[str, str]:
+    """カーソルを (scraped_at, job_id) に戻す
+
+    Raises:
+        ValueError: 不正なカーソル
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        scraped_at, job_id = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception as e:
+        raise ValueError(f"不正なカーソルです: {cursor}") from e
+    if not isinstance(scraped_at, str) or not isinstance(job_id, str):
+        raise ValueError(f"不正なカーソルです: {cursor}")
+    return scraped_at, job_id
+
+
+def parse_job_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """fields パラメータ（カンマ区切り）を取得カラムに変換（ページングのキーは必ず含める）
+
+    Raises:
+        ValueError: 存在しないカラム
+    """
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in COLUMNS]
+    if unknown:
+        raise ValueError(f"不明なフィールド: {', '.join(unknown)}")
+    return list(dict.fromkeys([*requested, *JOB_PAGE_KEYS]))
+
+
+def _quote(value: str) -> str:
+    """PostgREST の論理演算子内の値をクォート"""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _filter_jobs(
+    query,
+    category: Optional[str] = None,
+    job_types: Optional[list[str]] = None,
+    min_budget: Optional[int] = None,
+    max_budget: Optional[int] = None,
+    min_remaining_days: Optional[int] = None,
+    skills: Optional[list[str]] = None,
+):
+    """案件一覧の絞り込み条件をクエリに付ける"""
+    if category:
+        query = query.eq("category", category)
+    if job_types:
+        query = query.in_("job_type", job_types)
+    if min_budget is not None:
+        query = query.gte("budget_max", min_budget)
+    if max_budget is not None:
+        query = query.lte("budget_min", max_budget)
+    if min_remaining_days is not None:
+        query = query.gte("remaining_days", min_remaining_days)
+    if skills:
+        # required_skills は JSONB のため JSON 配列で包含を判定する
+        query = query.filter("required_skills", "cs", json.dumps(skills, ensure_ascii=False))
+    return query
+
+
+async def fetch_job_page(
+    category: Optional[str] = None,
+    job_types: Optional[list[str]] = None,
+    limit: int = 30,
+    cursor: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    min_budget: Optional[int] = None,
+    max_budget: Optional[int] = None,
+    min_remaining_days: Optional[int] = None,
+    skills: Optional[list[str]] = None,
+    with_total: bool = False,
+) -> dict:
+    """案件一覧を1ページ取得（(scraped_at, job_id) の降順のキーセットページング）
+
+    OFFSET を使わず、前ページの最後の案件より後の行を索引
+    （idx_jobs_scraped_at_job_id）から読むため、何ページ目でも同じ速さで取得できる。
+
+    Args:
+        cursor: 前ページの next_cursor（None なら先頭から）
+        fields: 取得するカラム（None なら全カラム、parse_job_fields で作る）
+        min_budget: 予算上限がこの金額以上の案件
+        max_budget: 予算下限がこの金額以下の案件
+        min_remaining_days: 残り日数がこの日数以上の案件
+        skills: 必要スキルにすべて含まれるスキル
+        with_total: 条件に一致する全件数も数える（cursor に関係なく全体の件数）
+
+    Returns:
+        jobs・count（このページの件数）・next_cursor（最後のページなら None）、
+        with_total 指定時は total
+
+    Raises:
+        ValueError: 不正なカーソル
+    """
+    filters = {
+        "category": category,
+        "job_types": job_types,
+        "min_budget": min_budget,
+        "max_budget": max_budget,
+        "min_remaining_days": min_remaining_days,
+        "skills": skills,
+    }
+    supabase = get_supabase_client()
+    query = _filter_jobs(supabase.table("jobs").select(",".join(fields) if fields else "*"), **filters)
+
+    if cursor:
+        scraped_at, job_id = decode_job_cursor(cursor)
+        query = query.or_(
+            f"scraped_at.lt.{_quote(scraped_at)},"
+            f"and(scraped_at.eq.{_quote(scraped_at)},job_id.lt.{_quote(job_id)})"
+        )
+
+    # 1件多く取得して次ページの有無を判定する
+    query = query.order("scraped_at", desc=True).order("job_id", desc=True).limit(limit + 1)
+
+    if with_total:
+        count_query = _filter_jobs(
+            supabase.table("jobs").select("job_id", count="exact", head=True), **filters
+        )
+        result, count_result = await asyncio.gather(
+            run_db(query.execute), run_db(count_query.execute)
+        )
+    else:
+        result, count_result = await run_db(query.execute), None
+    rows = result.data or []
+
+    has_more = len(rows) > limit
+    jobs = db_records_to_jobs(rows[:limit], fields)
+
+    page = {
+        "jobs": jobs,
+        "count": len(jobs),
+        "next_cursor": encode_job_cursor(jobs[-1]) if has_more and jobs else None,
+    }
+    if count_result is not None:
+        page["total"] = count_result.count or 0
+    return page
+
+
+async def fetch_job_record(job_id: str) -> Optional[dict]:
+    """保存済みの案件を1件取得（一覧で省いた説明文等の取得用）"""
+    return await run_db(get_job_repository().get_by_id, job_id)
+
+
+async def fetch_job_stats() -> dict:
+    """案件数の統計（今日・今週・全体・カテゴリ別）
+
+    job_stats 関数（RPC）で1回の集計クエリにまとめて取得し、短時間キャッシュする。
+    今週は月曜0時（サーバーのローカル時刻）から数える。
+    """
+    now = datetime.now().astimezone()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_start = today_start - timedelta(days=today_start.weekday())
+
+    cache_key = today_start.isoformat()
+    stats = _stats_cache.get(cache_key)
+    if stats is not None:
+        return stats
+
+    supabase = get_supabase_client()
+    query = supabase.rpc(
+        "job_stats",
+        {"today_start": today_start.isoformat(), "week_start": week_start.isoformat()},
+    )
+    result = await run_db(query.execute)
+    data = result.data or {}
+
+    by_category = dict.fromkeys(STATS_CATEGORIES, 0)
+    by_category.update(data.get("by_category") or {})
+    stats = {
+        "today": data.get("today", 0),
+        "this_week": data.get("this_week", 0),
+        "total": data.get("total", 0),
+        "by_category": by_category,
+    }
+    _stats_cache.set(cache_key, stats)
+    return stats
+
+
 async def clear_database() -> dict:
     """データベースの全データを削除"""
     try:
         supabase = get_supabase_client()
-        supabase.table("jobs").delete().neq("job_id", "").execute()
+        await run_db(supabase.table("jobs").delete().neq("job_id", "").execute)
+        invalidate_job_caches()
         return {"success": True}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"データベースクリアエラー: {e}")
         return {"success": False, "error": str(e)}
@@ -149,13 +286,14 @@ async def cleanup_expired_jobs() -> dict:
         supabase = get_supabase_client()
 
         # remaining_days <= 0 または status = 'closed' の案件を削除
-        result1 = supabase.table("jobs").delete().lte("remaining_days", 0).execute()
+        result1 = await run_db(supabase.table("jobs").delete().lte("remaining_days", 0).execute)
         deleted_by_days = len(result1.data) if result1.data else 0
 
-        result2 = supabase.table("jobs").delete().eq("status", "closed").execute()
+        result2 = await run_db(supabase.table("jobs").delete().eq("status", "closed").execute)
         deleted_by_status = len(result2.data) if result2.data else 0
 
         total_deleted = deleted_by_days + deleted_by_status
+        invalidate_job_caches()
         print(f"期限切れ案件削除完了: {total_deleted}件")
 
         return {
@@ -164,6 +302,8 @@ async def cleanup_expired_jobs() -> dict:
             "deleted_by_remaining_days": deleted_by_days,
             "deleted_by_status": deleted_by_status,
         }
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"期限切れ削除エラー: {e}")
         return {"success": False, "error": str(e), "deleted": 0}
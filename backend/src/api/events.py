@@ -0,0 +1,84 @@
+"""スクレイピングイベントの配信
+
+スクレイピング中のコルーチンから publish されたイベントを、SSE で接続中の
+全購読者に配る。購読者ごとのバッファは上限付きで、読み出しが遅い購読者は
+古いイベントから捨てられる（捨てた件数は lagged イベントで通知し、SSE では続けて
+全ジョブの状態を snapshot で送り直す）。
+"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Generator, Optional
+
+# 購読者ごとのバッファ上限
+DEFAULT_SUBSCRIBER_BUFFER = 256
+
+
+class Subscriber:
+    """イベントの購読者"""
+
+    def __init__(self, maxsize: int, job_id: Optional[str] = None) -> None:
+        self.job_id = job_id
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def offer(self, event: dict) -> None:
+        """イベントを追加（満杯なら最も古いイベントを捨てる）"""
+        if self.job_id and event["data"].get("job_id") not in (None, self.job_id):
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        """次のイベントを取得（timeout 秒以内になければ None）"""
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            return {"type": "lagged", "data": {"dropped": dropped}}
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroadcaster:
+    """プロセス内のイベント配信チャネル"""
+
+    def __init__(self, buffer_size: int = DEFAULT_SUBSCRIBER_BUFFER) -> None:
+        self.buffer_size = buffer_size
+        self._subscribers: set[Subscriber] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type: str, data: dict) -> None:
+        """全購読者にイベントを配る（待機しない）"""
+        if not self._subscribers:
+            return
+        event = {"type": event_type, "data": data}
+        for subscriber in list(self._subscribers):
+            subscriber.offer(event)
+
+    @contextmanager
+    def subscribe(self, job_id: Optional[str] = None) -> Generator[Subscriber, None, None]:
+        """購読を開始（job_id を指定するとそのジョブのイベントのみ受け取る）"""
+        subscriber = Subscriber(self.buffer_size, job_id)
+        self._subscribers.add(subscriber)
+        try:
+            yield subscriber
+        finally:
+            self._subscribers.discard(subscriber)
+
+
+_broadcaster: Optional[EventBroadcaster] = None
+
+
+def get_event_broadcaster() -> EventBroadcaster:
+    """共有イベントチャネルを取得"""
+    global _broadcaster
+
+    if _broadcaster is None:
+        _broadcaster = EventBroadcaster()
+    return _broadcaster
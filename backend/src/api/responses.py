@@ -0,0 +1,18 @@
+"""API レスポンス"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from src.models.job_codec import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """job_codec.dumps（orjson があれば orjson）でエンコードする JSON レスポンス
+
+    件数の多い案件一覧向け。FastAPI の jsonable_encoder を通さずにエンコードするため、
+    dict 化済みのデータをそのまま返すルートで使う。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
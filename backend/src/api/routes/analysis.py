@@ -10,6 +10,9 @@ from src.api.db import fetch_from_database
 from src.api.routes.profile import load_user_profile
 from src.analyzer.job_priority import JobPriorityAnalyzer, UserProfile as AnalyzerUserProfile
 from src.db import get_supabase_client
+from src.db.executor import run_db
+from src.db.job_repository import get_job_repository
+from src.models.errors import DatabaseTimeoutError
 
 router = APIRouter(prefix="/api/jobs", tags=["analysis"])
 
@@ -117,7 +120,7 @@ class ScoreJobsRequestModel(BaseModel):
 @router.post("/analyze-priority")
 async def analyze_job_priority(request: AnalyzePriorityRequest):
     """案件の優先度を分析"""
-    profile_data = load_user_profile()
+    profile_data = await run_db(load_user_profile)
 
     analyzer_profile = AnalyzerUserProfile(
         name=profile_data.get("name", ""),
@@ -160,7 +163,7 @@ async def analyze_job_priority(request: AnalyzePriorityRequest):
 @router.get("/analyze-all-priorities")
 async def analyze_all_priorities():
     """全案件の優先度を分析"""
-    profile_data = load_user_profile()
+    profile_data = await run_db(load_user_profile)
 
     analyzer_profile = AnalyzerUserProfile(
         name=profile_data.get("name", ""),
@@ -193,14 +196,14 @@ async def analyze_all_priorities():
 @router.get("/ai-scores")
 async def get_all_ai_scores():
     """保存済みの全AIスコアを取得"""
-    scores = get_all_ai_scores_from_supabase()
+    scores = await run_db(get_all_ai_scores_from_supabase)
     return {"success": True, "scores": scores}
 
 
 @router.get("/ai-score/{job_id}")
 async def get_ai_score(job_id: str):
     """保存済みのAIスコアを取得"""
-    score = get_ai_score_from_supabase(job_id)
+    score = await run_db(get_ai_score_from_supabase, job_id)
     if score:
         return {"success": True, "job_id": job_id, "score": score}
     return {"success": False, "job_id": job_id, "error": "スコアが見つかりません"}
@@ -212,14 +215,8 @@ async def score_job(request: ScoreJobRequestModel):
     from src.agents import JobScoringAgent
     from src.agents.models import JobScoringInput
 
-    user_profile = load_user_profile()
-    all_jobs = await fetch_from_database()
-
-    target_job = None
-    for job in all_jobs:
-        if job.get("job_id") == request.job_id or job.get("url", "").endswith(request.job_id):
-            target_job = job
-            break
+    user_profile = await run_db(load_user_profile)
+    target_job = await run_db(get_job_repository().find, request.job_id)
 
     if not target_job:
         raise HTTPException(status_code=404, detail=f"案件が見つかりません: {request.job_id}")
@@ -232,7 +229,7 @@ async def score_job(request: ScoreJobRequestModel):
         if result.success:
             score_dict = result.data.to_dict()
             # Supabaseに保存
-            save_ai_score_to_supabase(request.job_id, score_dict)
+            await run_db(save_ai_score_to_supabase, request.job_id, score_dict)
 
             return {
                 "success": True,
@@ -248,6 +245,8 @@ async def score_job(request: ScoreJobRequestModel):
 
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"スコアリングエラー: {str(e)}")
 
@@ -258,14 +257,8 @@ async def score_jobs_batch(request: ScoreJobsRequestModel):
     from src.agents import JobScoringAgent
     from src.agents.models import JobScoringInput
 
-    user_profile = load_user_profile()
-    all_jobs = await fetch_from_database()
-
-    job_id_set = set(request.job_ids)
-    target_jobs = [
-        job for job in all_jobs
-        if job.get("job_id") in job_id_set
-    ]
+    user_profile = await run_db(load_user_profile)
+    target_jobs = await run_db(get_job_repository().get_many, request.job_ids)
 
     if not target_jobs:
         raise HTTPException(status_code=404, detail="指定された案件が見つかりません")
@@ -282,7 +275,7 @@ async def score_jobs_batch(request: ScoreJobsRequestModel):
             if result.success:
                 score_dict = result.data.to_dict()
                 # Supabaseに保存
-                save_ai_score_to_supabase(job_id, score_dict)
+                await run_db(save_ai_score_to_supabase, job_id, score_dict)
 
                 results.append({
                     "job_id": job_id,
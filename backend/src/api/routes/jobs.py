@@ -4,12 +4,17 @@ from typing import Optional
 
 from fastapi import APIRouter, Query, HTTPException
 
-from src.api.db import fetch_from_database
-from src.scrapers.lancers import LancersScraper
+from src.api.db import fetch_job_page, fetch_job_record, parse_job_fields
+from src.api.responses import FastJSONResponse
+from src.models.errors import DatabaseTimeoutError
+from src.scrapers.lancers import LancersHttpScraper
 from src.models.config import ScrapingConfig, HumanLikeConfig, TimeoutConfig
 
 router = APIRouter(prefix="/api", tags=["jobs"])
 
+# 1ページの最大件数（limit 省略時の max_pages × 30 はこれを超えてもよい）
+JOBS_PAGE_MAX_LIMIT = 200
+
 
 @router.get("/")
 async def root():
@@ -37,13 +42,17 @@ async def get_job_types():
 
 @router.get("/jobs/{job_id}/detail")
 async def fetch_job_detail(job_id: str):
-    """案件の詳細をスクレイピング"""
+    """案件の詳細をスクレイピング
+
+    HTTP で取得し、期限切れのキャッシュは ETag / Last-Modified で再検証する
+    （ブロックされた場合のみブラウザで取得）。
+    """
     config = ScrapingConfig(
         headless=True,
         human_like=HumanLikeConfig(enabled=True),
         timeout=TimeoutConfig(page_load=30000, element_wait=10000),
     )
-    scraper = LancersScraper(config)
+    scraper = LancersHttpScraper(config)
 
     try:
         url = f"https://www.lancers.jp/work/detail/{job_id}"
@@ -60,19 +69,59 @@ async def fetch_job_detail(job_id: str):
         raise HTTPException(status_code=500, detail=f"詳細取得エラー: {str(e)}")
 
 
-@router.get("/jobs")
+@router.get("/jobs/{job_id}/record")
+async def get_job_record(job_id: str):
+    """保存済みの案件を取得（一覧で省いた説明文等を表示時に読む）"""
+    job = await fetch_job_record(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"案件が見つかりません: {job_id}")
+    return job
+
+
+@router.get("/jobs", response_class=FastJSONResponse)
 async def fetch_jobs(
     category: Optional[str] = Query(default=None),
     job_types: str = Query(default="project"),
     max_pages: int = Query(default=3, ge=1, le=100),
+    limit: Optional[int] = Query(default=None, ge=1, le=JOBS_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(default=None),
+    fields: Optional[str] = Query(default=None),
+    min_budget: Optional[int] = Query(default=None, ge=0),
+    max_budget: Optional[int] = Query(default=None, ge=0),
+    min_remaining_days: Optional[int] = Query(default=None),
+    skills: Optional[str] = Query(default=None),
+    with_total: bool = Query(default=False),
 ):
-    """データベースから案件一覧を取得"""
+    """データベースから案件一覧を取得
+
+    新しい順のキーセットページング。次のページは next_cursor を cursor に渡して取得する。
+    limit 省略時は従来どおり max_pages × 30件を1ページとして返す。
+    fields（カンマ区切り）で取得カラムを絞れる（一覧表示では description を外す等）。
+    count はこのページの件数。条件に一致する全件数は with_total=true で total に返す。
+    """
     job_type_list = [jt.strip() for jt in job_types.split(",") if jt.strip()]
+    skill_list = [s.strip() for s in skills.split(",") if s.strip()] if skills else None
 
-    jobs = await fetch_from_database(
-        category=category,
-        job_types=job_type_list if job_type_list else None,
-        limit=max_pages * 30,
-    )
+    try:
+        field_list = parse_job_fields(fields)
+        page = await fetch_job_page(
+            category=category,
+            job_types=job_type_list if job_type_list else None,
+            limit=limit or max_pages * 30,
+            cursor=cursor,
+            fields=field_list,
+            min_budget=min_budget,
+            max_budget=max_budget,
+            min_remaining_days=min_remaining_days,
+            skills=skill_list,
+            with_total=with_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DatabaseTimeoutError:
+        raise
+    except Exception as e:
+        print(f"データベース取得エラー: {e}")
+        raise HTTPException(status_code=500, detail=f"案件一覧の取得エラー: {str(e)}")
 
-    return {"jobs": jobs, "total": len(jobs)}
+    return FastJSONResponse(page)
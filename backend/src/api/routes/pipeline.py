@@ -7,6 +7,8 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from src.db import get_supabase_client
+from src.db.executor import run_db
+from src.models.errors import DatabaseTimeoutError
 
 router = APIRouter(prefix="/api/pipeline", tags=["pipeline"])
 
@@ -37,8 +39,10 @@ async def get_all_pipeline_jobs():
     """全パイプラインジョブを取得"""
     try:
         supabase = get_supabase_client()
-        response = supabase.table("pipeline_jobs").select("*").order("added_at", desc=True).execute()
+        response = await run_db(supabase.table("pipeline_jobs").select("*").order("added_at", desc=True).execute)
         return {"success": True, "jobs": response.data or []}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"パイプラインジョブ取得エラー: {e}")
         raise HTTPException(status_code=500, detail=f"取得エラー: {str(e)}")
@@ -52,14 +56,16 @@ async def get_pipeline_jobs_by_status(status: str):
 
     try:
         supabase = get_supabase_client()
-        response = (
+        response = await run_db(
             supabase.table("pipeline_jobs")
             .select("*")
             .eq("pipeline_status", status)
             .order("added_at", desc=True)
-            .execute()
+            .execute
         )
         return {"success": True, "jobs": response.data or []}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"パイプラインジョブ取得エラー: {e}")
         raise HTTPException(status_code=500, detail=f"取得エラー: {str(e)}")
@@ -70,13 +76,15 @@ async def get_pipeline_job(job_id: str):
     """特定のジョブIDのパイプライン情報を取得"""
     try:
         supabase = get_supabase_client()
-        response = (
+        response = await run_db(
             supabase.table("pipeline_jobs")
             .select("*")
             .eq("job_id", job_id)
-            .execute()
+            .execute
         )
         return {"success": True, "jobs": response.data or []}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"パイプラインジョブ取得エラー: {e}")
         raise HTTPException(status_code=500, detail=f"取得エラー: {str(e)}")
@@ -92,12 +100,12 @@ async def add_pipeline_job(job: PipelineJobCreate):
         supabase = get_supabase_client()
 
         # 既に同じジョブが同じステータスで存在するか確認
-        existing = (
+        existing = await run_db(
             supabase.table("pipeline_jobs")
             .select("id")
             .eq("job_id", job.job_id)
             .eq("pipeline_status", job.pipeline_status)
-            .execute()
+            .execute
         )
 
         if existing.data and len(existing.data) > 0:
@@ -112,13 +120,15 @@ async def add_pipeline_job(job: PipelineJobCreate):
             "added_at": now,
             "status_changed_at": now,
         }
-        response = supabase.table("pipeline_jobs").insert(data).execute()
+        response = await run_db(supabase.table("pipeline_jobs").insert(data).execute)
 
         return {
             "success": True,
             "message": "追加しました",
             "id": response.data[0]["id"] if response.data else None,
         }
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"パイプラインジョブ追加エラー: {e}")
         raise HTTPException(status_code=500, detail=f"追加エラー: {str(e)}")
@@ -143,14 +153,16 @@ async def update_pipeline_job(pipeline_id: str, update: PipelineJobUpdate):
         if not update_data:
             return {"success": True, "message": "更新項目がありません"}
 
-        response = (
+        response = await run_db(
             supabase.table("pipeline_jobs")
             .update(update_data)
             .eq("id", pipeline_id)
-            .execute()
+            .execute
         )
 
         return {"success": True, "message": "更新しました"}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"パイプラインジョブ更新エラー: {e}")
         raise HTTPException(status_code=500, detail=f"更新エラー: {str(e)}")
@@ -167,11 +179,11 @@ async def change_job_status(job_id: str, status_change: PipelineStatusChange):
         supabase = get_supabase_client()
 
         # 現在のパイプラインエントリを取得
-        current = (
+        current = await run_db(
             supabase.table("pipeline_jobs")
             .select("*")
             .eq("job_id", job_id)
-            .execute()
+            .execute
         )
 
         if not current.data:
@@ -190,7 +202,7 @@ async def change_job_status(job_id: str, status_change: PipelineStatusChange):
         now = datetime.utcnow().isoformat()
 
         # 古いエントリを削除
-        supabase.table("pipeline_jobs").delete().eq("id", old_entry["id"]).execute()
+        await run_db(supabase.table("pipeline_jobs").delete().eq("id", old_entry["id"]).execute)
 
         # 新しいエントリを作成
         new_data = {
@@ -200,11 +212,13 @@ async def change_job_status(job_id: str, status_change: PipelineStatusChange):
             "added_at": old_entry.get("added_at", now),
             "status_changed_at": now,
         }
-        supabase.table("pipeline_jobs").insert(new_data).execute()
+        await run_db(supabase.table("pipeline_jobs").insert(new_data).execute)
 
         return {"success": True, "message": f"ステータスを{new_status}に変更しました"}
     except HTTPException:
         raise
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"ステータス変更エラー: {e}")
         raise HTTPException(status_code=500, detail=f"変更エラー: {str(e)}")
@@ -215,8 +229,10 @@ async def delete_pipeline_job(pipeline_id: str):
     """パイプラインからジョブを削除"""
     try:
         supabase = get_supabase_client()
-        supabase.table("pipeline_jobs").delete().eq("id", pipeline_id).execute()
+        await run_db(supabase.table("pipeline_jobs").delete().eq("id", pipeline_id).execute)
         return {"success": True, "message": "削除しました"}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"パイプラインジョブ削除エラー: {e}")
         raise HTTPException(status_code=500, detail=f"削除エラー: {str(e)}")
@@ -227,8 +243,10 @@ async def delete_job_from_pipeline(job_id: str):
     """特定のジョブIDを全パイプラインから削除"""
     try:
         supabase = get_supabase_client()
-        supabase.table("pipeline_jobs").delete().eq("job_id", job_id).execute()
+        await run_db(supabase.table("pipeline_jobs").delete().eq("job_id", job_id).execute)
         return {"success": True, "message": "削除しました"}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"パイプラインジョブ削除エラー: {e}")
         raise HTTPException(status_code=500, detail=f"削除エラー: {str(e)}")
@@ -239,7 +257,7 @@ async def get_pipeline_summary():
     """パイプラインサマリーを取得"""
     try:
         supabase = get_supabase_client()
-        response = supabase.table("pipeline_jobs").select("pipeline_status").execute()
+        response = await run_db(supabase.table("pipeline_jobs").select("pipeline_status").execute)
 
         summary = {status: 0 for status in VALID_STATUSES}
         for job in response.data or []:
@@ -248,6 +266,8 @@ async def get_pipeline_summary():
                 summary[status] += 1
 
         return {"success": True, "summary": summary}
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"サマリー取得エラー: {e}")
         raise HTTPException(status_code=500, detail=f"取得エラー: {str(e)}")
@@ -7,10 +7,10 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import google.generativeai as genai
 
 from src.config.models import RECOMMENDED
 from src.db import get_supabase_client
+from src.db.executor import run_db
 
 router = APIRouter(prefix="/api/profile", tags=["profile"])
 
@@ -162,14 +162,14 @@ def save_user_profile(profile: dict) -> bool:
 @router.get("")
 async def get_profile():
     """プロフィールを取得"""
-    return load_user_profile()
+    return await run_db(load_user_profile)
 
 
 @router.post("")
 async def update_profile(profile: UserProfileModel):
     """プロフィールを更新"""
     profile_dict = profile.model_dump()
-    if save_user_profile(profile_dict):
+    if await run_db(save_user_profile, profile_dict):
         return {"success": True, "message": "プロフィールを保存しました"}
     else:
         raise HTTPException(status_code=500, detail="プロフィールの保存に失敗しました")
@@ -178,7 +178,9 @@ async def update_profile(profile: UserProfileModel):
 @router.post("/auto-complete")
 async def auto_complete_profile():
     """自己紹介文からプロフィールを自動補完"""
-    profile = load_user_profile()
+    import google.generativeai as genai
+
+    profile = await run_db(load_user_profile)
     bio = profile.get("bio", "")
 
     if not bio or len(bio) < 20:
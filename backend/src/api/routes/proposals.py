@@ -6,9 +6,11 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from src.api.db import fetch_from_database
 from src.api.routes.profile import load_user_profile
 from src.db import get_supabase_client
+from src.db.executor import run_db
+from src.db.job_repository import get_job_repository
+from src.models.errors import DatabaseTimeoutError
 
 router = APIRouter(prefix="/api/proposals", tags=["proposals"])
 
@@ -87,21 +89,21 @@ def get_latest_proposal_for_job(job_id: str) -> Optional[dict]:
 @router.get("")
 async def get_all_proposals():
     """保存済みの全提案文を取得"""
-    proposals = get_proposals_from_supabase()
+    proposals = await run_db(get_proposals_from_supabase)
     return {"success": True, "proposals": proposals}
 
 
 @router.get("/job/{job_id}")
 async def get_proposals_for_job(job_id: str):
     """特定ジョブの提案文を取得"""
-    proposals = get_proposals_from_supabase(job_id)
+    proposals = await run_db(get_proposals_from_supabase, job_id)
     return {"success": True, "proposals": proposals}
 
 
 @router.get("/job/{job_id}/latest")
 async def get_latest_proposal(job_id: str):
     """特定ジョブの最新の提案文を取得"""
-    proposal = get_latest_proposal_for_job(job_id)
+    proposal = await run_db(get_latest_proposal_for_job, job_id)
     if proposal:
         return {"success": True, "proposal": proposal}
     return {"success": False, "error": "提案文が見つかりません"}
@@ -112,14 +114,8 @@ async def generate_proposal(request: GenerateProposalRequestModel):
     """提案文を自動生成（マルチエージェントシステム）"""
     from src.agents import BossAgent
 
-    user_profile = load_user_profile()
-    all_jobs = await fetch_from_database()
-
-    target_job = None
-    for job in all_jobs:
-        if job.get("job_id") == request.job_id or job.get("url", "").endswith(request.job_id):
-            target_job = job
-            break
+    user_profile = await run_db(load_user_profile)
+    target_job = await run_db(get_job_repository().find, request.job_id)
 
     if not target_job:
         raise HTTPException(status_code=404, detail=f"案件が見つかりません: {request.job_id}")
@@ -138,7 +134,8 @@ async def generate_proposal(request: GenerateProposalRequestModel):
         if result_dict.get("success"):
             proposal_text = result_dict.get("proposal", "")
             quality_score = result_dict.get("metadata", {}).get("quality_score", 0)
-            save_proposal_to_supabase(
+            await run_db(
+                save_proposal_to_supabase,
                 job_id=request.job_id,
                 job_title=target_job.get("title", ""),
                 proposal_text=proposal_text,
@@ -150,6 +147,8 @@ async def generate_proposal(request: GenerateProposalRequestModel):
 
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"提案文生成エラー: {str(e)}")
 
@@ -1,51 +1,48 @@
 """Scraper API routes"""
 
+import asyncio
 import json
-from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from src.api.db import save_to_database, clear_database, cleanup_expired_jobs
+from src.api.db import save_to_database, clear_database, cleanup_expired_jobs, fetch_job_stats
+from src.api.events import get_event_broadcaster
+from src.api.scrape_jobs import (
+    JOB_CANCELLED,
+    JOB_DONE,
+    JOB_ERROR,
+    ScrapeJob,
+    get_scrape_job_manager,
+)
+from src.scrapers.browser_pool import current_browser_pool
 from src.scrapers.lancers import LancersScraper
+from src.scrapers.lancers.constants import SEARCH_PAGE_SIZE
+from src.scrapers.page_window import PageWindow
+from src.scrapers.retry import RETRYABLE_ERRORS, classify_error
+from src.scrapers.throttle import limiter_stats
+from src.scrapers.work_queue import (
+    RUN_CANCELLED,
+    RUN_DONE,
+    RUN_ERROR,
+    HEARTBEAT_INTERVAL,
+    UNIT_DETAIL,
+    UNIT_PAGE,
+    WorkQueue,
+    WorkUnit,
+    get_work_queue,
+)
 from src.models.config import ScrapingConfig, HumanLikeConfig, TimeoutConfig
-from src.db.supabase_client import get_supabase_client
+from src.models.errors import DatabaseTimeoutError
+from src.models.job_codec import dumps
 
 router = APIRouter(prefix="/api/scraper", tags=["scraper"])
 
 
-# =============================================================================
-# Scraper State
-# =============================================================================
-
-@dataclass
-class ScraperState:
-    """スクレイパーの状態を管理"""
-    is_running: bool = False
-    current_page: int = 0
-    total_pages: int = 0
-    jobs_fetched: int = 0
-    estimated_total: int = 0
-    started_at: Optional[datetime] = None
-    category: Optional[str] = None
-    error: Optional[str] = None
-    cancelled: bool = False
-    phase: str = "idle"  # idle, fetching, saving, done
-    message: str = ""
-    current_category_index: int = 0
-    total_categories: int = 0
-    detail_current: int = 0
-    detail_total: int = 0
-
-
-# Global state
-scraper_state = ScraperState()
-scraper_history: list[dict] = []
-
-
 # =============================================================================
 # Request Models
 # =============================================================================
@@ -71,21 +68,250 @@ def parse_category_selection(selection: str) -> tuple[str, Optional[str]]:
     return (selection, None)
 
 
-async def run_scraper_task(request: ScraperStartRequest):
-    """バックグラウンドでスクレイピングを実行"""
-    global scraper_state, scraper_history
-
-    # カテゴリ選択をパース
+def parse_selections(categories: list[str]) -> list[tuple[Optional[str], Optional[str], str]]:
+    """リクエストのカテゴリ一覧を (category, subcategory, 表示名) に変換"""
     selections = []
-    for cat_str in request.categories:
+    for cat_str in categories:
         category, subcategory = parse_category_selection(cat_str)
         selections.append((category, subcategory, cat_str))
 
     if not selections:
         selections = [(None, None, "all")]
+    return selections
+
+
+def to_api_job(job: dict, category: Optional[str]) -> dict:
+    """一覧の案件dictを保存形式に合わせる（category は Lancersの検索カテゴリ）"""
+    job["subcategory"] = job.get("category")  # 自動分類サブカテゴリ
+    job["category"] = category or "other"
+    return job
+
+
+def scrape_config() -> ScrapingConfig:
+    """API からの実行で使うスクレイピング設定"""
+    return ScrapingConfig(
+        headless=True,
+        human_like=HumanLikeConfig(enabled=True),
+        timeout=TimeoutConfig(page_load=30000, element_wait=10000),
+    )
+
+
+def run_max_pages(request: ScraperStartRequest) -> int:
+    """カテゴリごとの最大ページ数（0 は全ページ）"""
+    return request.max_pages if request.max_pages > 0 else 100
+
+
+def page_window(
+    queue: WorkQueue,
+    run_id: str,
+    request: ScraperStartRequest,
+    config: ScrapingConfig,
+) -> PageWindow:
+    """実行の一覧ページ作業の先読み（pagination.window ページ先まで登録する）"""
+    return PageWindow(
+        queue,
+        run_id,
+        labels=[label for _, _, label in parse_selections(request.categories)],
+        max_pages=run_max_pages(request),
+        page_size=SEARCH_PAGE_SIZE,
+        window=config.pagination.window,
+        skip_pages=config.retry.skip_pages,
+    )
+
+
+async def save_unit_jobs(jobs: list[dict]) -> dict:
+    """作業単位の案件を保存（失敗時は例外にして作業を再試行させる）"""
+    save_result = await save_to_database(jobs)
+    if not save_result.get("success"):
+        raise RuntimeError(f"保存エラー: {save_result.get('error')}")
+    return save_result
+
+
+async def process_page_unit(
+    job: ScrapeJob,
+    unit: WorkUnit,
+    queue: WorkQueue,
+    scraper: LancersScraper,
+    request: ScraperStartRequest,
+    selections: list[tuple[Optional[str], Optional[str], str]],
+    window: PageWindow,
+) -> None:
+    """一覧ページ1件を取得（詳細取得する場合は詳細作業を登録し、後続ページを先読み登録）"""
+    progress = job.progress
+    sel_idx = unit.payload["selection"]
+    page = unit.payload["page"]
+    category, subcategory, display_label = selections[sel_idx]
+    category_label = display_label or "全カテゴリ"
+
+    progress.current_category_index = sel_idx + 1
+    progress.category = display_label
+    progress.current_page = sel_idx * window.max_pages + page
+    progress.message = f"{category_label} - {page}ページ目を取得中..."
+    job.publish_progress()
+
+    url = scraper.build_search_url(
+        category=category,
+        subcategory=subcategory,
+        job_types=request.job_types,
+        open_only=True,
+        page=page,
+    )
+    print(f"[{job.id[:8]}] 取得中: {url}")
+
+    jobs = [to_api_job(item, category) for item in await scraper.fetch_job_list(url)]
+    job.emit("listed", {"category": display_label, "page": page, "jobs": jobs})
+
+    saved = None
+    if request.fetch_details:
+        for item in jobs:
+            if item.get("job_id") and item.get("url"):
+                queue.enqueue(unit.run_id, UNIT_DETAIL, item["job_id"], item)
+    elif request.save_to_database and jobs:
+        saved = await save_unit_jobs(jobs)
+        job.emit("saved", {"job_ids": [item.get("job_id") for item in jobs], **saved})
+
+    if not jobs:
+        print(f"  → 0件（終了）")
+    else:
+        print(f"  → {len(jobs)}件取得")
+    # 完了にする前に後続ページを登録する（中断しても続きから再開できるように）
+    if window.page_done(sel_idx, page, len(jobs)) and jobs:
+        print(f"  → 最終ページ到達（{len(jobs)}件 < {SEARCH_PAGE_SIZE}）")
+
+    queue.complete(unit, {"jobs": jobs, "saved": saved})
+    progress.jobs_fetched += len(jobs)
+
+
+async def process_detail_unit(
+    job: ScrapeJob,
+    unit: WorkUnit,
+    queue: WorkQueue,
+    scraper: LancersScraper,
+    request: ScraperStartRequest,
+) -> None:
+    """案件詳細1件を取得して保存"""
+    progress = job.progress
+    item = unit.payload
+    progress.phase = "fetching"
+    progress.message = f"詳細取得中... ({progress.detail_current + 1}/{progress.detail_total})"
+    job.publish_progress()
+
+    detail = await scraper.fetch_job_detail(item["url"])
+    if detail:
+        item["description"] = detail.get("description", "")
+        item["required_skills"] = detail.get("required_skills", [])
+    job.emit("detailed", {"job": item})
+
+    saved = None
+    if request.save_to_database:
+        saved = await save_unit_jobs([item])
+        job.emit("saved", {"job_ids": [item.get("job_id")], **saved})
+
+    queue.complete(unit, {"job": item, "saved": saved})
+
+
+def collect_run_results(queue: WorkQueue, run_id: str) -> tuple[list[dict], int, int, int]:
+    """完了した作業の結果を集約
+
+    Returns:
+        (案件リスト, 新規件数, 更新件数, 変更なし件数)
+    """
+    # 先読みで完了順が前後するため、カテゴリ・ページ順に並べる
+    page_units = sorted(
+        (unit for unit in queue.units(run_id, UNIT_PAGE) if unit["status"] == "done"),
+        key=lambda unit: (unit["payload"]["selection"], unit["payload"]["page"]),
+    )
+    page_results = [unit["result"] for unit in page_units if unit["result"] is not None]
+    detail_results = queue.results(run_id, UNIT_DETAIL)
+
+    details = {result["job"]["job_id"]: result["job"] for result in detail_results}
+    all_results = [
+        details.get(item.get("job_id"), item)
+        for result in page_results
+        for item in result["jobs"]
+    ]
+
+    saved = [r["saved"] for r in page_results + detail_results if r.get("saved")]
+    added_count = sum(s.get("added", 0) for s in saved)
+    updated_count = sum(s.get("updated", 0) for s in saved)
+    unchanged_count = sum(s.get("unchanged", 0) for s in saved)
+    return all_results, added_count, updated_count, unchanged_count
+
+
+def update_detail_progress(job: ScrapeJob, queue: WorkQueue) -> None:
+    """詳細取得の進捗をキューの状態から反映"""
+    details = queue.progress(job.id).get(UNIT_DETAIL, {})
+    job.progress.detail_total = sum(details.values())
+    job.progress.detail_current = details.get("done", 0) + details.get("failed", 0)
+
+
+def create_scrape_run(request: ScraperStartRequest) -> str:
+    """作業キューに実行を登録（各カテゴリの先頭 pagination.window ページから開始）"""
+    queue = get_work_queue()
+    run_id = queue.create_run(request.model_dump())
+    page_window(queue, run_id, request, scrape_config()).start()
+    return run_id
+
+
+async def process_unit(
+    job: ScrapeJob,
+    unit: WorkUnit,
+    queue: WorkQueue,
+    scraper: LancersScraper,
+    request: ScraperStartRequest,
+    selections: list[tuple[Optional[str], Optional[str], str]],
+    window: PageWindow,
+) -> None:
+    """作業1件を処理（失敗時は再試行のためキューに戻すか、失敗として記録）"""
+    try:
+        if unit.kind == UNIT_PAGE:
+            await process_page_unit(job, unit, queue, scraper, request, selections, window)
+        else:
+            await process_detail_unit(job, unit, queue, scraper, request)
+    except Exception as e:
+        # スクレイパー内で再試行済みのため、再試行で直る失敗かつ予算が残る場合のみ戻す
+        retryable = (
+            classify_error(e) in RETRYABLE_ERRORS and scraper.retry_budget.remaining > 0
+        )
+        retry = queue.fail(
+            unit, str(e), max_attempts=scraper.config.retry.max_attempts if retryable else 0
+        )
+        print(f"作業エラー ({unit.kind} {unit.key}): {e}{' → 再試行します' if retry else ''}")
+
+        if unit.kind == UNIT_PAGE and not retry:
+            if window.page_failed(unit.payload["selection"], unit.payload["page"]):
+                print(f"  → {unit.key} を飛ばして続けます")
+            else:
+                print(f"  → 取得できないページが {window.skip_pages} ページを超えたため、このカテゴリを終了します")
+
+
+async def keep_run_alive(job: ScrapeJob, queue: WorkQueue) -> None:
+    """実行のハートビートを記録（他のプロセスに引き継がれたらジョブを止める）"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        if not queue.heartbeat(job.id):
+            print(f"実行が他のプロセスに引き継がれたため停止します: {job.id}")
+            job.cancel()
+            return
+
+
+async def run_scraper_task(job: ScrapeJob) -> str:
+    """スクレイピングジョブを実行
+
+    作業は永続キューに一覧ページ単位・詳細単位で登録し、1単位ごとに保存する。
+    中断された実行も同じ関数で未完了分から再開する。
+
+    Returns:
+        ジョブの終了状態
+    """
+    request = ScraperStartRequest(**job.params)
+    progress = job.progress
+
+    # カテゴリ選択をパース
+    selections = parse_selections(request.categories)
 
     print("=" * 50)
-    print("スクレイピング開始")
+    print(f"スクレイピング開始: {job.id}")
     print(f"  categories: {request.categories}")
     print(f"  parsed selections: {selections}")
     print(f"  job_types: {request.job_types}")
@@ -94,172 +320,148 @@ async def run_scraper_task(request: ScraperStartRequest):
     print(f"  save_to_database: {request.save_to_database}")
     print("=" * 50)
 
-    config = ScrapingConfig(
-        headless=True,
-        human_like=HumanLikeConfig(enabled=True),
-        timeout=TimeoutConfig(page_load=30000, element_wait=10000),
-    )
+    config = scrape_config()
     scraper = LancersScraper(config)
+    queue = get_work_queue()
+    manager = get_scrape_job_manager()
+    window = page_window(queue, job.id, request, config)
 
     total_selections = len(selections)
-    max_pages = request.max_pages if request.max_pages > 0 else 100
+    max_pages = window.max_pages
     is_fetch_all = request.max_pages == 0
+    category_str = ", ".join(c or "all" for c in request.categories)
+    heartbeat = asyncio.create_task(keep_run_alive(job, queue))
 
     try:
-        scraper_state.is_running = True
-        scraper_state.current_page = 0
-        scraper_state.total_pages = max_pages * total_selections if not is_fetch_all else 0
-        scraper_state.jobs_fetched = 0
-        scraper_state.estimated_total = max_pages * 30 * total_selections if not is_fetch_all else 0
-        scraper_state.started_at = datetime.now()
-        scraper_state.category = ", ".join(s[2] for s in selections)
-        scraper_state.error = None
-        scraper_state.cancelled = False
-        scraper_state.phase = "fetching"
-        scraper_state.message = "準備中..."
-        scraper_state.current_category_index = 0
-        scraper_state.total_categories = total_selections
-
-        all_results = []
-
-        for sel_idx, (category, subcategory, display_label) in enumerate(selections):
-            if scraper_state.cancelled:
-                break
-
-            scraper_state.current_category_index = sel_idx + 1
-            scraper_state.category = display_label
-            category_label = display_label or "全カテゴリ"
-
-            jobs = []
-            for page in range(1, max_pages + 1):
-                if scraper_state.cancelled:
-                    break
-
-                scraper_state.current_page = sel_idx * max_pages + page
-                scraper_state.message = f"{category_label} - {page}ページ目を取得中..."
-
-                url = scraper.build_search_url(
-                    category=category,
-                    subcategory=subcategory,
-                    job_types=request.job_types,
-                    open_only=True,
-                    page=page,
-                )
-                print(f"取得中: {url}")
-
-                page_jobs = await scraper.fetch_job_list(url)
-
-                if not page_jobs:
-                    print(f"  → 0件（終了）")
-                    break
-
-                print(f"  → {len(page_jobs)}件取得")
-                jobs.extend(page_jobs)
-                scraper_state.jobs_fetched = len(all_results) + len(jobs)
-
-                if len(page_jobs) < 20:
-                    print(f"  → 最終ページ到達（{len(page_jobs)}件 < 20）")
-                    break
-
-            # 詳細取得
-            if request.fetch_details and jobs and not scraper_state.cancelled:
-                scraper_state.phase = "fetching"
-                scraper_state.detail_total = len(jobs)
-                scraper_state.detail_current = 0
-
-                print(f"詳細取得開始: {len(jobs)}件")
-
-                for i, job in enumerate(jobs):
-                    if scraper_state.cancelled:
-                        break
-
-                    scraper_state.detail_current = i + 1
-                    scraper_state.message = f"詳細取得中... ({i + 1}/{len(jobs)})"
-
-                    if job.get("url"):
+        progress.total_pages = max_pages * total_selections if not is_fetch_all else 0
+        progress.estimated_total = max_pages * 30 * total_selections if not is_fetch_all else 0
+        progress.category = ", ".join(s[2] for s in selections)
+        progress.phase = "fetching"
+        progress.message = "準備中..."
+        progress.total_categories = total_selections
+
+        # 中断された実行の場合は、以前のプロセスが取り出したまま残った作業を戻し、
+        # 取得済みの分を進捗に反映
+        queue.release_claimed(job.id)
+        window.restore()
+        progress.jobs_fetched = sum(len(result["jobs"]) for result in queue.results(job.id, UNIT_PAGE))
+
+        # pagination.window 件の作業を並行して処理する。取り出せる作業がなくても、
+        # 処理中の作業が後続ページ・詳細を登録しうる間は終わらずに待つ
+        in_flight = 0
+        changed = asyncio.Event()
+
+        async def worker() -> None:
+            nonlocal in_flight
+            while not job.cancelled:
+                update_detail_progress(job, queue)
+
+                # 全ジョブ共通の取得枠を確保してから作業を取り出す
+                async with manager.slot():
+                    if job.cancelled:
+                        return
+                    changed.clear()
+                    unit = queue.claim(job.id)
+                    if unit is not None:
+                        in_flight += 1
                         try:
-                            detail = await scraper.fetch_job_detail(job["url"])
-                            if detail:
-                                job["description"] = detail.get("description", "")
-                                job["required_skills"] = detail.get("required_skills", [])
-                        except Exception as e:
-                            print(f"詳細取得エラー ({job.get('url')}): {e}")
-
-            all_results.extend(jobs)
-
-        # DB保存
-        added_count = 0
-        updated_count = 0
-
-        if request.save_to_database and all_results and not scraper_state.cancelled:
-            scraper_state.phase = "saving"
-            scraper_state.message = f"データベースに保存中... ({len(all_results)}件)"
-            print(f"データベース保存開始: {len(all_results)}件")
-
-            save_result = await save_to_database(all_results)
-            if save_result.get("success"):
-                added_count = save_result.get("added", 0)
-                updated_count = save_result.get("updated", 0)
-                print(f"保存完了: 新規 {added_count}件, 更新 {updated_count}件")
-            else:
-                print(f"保存エラー: {save_result.get('error')}")
-
-        # 完了
-        scraper_state.phase = "done"
-        scraper_state.is_running = False
-
-        if scraper_state.cancelled:
-            scraper_history.insert(0, {
+                            await process_unit(job, unit, queue, scraper, request, selections, window)
+                        finally:
+                            in_flight -= 1
+                            changed.set()
+
+                if unit is None:
+                    if in_flight == 0:
+                        changed.set()
+                        return
+                    await changed.wait()
+                    continue
+
+                job.publish_progress()
+
+        await asyncio.gather(*(worker() for _ in range(max(1, config.pagination.window))))
+
+        update_detail_progress(job, queue)
+        all_results, added_count, updated_count, unchanged_count = collect_run_results(queue, job.id)
+        duration = (datetime.now() - job.started_at).seconds
+
+        if job.cancelled:
+            progress.message = f"キャンセルされました（{len(all_results)}件取得済み）"
+            queue.finish_run(job.id, RUN_CANCELLED, summary={
+                "job_id": job.id,
                 "timestamp": datetime.now().isoformat(),
-                "category": ", ".join(c or "all" for c in request.categories),
+                "category": category_str,
                 "count": len(all_results),
                 "status": "cancelled",
-                "duration_seconds": (datetime.now() - scraper_state.started_at).seconds,
-            })
-            scraper_state.message = f"キャンセルされました（{len(all_results)}件取得済み）"
-        else:
-            # JSON保存
-            output_dir = Path(__file__).parent.parent.parent.parent / "output"
-            output_dir.mkdir(exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            category_str = "_".join(c or "all" for c in request.categories)
-            json_path = output_dir / f"{category_str}_jobs_{timestamp}.json"
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(all_results, f, ensure_ascii=False, indent=2)
-            print(f"JSON保存: {json_path}")
-
-            scraper_state.message = f"完了: {len(all_results)}件取得"
-            if request.save_to_database:
-                scraper_state.message += f" (新規 {added_count}件, 更新 {updated_count}件)"
-
-            duration = (datetime.now() - scraper_state.started_at).seconds
-            scraper_history.insert(0, {
-                "timestamp": datetime.now().isoformat(),
-                "category": ", ".join(c or "all" for c in request.categories),
-                "count": len(all_results),
-                "added": added_count,
-                "updated": updated_count,
-                "status": "success",
                 "duration_seconds": duration,
             })
+            return JOB_CANCELLED
+
+        # JSON保存
+        output_dir = Path(__file__).parent.parent.parent.parent / "output"
+        output_dir.mkdir(exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_category = "_".join(c or "all" for c in request.categories)
+        json_path = output_dir / f"{file_category}_jobs_{timestamp}_{job.id[:8]}.json"
+        json_path.write_bytes(dumps(all_results, indent=True))
+        print(f"JSON保存: {json_path}")
+
+        progress.message = f"完了: {len(all_results)}件取得"
+        if request.save_to_database:
+            print(f"保存完了: 新規 {added_count}件, 更新 {updated_count}件, 変更なし {unchanged_count}件")
+            progress.message += (
+                f" (新規 {added_count}件, 更新 {updated_count}件, 変更なし {unchanged_count}件)"
+            )
+
+        queue.finish_run(job.id, RUN_DONE, summary={
+            "job_id": job.id,
+            "timestamp": datetime.now().isoformat(),
+            "category": category_str,
+            "count": len(all_results),
+            "added": added_count,
+            "updated": updated_count,
+            "unchanged": unchanged_count,
+            "status": "success",
+            "duration_seconds": duration,
+        })
+        queue.delete_finished_runs()
+        return JOB_DONE
 
     except Exception as e:
         print(f"スクレイピングエラー: {e}")
-        scraper_state.error = str(e)
-        scraper_state.phase = "done"
-        scraper_state.is_running = False
-        scraper_state.message = f"エラー: {str(e)}"
-        scraper_history.insert(0, {
+        progress.error = str(e)
+        progress.message = f"エラー: {str(e)}"
+        queue.finish_run(job.id, RUN_ERROR, str(e), summary={
+            "job_id": job.id,
             "timestamp": datetime.now().isoformat(),
-            "category": ", ".join(c or "all" for c in request.categories),
+            "category": category_str,
             "count": 0,
             "status": "error",
             "error": str(e),
+            "duration_seconds": None,
         })
+        return JOB_ERROR
+    finally:
+        heartbeat.cancel()
+
+
+def start_scrape_job(run_id: str, params: dict) -> ScrapeJob:
+    """作業キューの実行をジョブとして開始"""
+    return get_scrape_job_manager().start(run_id, params, run_scraper_task)
+
+
+async def resume_unfinished_runs() -> None:
+    """前回のプロセスで中断された実行を再開（起動時に呼ぶ）
+
+    他のプロセス（複数ワーカーの uvicorn 等）が処理中の実行は再開しない。
+    """
+    queue = get_work_queue()
 
-    # 履歴を最大20件に制限
-    if len(scraper_history) > 20:
-        scraper_history = scraper_history[:20]
+    for run in queue.unfinished_runs():
+        if not queue.acquire_run(run["run_id"]):
+            continue
+        print(f"中断されたスクレイピングを再開します: {run['run_id']}")
+        start_scrape_job(run["run_id"], run["params"])
 
 
 # =============================================================================
@@ -267,48 +469,139 @@ async def run_scraper_task(request: ScraperStartRequest):
 # =============================================================================
 
 @router.post("/start")
-async def start_scraper(request: ScraperStartRequest, background_tasks: BackgroundTasks):
-    """スクレイピングを開始"""
-    if scraper_state.is_running:
-        raise HTTPException(status_code=400, detail="スクレイピングは既に実行中です")
+async def start_scraper(request: ScraperStartRequest):
+    """スクレイピングを開始（実行中のジョブがあっても並行して開始する）"""
+    run_id = create_scrape_run(request)
+    job = start_scrape_job(run_id, request.model_dump())
+    return {"success": True, "message": "スクレイピングを開始しました", "job_id": job.id}
+
+
+@router.get("/jobs")
+async def list_scrape_jobs():
+    """スクレイピングジョブ一覧（新しい順）"""
+    return {"jobs": [job.to_dict() for job in get_scrape_job_manager().all()]}
+
+
+@router.get("/jobs/{job_id}")
+async def get_scrape_job(job_id: str):
+    """スクレイピングジョブの状態を取得"""
+    job = get_scrape_job_manager().get(job_id)
+    if job is not None:
+        return job.to_dict()
+
+    # メモリにない終了済みジョブは作業キューの記録から返す
+    run = get_work_queue().get_run(job_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    return {
+        "job_id": job_id,
+        "status": run["status"],
+        "is_running": False,
+        "started_at": run["created_at"],
+        "finished_at": run["updated_at"],
+        "params": run["params"],
+        "error": run["error"],
+        "summary": run["summary"],
+    }
 
-    background_tasks.add_task(run_scraper_task, request)
-    return {"success": True, "message": "スクレイピングを開始しました"}
+
+@router.post("/jobs/{job_id}/cancel")
+async def cancel_scrape_job(job_id: str):
+    """スクレイピングジョブをキャンセル"""
+    if not get_scrape_job_manager().cancel(job_id):
+        raise HTTPException(status_code=400, detail="ジョブは実行中ではありません")
+    return {"success": True, "message": "キャンセルリクエストを送信しました"}
 
 
 @router.get("/status")
 async def get_scraper_status():
-    """スクレイピング状態を取得"""
-    elapsed = 0
-    if scraper_state.started_at:
-        elapsed = (datetime.now() - scraper_state.started_at).seconds
+    """スクレイピング状態を取得（実行中のうち最新のジョブ）"""
+    manager = get_scrape_job_manager()
+    job = manager.latest()
+    if job is None:
+        return {
+            "is_running": False,
+            "current_page": 0,
+            "total_pages": 0,
+            "jobs_fetched": 0,
+            "estimated_total": 0,
+            "elapsed_seconds": 0,
+            "category": None,
+            "error": None,
+            "phase": "idle",
+            "message": "",
+            "current_category_index": 0,
+            "total_categories": 0,
+            "detail_current": 0,
+            "detail_total": 0,
+            "running_jobs": 0,
+        }
 
-    return {
-        "is_running": scraper_state.is_running,
-        "current_page": scraper_state.current_page,
-        "total_pages": scraper_state.total_pages,
-        "jobs_fetched": scraper_state.jobs_fetched,
-        "estimated_total": scraper_state.estimated_total,
-        "elapsed_seconds": elapsed,
-        "category": scraper_state.category,
-        "error": scraper_state.error,
-        "phase": scraper_state.phase,
-        "message": scraper_state.message,
-        "current_category_index": scraper_state.current_category_index,
-        "total_categories": scraper_state.total_categories,
-        "detail_current": scraper_state.detail_current,
-        "detail_total": scraper_state.detail_total,
-    }
+    return {**job.to_dict(), "running_jobs": len(manager.running())}
+
+
+@router.get("/throttle")
+async def get_scraper_throttle():
+    """ホストごとのリクエスト制御の状態（現在の速度・同時数・間隔・ブロック回数）"""
+    return {"hosts": limiter_stats()}
+
+
+@router.get("/browser-pool")
+async def get_browser_pool_status(check: bool = False):
+    """共有ブラウザプールの状態（check=true で空いているブラウザをその場で検査する）"""
+    pool = current_browser_pool()
+    if pool is None:
+        return {"running": False}
+    stats = await pool.health_check() if check else pool.stats()
+    return {"running": True, **stats}
+
+
+def format_sse(event_type: str, data: dict) -> str:
+    """SSE形式の1イベント"""
+    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+@router.get("/stream")
+async def stream_scraper_events(request: Request, job_id: Optional[str] = None):
+    """スクレイピングの進捗をSSEで配信
+
+    接続直後に全ジョブの状態（snapshot）を送り、以降は進捗の差分（progress）と
+    案件ごとのイベント（listed / detailed / saved）、ジョブの開始・終了を送る。
+    読み出しが遅れてイベントが捨てられた場合は、lagged の後に snapshot を送り直す
+    （差分は全購読者で共通の基準から作るため、捨てた差分は後から届かない）。
+    """
+    manager = get_scrape_job_manager()
+
+    async def event_stream():
+        def snapshot() -> str:
+            jobs = [job.to_dict() for job in manager.all() if not job_id or job.id == job_id]
+            return format_sse("snapshot", {"jobs": jobs})
+
+        with get_event_broadcaster().subscribe(job_id) as subscriber:
+            yield snapshot()
+
+            while not await request.is_disconnected():
+                event = await subscriber.get(timeout=15.0)
+                if event is None:
+                    # 接続維持用のコメント
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event["type"], event["data"])
+                if event["type"] == "lagged":
+                    yield snapshot()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/cancel")
 async def cancel_scraper():
-    """スクレイピングをキャンセル"""
-    if not scraper_state.is_running:
+    """実行中の全スクレイピングをキャンセル"""
+    if get_scrape_job_manager().cancel_all() == 0:
         raise HTTPException(status_code=400, detail="スクレイピングは実行中ではありません")
-
-    scraper_state.cancelled = True
-    scraper_state.message = "キャンセル中..."
     return {"success": True, "message": "キャンセルリクエストを送信しました"}
 
 
@@ -316,36 +609,9 @@ async def cancel_scraper():
 async def get_scraper_stats():
     """スクレイピング統計を取得"""
     try:
-        supabase = get_supabase_client()
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        # 今日の件数
-        today_result = supabase.table("jobs").select("job_id", count="exact").gte("scraped_at", today.isoformat()).execute()
-        today_count = today_result.count or 0
-
-        # 今週の件数
-        week_start = today.replace(hour=0, minute=0, second=0)
-        week_result = supabase.table("jobs").select("job_id", count="exact").gte("scraped_at", week_start.isoformat()).execute()
-        week_count = week_result.count or 0
-
-        # 総件数
-        total_result = supabase.table("jobs").select("job_id", count="exact").execute()
-        total_count = total_result.count or 0
-
-        # カテゴリ別
-        by_category = {}
-        categories = ["system", "web", "writing", "design", "multimedia", "business", "translation"]
-        for cat in categories:
-            cat_result = supabase.table("jobs").select("job_id", count="exact").eq("category", cat).execute()
-            by_category[cat] = cat_result.count or 0
-
-        return {
-            "today": today_count,
-            "this_week": week_count,
-            "total": total_count,
-            "by_category": by_category,
-        }
-
+        return await fetch_job_stats()
+    except DatabaseTimeoutError:
+        raise
     except Exception as e:
         print(f"統計取得エラー: {e}")
         return {"today": 0, "this_week": 0, "total": 0, "by_category": {}}
@@ -382,6 +648,7 @@ async def cleanup_expired():
 
 
 @router.get("/history")
-async def get_scraper_history():
-    """スクレイピング履歴を取得"""
-    return {"history": scraper_history}
+async def get_scraper_history(limit: int = 20):
+    """スクレイピング履歴を取得（作業キューに記録された終了済みの実行）"""
+    runs = get_work_queue().finished_runs(limit=limit)
+    return {"history": [run["summary"] for run in runs if run["summary"]]}
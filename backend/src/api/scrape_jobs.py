@@ -0,0 +1,224 @@
+"""スクレイピングジョブ管理
+
+複数のスクレイピングを同時に実行し、ジョブごとに進捗とキャンセルを管理する。
+ページ取得・詳細取得の同時実行数は全ジョブ共通の上限で制御する。
+進捗の差分と案件ごとのイベントはイベントチャネル経由で SSE に流す。
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import AsyncGenerator, Awaitable, Callable, Optional
+
+from src.api.events import get_event_broadcaster
+
+# ジョブの状態
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_CANCELLED = "cancelled"
+JOB_ERROR = "error"
+
+# 全ジョブ合計の同時取得数
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "2"))
+
+# メモリに残す終了済みジョブ数（履歴は作業キューに永続化される）
+MAX_FINISHED_JOBS = 50
+
+
+@dataclass
+class ScrapeProgress:
+    """ジョブの進捗"""
+
+    current_page: int = 0
+    total_pages: int = 0
+    jobs_fetched: int = 0
+    estimated_total: int = 0
+    category: Optional[str] = None
+    error: Optional[str] = None
+    phase: str = "idle"  # idle, fetching, saving, done
+    message: str = ""
+    current_category_index: int = 0
+    total_categories: int = 0
+    detail_current: int = 0
+    detail_total: int = 0
+
+
+@dataclass
+class ScrapeJob:
+    """スクレイピングジョブ"""
+
+    id: str
+    params: dict
+    progress: ScrapeProgress = field(default_factory=ScrapeProgress)
+    status: str = JOB_RUNNING
+    started_at: datetime = field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = None
+    cancel_event: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+    # 最後に配信した進捗（差分計算用）
+    _published: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == JOB_RUNNING
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """キャンセルを要求（作業単位の区切りで停止する）"""
+        self.cancel_event.set()
+        self.progress.message = "キャンセル中..."
+        self.publish_progress()
+
+    @property
+    def elapsed_seconds(self) -> int:
+        return ((self.finished_at or datetime.now()) - self.started_at).seconds
+
+    def emit(self, event_type: str, data: Optional[dict] = None) -> None:
+        """このジョブのイベントを配信"""
+        get_event_broadcaster().publish(event_type, {"job_id": self.id, **(data or {})})
+
+    def publish_progress(self) -> None:
+        """前回配信から変わった進捗項目だけを配信"""
+        current = {**asdict(self.progress), "status": self.status, "is_running": self.is_running}
+        delta = {
+            key: value
+            for key, value in current.items()
+            if self._published.get(key, object()) != value
+        }
+        if not delta:
+            return
+        self._published = current
+        self.emit("progress", {**delta, "elapsed_seconds": self.elapsed_seconds})
+
+    def to_dict(self) -> dict:
+        """APIレスポンス形式（/status と同じ項目 + ジョブ情報）"""
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "is_running": self.is_running,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "elapsed_seconds": self.elapsed_seconds,
+            "params": self.params,
+            **asdict(self.progress),
+        }
+
+
+# ジョブ本体（終了状態を返す）
+JobRunner = Callable[[ScrapeJob], Awaitable[Optional[str]]]
+
+
+class ScrapeJobManager:
+    """スクレイピングジョブの実行・参照・キャンセル"""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._jobs: dict[str, ScrapeJob] = {}
+        self._budget: Optional[asyncio.Semaphore] = None
+
+    def start(self, job_id: str, params: dict, runner: JobRunner) -> ScrapeJob:
+        """ジョブをバックグラウンドで開始"""
+        existing = self._jobs.get(job_id)
+        if existing is not None and existing.is_running:
+            return existing
+
+        job = ScrapeJob(id=job_id, params=params)
+        self._jobs[job_id] = job
+        job.task = asyncio.create_task(self._run(job, runner))
+        job.emit("job_started", job.to_dict())
+        return job
+
+    async def _run(self, job: ScrapeJob, runner: JobRunner) -> None:
+        """ジョブを実行して終了状態を記録"""
+        try:
+            job.status = await runner(job) or JOB_DONE
+        except asyncio.CancelledError:
+            # プロセス終了時のキャンセル（作業キューに残り、次回起動時に再開される）
+            job.status = JOB_CANCELLED
+            raise
+        except Exception as e:
+            print(f"スクレイピングジョブエラー ({job.id}): {e}")
+            job.status = JOB_ERROR
+            job.progress.error = str(e)
+        finally:
+            job.finished_at = datetime.now()
+            job.progress.phase = "done"
+            job.publish_progress()
+            job.emit("job_finished", job.to_dict())
+            self._prune()
+
+    def _prune(self) -> None:
+        """古い終了済みジョブをメモリから削除"""
+        finished = sorted(
+            (job for job in self._jobs.values() if not job.is_running),
+            key=lambda job: job.finished_at or job.started_at,
+            reverse=True,
+        )
+        for job in finished[MAX_FINISHED_JOBS:]:
+            del self._jobs[job.id]
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None, None]:
+        """全ジョブ共通の取得枠を1つ確保"""
+        if self._budget is None:
+            self._budget = asyncio.Semaphore(self.max_concurrency)
+        async with self._budget:
+            yield
+
+    def get(self, job_id: str) -> Optional[ScrapeJob]:
+        return self._jobs.get(job_id)
+
+    def all(self) -> list[ScrapeJob]:
+        """全ジョブ（新しい順）"""
+        return sorted(self._jobs.values(), key=lambda job: job.started_at, reverse=True)
+
+    def running(self) -> list[ScrapeJob]:
+        """実行中のジョブ（新しい順）"""
+        return [job for job in self.all() if job.is_running]
+
+    def latest(self) -> Optional[ScrapeJob]:
+        """実行中のうち最新、なければ最後に開始したジョブ"""
+        running = self.running()
+        if running:
+            return running[0]
+        jobs = self.all()
+        return jobs[0] if jobs else None
+
+    def cancel(self, job_id: str) -> bool:
+        """ジョブをキャンセル（実行中でなければ False）"""
+        job = self._jobs.get(job_id)
+        if job is None or not job.is_running:
+            return False
+        job.cancel()
+        return True
+
+    def cancel_all(self) -> int:
+        """実行中の全ジョブをキャンセル"""
+        running = self.running()
+        for job in running:
+            job.cancel()
+        return len(running)
+
+    async def shutdown(self) -> None:
+        """実行中のタスクを停止（作業キューは running のまま残す）"""
+        tasks = [job.task for job in self.running() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_manager: Optional[ScrapeJobManager] = None
+
+
+def get_scrape_job_manager() -> ScrapeJobManager:
+    """共有ジョブマネージャーを取得"""
+    global _manager
+
+    if _manager is None:
+        _manager = ScrapeJobManager()
+    return _manager
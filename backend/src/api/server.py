@@ -1,9 +1,12 @@
 """FastAPI サーバー - メインエントリーポイント"""
 
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 
 # .envファイルを読み込み
@@ -20,8 +23,31 @@ from src.api.routes import (
     github_router,
     pipeline_router,
 )
+from src.api.routes.scraper import resume_unfinished_runs
+from src.api.scrape_jobs import get_scrape_job_manager
+from src.db.executor import shutdown_db_executor
+from src.models.errors import DatabaseError, DatabaseTimeoutError
+from src.scrapers.lifecycle import shutdown_scrapers
 
-app = FastAPI(title="Proposal Generator API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動・終了処理"""
+    # 前回中断されたスクレイピングを再開
+    if os.getenv("SCRAPE_RESUME_ON_STARTUP", "true").lower() == "true":
+        await resume_unfinished_runs()
+
+    yield
+
+    # 実行中のジョブを止める（作業キューに残り、次回起動時に再開される）
+    await get_scrape_job_manager().shutdown()
+    # 共有ブラウザプール・HTTPクライアント・解析プロセスを終了
+    await shutdown_scrapers()
+    # DB 呼び出し用のスレッドプールを終了
+    shutdown_db_executor()
+
+
+app = FastAPI(title="Proposal Generator API", version="1.0.0", lifespan=lifespan)
 
 # CORS設定
 app.add_middleware(
@@ -32,6 +58,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(DatabaseTimeoutError)
+async def database_timeout_handler(request: Request, exc: DatabaseTimeoutError):
+    """DB 呼び出しのタイムアウトは 504 を返す"""
+    return JSONResponse(status_code=504, content={"detail": exc.message})
+
+
+@app.exception_handler(DatabaseError)
+async def database_error_handler(request: Request, exc: DatabaseError):
+    """DB 呼び出しの失敗は 500 を返す"""
+    return JSONResponse(status_code=500, content={"detail": exc.message})
+
 # ルーターを登録
 app.include_router(jobs_router)
 app.include_router(scraper_router)
@@ -53,6 +53,17 @@ class SessionManager:
             return str(path)
         return None
 
+    def load_cookies(self, service: Service) -> list[dict]:
+        """保存済みセッションのCookie一覧を取得（なければ空リスト）"""
+        path = self._get_storage_state_path(service)
+        if not path.exists():
+            return []
+        try:
+            with open(path) as f:
+                return json.load(f).get("cookies", [])
+        except (json.JSONDecodeError, OSError):
+            return []
+
     async def login(self, service: Service, timeout: int = 300) -> bool:
         """
         手動ログインを行い、セッションを保存
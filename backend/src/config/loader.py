@@ -8,15 +8,21 @@ import yaml
 
 from src.models.config import (
     AppConfig,
+    BrowserPoolConfig,
+    CacheConfig,
     CategoryTemplate,
     ClosingConfig,
     GeminiConfig,
     HumanLikeConfig,
     IntroductionConfig,
+    PaginationConfig,
+    ParserConfig,
+    ResourceBlockingConfig,
     ProfileConfig,
     RetryConfig,
     ScheduleConfig,
     ScrapingConfig,
+    ThrottleConfig,
     TimeoutConfig,
 )
 from src.models.errors import ConfigError
@@ -105,6 +111,13 @@ class ConfigLoader:
         human_like_data = data.get("human_like", {})
         timeout_data = data.get("timeout", {})
         retry_data = data.get("retry", {})
+        pool_data = data.get("pool", {})
+        parser_data = data.get("parser", {})
+        blocking_data = data.get("blocking", {})
+        pagination_data = data.get("pagination", {})
+        throttle_data = data.get("throttle", {})
+        cache_data = data.get("cache", {})
+        default_blocking = ResourceBlockingConfig()
 
         return ScrapingConfig(
             headless=data.get("headless", True),
@@ -116,10 +129,56 @@ class ConfigLoader:
             timeout=TimeoutConfig(
                 page_load=timeout_data.get("page_load", 30000),
                 element_wait=timeout_data.get("element_wait", 10000),
+                operation=timeout_data.get("operation", 90000),
             ),
             retry=RetryConfig(
                 max_attempts=retry_data.get("max_attempts", 3),
                 delay=retry_data.get("delay", 5),
+                max_delay=retry_data.get("max_delay", 60.0),
+                budget=retry_data.get("budget", 30),
+                skip_pages=retry_data.get("skip_pages", 2),
+            ),
+            pool=BrowserPoolConfig(
+                browsers=pool_data.get("browsers", 1),
+                contexts_per_browser=pool_data.get("contexts_per_browser", 4),
+                max_navigations=pool_data.get("max_navigations", 50),
+                health_check_interval=pool_data.get("health_check_interval", 60.0),
+                health_check_timeout=pool_data.get("health_check_timeout", 5.0),
+            ),
+            parser=ParserConfig(
+                backend=parser_data.get("backend", "dom"),
+                workers=parser_data.get("workers", 0),
+            ),
+            blocking=ResourceBlockingConfig(
+                enabled=blocking_data.get("enabled", True),
+                resource_types=blocking_data.get(
+                    "resource_types", default_blocking.resource_types
+                ),
+                url_patterns=blocking_data.get(
+                    "url_patterns", default_blocking.url_patterns
+                ),
+                allowlist=blocking_data.get("allowlist", {}),
+            ),
+            pagination=PaginationConfig(
+                window=pagination_data.get("window", 3),
+            ),
+            throttle=ThrottleConfig(
+                initial_concurrency=throttle_data.get("initial_concurrency", 2),
+                max_concurrency=throttle_data.get("max_concurrency", 6),
+                initial_delay=throttle_data.get("initial_delay", 1.0),
+                min_delay=throttle_data.get("min_delay", 0.2),
+                max_delay=throttle_data.get("max_delay", 30.0),
+                delay_step=throttle_data.get("delay_step", 0.05),
+                backoff_factor=throttle_data.get("backoff_factor", 2.0),
+                slow_latency=throttle_data.get("slow_latency", 8.0),
+                cooldown=throttle_data.get("cooldown", 60.0),
+                jitter=throttle_data.get("jitter", 0.3),
+            ),
+            cache=CacheConfig(
+                enabled=cache_data.get("enabled", True),
+                directory=cache_data.get("directory", ""),
+                ttl_hours=cache_data.get("ttl_hours", 6.0),
+                max_mb=cache_data.get("max_mb", 200.0),
             ),
         )
 
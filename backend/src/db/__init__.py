@@ -1,5 +1,15 @@
 """Database module"""
 
-from .supabase_client import get_supabase_client, supabase
+from typing import Any
 
-__all__ = ["get_supabase_client", "supabase"]
+from .supabase_client import get_supabase_client, set_client_factory
+from .content_hash import compute_content_hash
+
+__all__ = ["get_supabase_client", "set_client_factory", "compute_content_hash"]
+
+
+def __getattr__(name: str) -> Any:
+    # デフォルトクライアントは参照時に作る（インポート時には作らない）
+    if name == "supabase":
+        return get_supabase_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
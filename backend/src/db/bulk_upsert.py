@@ -0,0 +1,116 @@
+"""一括 upsert
+
+レコードをペイロードサイズ単位でまとめて複数行 upsert を送る。
+チャンクは上限付きで並列に送り、失敗したチャンクは二分割して再送する
+（不正な1行のためにチャンク全体を失わないため）。
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+
+from .executor import run_db
+
+# 1リクエストあたりの上限
+DEFAULT_MAX_CHUNK_BYTES = 512 * 1024
+DEFAULT_MAX_CHUNK_ROWS = 500
+
+# 同時に送るチャンク数
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class BulkUpsertResult:
+    """一括 upsert の結果"""
+
+    written: int = 0
+    requests: int = 0
+    failed_keys: list = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.failed_keys)
+
+
+def record_size(record: dict) -> int:
+    """レコードの JSON ペイロードサイズ（バイト）"""
+    return len(json.dumps(record, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def chunk_by_bytes(
+    records: list[dict],
+    max_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+    max_rows: int = DEFAULT_MAX_CHUNK_ROWS,
+) -> list[list[dict]]:
+    """ペイロードサイズと行数の上限でチャンクに分割（上限を超える1行は単独チャンク）"""
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    current_bytes = 2  # "[]"
+
+    for record in records:
+        size = record_size(record) + 1  # 区切りの ","
+        if current and (current_bytes + size > max_bytes or len(current) >= max_rows):
+            chunks.append(current)
+            current = []
+            current_bytes = 2
+        current.append(record)
+        current_bytes += size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def bulk_upsert(
+    supabase,
+    table: str,
+    records: list[dict],
+    on_conflict: str = "job_id",
+    max_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+    max_rows: int = DEFAULT_MAX_CHUNK_ROWS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BulkUpsertResult:
+    """レコードを一括 upsert
+
+    Args:
+        supabase: Supabase クライアント（同期クライアントをスレッドで実行する）
+        table: テーブル名
+        records: 同じキー構成のレコード
+        on_conflict: 一意制約のカラム
+        max_bytes: 1リクエストあたりのペイロード上限
+        max_rows: 1リクエストあたりの行数上限
+        concurrency: 同時に送るリクエスト数
+    """
+    result = BulkUpsertResult()
+    if not records:
+        return result
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    def execute(chunk: list[dict]) -> None:
+        supabase.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+
+    async def send(chunk: list[dict]) -> None:
+        async with semaphore:
+            result.requests += 1
+            try:
+                await run_db(execute, chunk)
+                result.written += len(chunk)
+                return
+            except Exception as e:
+                error = e
+
+        if len(chunk) == 1:
+            key = chunk[0].get(on_conflict)
+            print(f"  upsert失敗: {key} - {error}")
+            result.failed_keys.append(key)
+            result.errors.append(str(error))
+            return
+
+        # 二分割して再送（セマフォは解放済み）
+        middle = len(chunk) // 2
+        await asyncio.gather(send(chunk[:middle]), send(chunk[middle:]))
+
+    await asyncio.gather(*(send(chunk) for chunk in chunk_by_bytes(records, max_bytes, max_rows)))
+    return result
@@ -0,0 +1,101 @@
+"""案件レコードのコンテンツハッシュ
+
+保存前に DB 上のハッシュと比較し、内容が変わった行だけを書き込む。
+（更新のたびに update_jobs_updated_at トリガーが走るため）
+変更のなかった行は scraped_at だけをまとめて進め、最終取得日時を保つ。
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+# ハッシュ対象外のカラム（取得のたびに変わる値・ハッシュ自身）
+HASH_EXCLUDED_FIELDS = frozenset({"scraped_at", "content_hash"})
+
+# in_() 1回あたりの job_id 数（URL長の上限対策）
+EXISTING_HASH_CHUNK_SIZE = 200
+
+
+def compute_content_hash(record: dict) -> str:
+    """DBレコードのハッシュを計算（キー順・取得日時に依存しない）"""
+    payload = {
+        key: value
+        for key, value in record.items()
+        if key not in HASH_EXCLUDED_FIELDS
+    }
+    encoded = json.dumps(
+        payload,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def fetch_existing_hashes(supabase, job_ids: list[str]) -> dict[str, Optional[str]]:
+    """既存案件のハッシュを取得（job_id -> content_hash、未計算の行は None）"""
+    existing: dict[str, Optional[str]] = {}
+    unique_ids = list(dict.fromkeys(job_id for job_id in job_ids if job_id))
+
+    for start in range(0, len(unique_ids), EXISTING_HASH_CHUNK_SIZE):
+        chunk = unique_ids[start:start + EXISTING_HASH_CHUNK_SIZE]
+        result = (
+            supabase.table("jobs")
+            .select("job_id, content_hash")
+            .in_("job_id", chunk)
+            .execute()
+        )
+        for row in result.data or []:
+            existing[row["job_id"]] = row.get("content_hash")
+
+    return existing
+
+
+def split_by_change(
+    records: list[dict],
+    existing: dict[str, Optional[str]],
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """レコードにハッシュを付与し、新規・更新・変更なしに分類
+
+    Returns:
+        (新規レコード, 更新レコード, 変更なしのレコード)
+    """
+    new_records: list[dict] = []
+    changed_records: list[dict] = []
+    unchanged_records: list[dict] = []
+
+    # 同じ job_id が複数回現れた場合は最後のものを使う
+    latest = {record["job_id"]: record for record in records if record.get("job_id")}
+
+    for job_id, record in latest.items():
+        record["content_hash"] = compute_content_hash(record)
+        if job_id not in existing:
+            new_records.append(record)
+        elif existing[job_id] != record["content_hash"]:
+            changed_records.append(record)
+        else:
+            unchanged_records.append(record)
+
+    return new_records, changed_records, unchanged_records
+
+
+def touch_scraped_at(supabase, records: list[dict]) -> int:
+    """変更のなかった案件の scraped_at だけを更新（EXISTING_HASH_CHUNK_SIZE 件ずつ1クエリ）
+
+    同じ実行で取得した案件はまとめて最も新しい scraped_at にする。
+
+    Returns:
+        送信したリクエスト数
+    """
+    job_ids = [record["job_id"] for record in records if record.get("job_id")]
+    if not job_ids:
+        return 0
+
+    scraped_at = max(str(record.get("scraped_at") or "") for record in records)
+    requests = 0
+    for start in range(0, len(job_ids), EXISTING_HASH_CHUNK_SIZE):
+        chunk = job_ids[start:start + EXISTING_HASH_CHUNK_SIZE]
+        supabase.table("jobs").update({"scraped_at": scraped_at}).in_("job_id", chunk).execute()
+        requests += 1
+    return requests
@@ -0,0 +1,66 @@
+"""データベース呼び出しのスレッドプール実行
+
+Supabase（PostgREST）クライアントは同期 API のため、async のルートから直接
+execute() するとイベントループが止まり、同時リクエストが直列になる。
+DB 呼び出しは専用の上限付きスレッドプールで実行し、1回ごとにタイムアウトを設ける。
+クライアントはシングルトンのため、HTTP 接続プールは全スレッドで共有される。
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from src.models.errors import DatabaseTimeoutError
+
+T = TypeVar("T")
+
+# 同時に実行する DB 呼び出しの数
+DB_MAX_WORKERS = max(1, int(os.getenv("DB_MAX_WORKERS", "8")))
+
+# 1回の DB 呼び出しのタイムアウト（秒、プールの空き待ちを含む）
+DB_CALL_TIMEOUT = float(os.getenv("DB_CALL_TIMEOUT", "20"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DB_MAX_WORKERS, thread_name_prefix="db")
+    return _executor
+
+
+async def run_db(
+    fn: Callable[..., T],
+    *args,
+    timeout: Optional[float] = DB_CALL_TIMEOUT,
+    **kwargs,
+) -> T:
+    """同期の DB 呼び出しをスレッドプールで実行
+
+    Args:
+        fn: 実行する関数（query.execute や、複数のクエリをまとめた関数）
+        timeout: タイムアウト（秒、None なら無制限）
+
+    Raises:
+        DatabaseTimeoutError: タイムアウトした場合（実行中のスレッドは完了まで動く）
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        name = getattr(fn, "__qualname__", repr(fn))
+        raise DatabaseTimeoutError(
+            f"データベース呼び出しがタイムアウトしました（{timeout}秒）: {name}"
+        ) from None
+
+
+def shutdown_db_executor() -> None:
+    """スレッドプールを終了（実行中の呼び出しは待たない）"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
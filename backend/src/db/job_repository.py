@@ -0,0 +1,175 @@
+"""案件の参照（job_id・URL による取得）
+
+一覧全体を読んでから Python で探すのではなく、必要な案件だけを DB で絞り込んで
+取得する（job_id は idx_jobs_job_id を使う）。取得した案件は短い TTL でプロセス内に
+キャッシュし、同じ案件への連続したリクエスト（提案文生成 → スコアリング等）では
+DB を読まない。保存・削除時は invalidate で破棄する。
+
+URL で指定された案件は URL の最後のパス要素（Lancers の job_id）に直して
+job_id で引く。先頭がワイルドカードの LIKE（索引を使えず全件走査になる）は、
+job_id で見つからない場合の最後の手段としてのみ使う。
+"""
+
+import copy
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+from src.models.errors import DatabaseError, DatabaseTimeoutError
+from src.models.job_codec import db_records_to_jobs
+from src.utils.ttl_cache import TTLCache
+
+from .content_hash import EXISTING_HASH_CHUNK_SIZE
+from .supabase_client import get_supabase_client
+
+# キャッシュの有効期間（秒）と最大件数
+JOB_CACHE_TTL = 30.0
+JOB_CACHE_MAX_ENTRIES = 2000
+
+
+def job_id_from_key(key: str) -> str:
+    """job_id または案件 URL（の末尾）から job_id の候補を取り出す
+
+    例: "https://www.lancers.jp/work/detail/12345?ref=x" -> "12345"
+    """
+    path = urlsplit(key.strip()).path if "://" in key else key.split("?", 1)[0].split("#", 1)[0]
+    segments = [segment for segment in path.split("/") if segment]
+    return segments[-1] if segments else key.strip()
+
+
+def _escape_like(value: str) -> str:
+    """LIKE パターンの特殊文字をエスケープ"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class JobRepository:
+    """jobs テーブルの案件を job_id・URL で取得する
+
+    Args:
+        client_factory: Supabase クライアントを返す関数（呼び出し時に取得する）
+        ttl: キャッシュの有効期間（秒）
+        max_entries: キャッシュする最大件数
+
+    返す案件はキャッシュの深いコピーなので、呼び出し側で変更してよい
+    （required_skills 等のリストを含む）。
+    """
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable] = None,
+        ttl: float = JOB_CACHE_TTL,
+        max_entries: int = JOB_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._client_factory = client_factory or get_supabase_client
+        self._jobs: TTLCache[str, dict] = TTLCache(ttl, max_entries)
+        # URL の末尾 → job_id
+        self._url_suffixes: TTLCache[str, str] = TTLCache(ttl, max_entries)
+
+    def _select(self, build: Callable) -> list[dict]:
+        """クエリを実行し、案件データ形式にして返す（取得した案件はキャッシュする）
+
+        Raises:
+            DatabaseError: PostgREST・接続のエラー
+        """
+        try:
+            query = self._client_factory().table("jobs").select("*")
+            result = build(query).execute()
+        except DatabaseTimeoutError:
+            raise
+        except Exception as e:
+            print(f"案件取得エラー: {e}")
+            raise DatabaseError(f"案件の取得に失敗しました: {e}") from e
+        jobs = db_records_to_jobs(result.data or [])
+        for job in jobs:
+            if job.get("job_id"):
+                self._jobs.set(job["job_id"], copy.deepcopy(job))
+        return jobs
+
+    def _cached(self, job_id: str) -> Optional[dict]:
+        job = self._jobs.get(job_id)
+        return copy.deepcopy(job) if job is not None else None
+
+    def get_by_id(self, job_id: str) -> Optional[dict]:
+        """job_id で案件を取得"""
+        job = self._cached(job_id)
+        if job is not None:
+            return job
+        jobs = self._select(lambda query: query.eq("job_id", job_id).limit(1))
+        return jobs[0] if jobs else None
+
+    def get_many(self, job_ids: Iterable[str]) -> list[dict]:
+        """複数の job_id で案件を取得（指定順、見つからない案件は含めない）"""
+        unique_ids = list(dict.fromkeys(job_id for job_id in job_ids if job_id))
+        found: dict[str, dict] = {}
+        missing: list[str] = []
+        for job_id in unique_ids:
+            job = self._cached(job_id)
+            if job is not None:
+                found[job_id] = job
+            else:
+                missing.append(job_id)
+
+        for start in range(0, len(missing), EXISTING_HASH_CHUNK_SIZE):
+            chunk = missing[start:start + EXISTING_HASH_CHUNK_SIZE]
+            for job in self._select(lambda query, ids=chunk: query.in_("job_id", ids)):
+                found[job["job_id"]] = job
+
+        return [found[job_id] for job_id in unique_ids if job_id in found]
+
+    def get_by_url_suffix(self, suffix: str) -> Optional[dict]:
+        """URL が suffix で終わる案件を取得（最新の1件）
+
+        先頭がワイルドカードの LIKE で全件を走査するため、find で job_id に
+        直せなかった場合の最後の手段として使う。
+        """
+        job_id = self._url_suffixes.get(suffix)
+        if job_id is not None:
+            job = self.get_by_id(job_id)
+            if job is not None:
+                return job
+
+        jobs = self._select(
+            lambda query: query.like("url", f"%{_escape_like(suffix)}")
+            .order("scraped_at", desc=True)
+            .limit(1)
+        )
+        if not jobs:
+            return None
+        if jobs[0].get("job_id"):
+            self._url_suffixes.set(suffix, jobs[0]["job_id"])
+        return jobs[0]
+
+    def find(self, key: str) -> Optional[dict]:
+        """job_id、または案件 URL（の末尾）で案件を取得"""
+        # 以前 URL の末尾として見つかったキーは job_id での検索を省く
+        known_id = self._url_suffixes.get(key)
+        if known_id is not None:
+            job = self.get_by_id(known_id)
+            if job is not None:
+                return job
+
+        job = self.get_by_id(job_id_from_key(key))
+        if job is not None:
+            return job
+        return self.get_by_url_suffix(key)
+
+    def invalidate(self, job_ids: Optional[Iterable[str]] = None) -> None:
+        """キャッシュを破棄（job_ids 省略時は全件）"""
+        if job_ids is None:
+            self._jobs.clear()
+            self._url_suffixes.clear()
+        else:
+            self._jobs.delete(job_ids)
+
+    def stats(self) -> dict:
+        return {"jobs": self._jobs.stats(), "url_suffixes": self._url_suffixes.stats()}
+
+
+_repository: Optional[JobRepository] = None
+
+
+def get_job_repository() -> JobRepository:
+    """共有の案件リポジトリを取得"""
+    global _repository
+    if _repository is None:
+        _repository = JobRepository()
+    return _repository
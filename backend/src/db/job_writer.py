@@ -0,0 +1,41 @@
+"""案件レコードの保存（API・定期実行スクリプト共通）"""
+
+from .bulk_upsert import bulk_upsert
+from .content_hash import fetch_existing_hashes, split_by_change, touch_scraped_at
+from .executor import run_db
+
+
+async def save_job_records(supabase, records: list[dict]) -> dict:
+    """DBレコード形式の案件を保存（内容が変わった行のみ一括 upsert）
+
+    変更のなかった行は scraped_at だけを更新する（差分取得の再取得判定が
+    最終取得日時を見るため）。
+
+    Returns:
+        added / updated / unchanged / failed の件数と送信リクエスト数
+    """
+    if not records:
+        return {"added": 0, "updated": 0, "unchanged": 0, "failed": 0, "requests": 0}
+
+    existing = await run_db(
+        fetch_existing_hashes, supabase, [r["job_id"] for r in records]
+    )
+    new_records, changed_records, unchanged_records = split_by_change(records, existing)
+
+    result = await bulk_upsert(supabase, "jobs", new_records + changed_records, on_conflict="job_id")
+
+    touch_requests = 0
+    if unchanged_records:
+        try:
+            touch_requests = await run_db(touch_scraped_at, supabase, unchanged_records)
+        except Exception as e:
+            print(f"  scraped_at更新失敗: {e}")
+
+    failed = set(result.failed_keys)
+    return {
+        "added": sum(1 for r in new_records if r["job_id"] not in failed),
+        "updated": sum(1 for r in changed_records if r["job_id"] not in failed),
+        "unchanged": len(unchanged_records),
+        "failed": len(failed),
+        "requests": result.requests + touch_requests,
+    }
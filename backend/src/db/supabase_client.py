@@ -1,35 +1,71 @@
-"""Supabase client configuration"""
+"""Supabase client configuration
+
+クライアントは最初に使われたときに作る（インポートしただけでは .env の読み込みも
+supabase パッケージの読み込みもしない）。生成方法は set_client_factory で差し替えられる。
+"""
 
 import os
-from typing import Optional
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from dotenv import load_dotenv
 
-# .envファイルを読み込み
+if TYPE_CHECKING:
+    from supabase import Client
+
+# .envファイルのパス
 env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(env_path)
 
-_supabase_client: Optional[Client] = None
+_supabase_client: Optional["Client"] = None
+_client_factory: Optional[Callable[[], "Client"]] = None
+_client_lock = threading.Lock()
 
 
-def get_supabase_client() -> Client:
-    """Supabaseクライアントを取得（シングルトン）"""
-    global _supabase_client
+def create_default_client() -> "Client":
+    """環境変数（.env）の接続情報でクライアントを作成"""
+    from supabase import create_client
+
+    load_dotenv(env_path)
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
-    if _supabase_client is None:
-        url = os.getenv("SUPABASE_URL")
-        key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+    if not url or not key:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment"
+        )
 
-        if not url or not key:
-            raise ValueError(
-                "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment"
-            )
+    return create_client(url, key)
+
+
+def set_client_factory(factory: Optional[Callable[[], "Client"]] = None) -> None:
+    """クライアントの生成関数を差し替え（None で既定に戻す）
+
+    作成済みのクライアントは破棄し、次の get_supabase_client で factory から作り直す。
+    """
+    global _supabase_client, _client_factory
+    with _client_lock:
+        _client_factory = factory
+        _supabase_client = None
+
+
+def get_supabase_client() -> "Client":
+    """Supabaseクライアントを取得（シングルトン、初回呼び出し時に作成）"""
+    global _supabase_client
 
-        _supabase_client = create_client(url, key)
+    client = _supabase_client
+    if client is None:
+        # DB 呼び出し用のスレッドから同時に呼ばれても1つだけ作る
+        with _client_lock:
+            if _supabase_client is None:
+                _supabase_client = (_client_factory or create_default_client)()
+            client = _supabase_client
 
-    return _supabase_client
+    return client
 
 
-# デフォルトクライアント
-supabase = get_supabase_client()
+def __getattr__(name: str) -> Any:
+    # デフォルトクライアント（supabase 属性）は参照時に作る
+    if name == "supabase":
+        return get_supabase_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
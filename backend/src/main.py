@@ -77,8 +77,17 @@ def generate(
 
     # スクレイピング実行
     console.print(f"\n[cyan]案件情報を取得中...[/cyan]")
+
+    async def scrape_and_close():
+        from src.scrapers.lifecycle import shutdown_scrapers
+
+        try:
+            return await scraper.scrape(url)
+        finally:
+            await shutdown_scrapers()
+
     try:
-        job_info = asyncio.run(scraper.scrape(url))
+        job_info = asyncio.run(scrape_and_close())
     except Exception as e:
         error_console.print(f"[red]Error:[/red] スクレイピングに失敗しました: {e}")
         raise typer.Exit(ErrorCode.SCRAPING_ERROR)
@@ -42,14 +42,99 @@ class TimeoutConfig:
 
     page_load: int = 30000
     element_wait: int = 10000
+    operation: int = 90000  # 1回の取得（待機・遷移・抽出）全体の上限、超えたら再試行
 
 
 @dataclass
 class RetryConfig:
     """リトライ設定"""
 
-    max_attempts: int = 3
-    delay: int = 5
+    max_attempts: int = 3  # 1操作あたりの最大試行回数
+    delay: float = 5  # 初回の再試行までの待機秒数（以降は倍々）
+    max_delay: float = 60.0  # 再試行までの待機秒数の上限
+    budget: int = 30  # 1回の実行全体で使えるリトライ回数
+    skip_pages: int = 2  # 一覧取得で失敗しても飛ばして続けるページ数（カテゴリごと）
+
+
+@dataclass
+class BrowserPoolConfig:
+    """ブラウザプール設定"""
+
+    browsers: int = 1
+    contexts_per_browser: int = 4
+    max_navigations: int = 50
+    health_check_interval: float = 60.0  # 空いているブラウザを検査する間隔（秒、0で無効）
+    health_check_timeout: float = 5.0  # 検査でコンテキストを開閉するまでの上限（秒）
+
+
+@dataclass
+class ParserConfig:
+    """ページ解析設定"""
+
+    backend: str = "dom"  # dom: ブラウザ上で解析 / html: 生HTMLを別プロセスで解析
+    workers: int = 0  # html バックエンドのプロセス数（0: CPU数）
+
+
+@dataclass
+class PaginationConfig:
+    """検索結果ページの取得設定"""
+
+    window: int = 3  # 同時に取得するページ数（同じコンテキストのタブで並列取得）
+
+
+@dataclass
+class ThrottleConfig:
+    """ホスト単位のリクエスト制御設定（応答に応じて AIMD で増減）"""
+
+    initial_concurrency: int = 2  # 開始時の同時リクエスト数
+    max_concurrency: int = 6  # 同時リクエスト数の上限
+    initial_delay: float = 1.0  # 開始時のリクエスト開始間隔（秒）
+    min_delay: float = 0.2  # 間隔の下限（秒）
+    max_delay: float = 30.0  # 間隔の上限（秒）
+    delay_step: float = 0.05  # 正常応答ごとに縮める間隔（秒）
+    backoff_factor: float = 2.0  # ブロック・遅延時に同時数を割り、間隔に掛ける値
+    slow_latency: float = 8.0  # これより遅い応答は混雑とみなす（秒）
+    cooldown: float = 60.0  # ブロック時に停止する秒数（Retry-After がない場合）
+    jitter: float = 0.3  # 間隔のゆらぎ（±割合）
+
+
+@dataclass
+class CacheConfig:
+    """取得済みHTMLのディスクキャッシュ設定（案件詳細ページ）"""
+
+    enabled: bool = True
+    directory: str = ""  # 空なら backend/output/html_cache
+    ttl_hours: float = 6.0  # この時間内は再取得せずキャッシュを使う
+    max_mb: float = 200.0  # 合計サイズの上限（超えたら参照が古い順に削除）
+
+
+@dataclass
+class ResourceBlockingConfig:
+    """不要リソースのブロック設定"""
+
+    enabled: bool = True
+    # ブロックするリソース種別（Playwright の request.resource_type）
+    # stylesheet は innerText や要素の可視判定に影響するためデフォルトでは対象外
+    resource_types: list[str] = field(
+        default_factory=lambda: ["image", "media", "font"]
+    )
+    # URLにこの文字列を含むリクエストをブロック（広告・解析タグ等）
+    url_patterns: list[str] = field(
+        default_factory=lambda: [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "googlesyndication.com",
+            "doubleclick.net",
+            "connect.facebook.net",
+            "analytics.twitter.com",
+            "bat.bing.com",
+            "clarity.ms",
+            "hotjar.com",
+            "criteo",
+        ]
+    )
+    # サービスごとにブロックしないURL（サービス名 -> URLに含まれる文字列）
+    allowlist: dict[str, list[str]] = field(default_factory=dict)
 
 
 @dataclass
@@ -60,6 +145,12 @@ class ScrapingConfig:
     human_like: HumanLikeConfig = field(default_factory=HumanLikeConfig)
     timeout: TimeoutConfig = field(default_factory=TimeoutConfig)
     retry: RetryConfig = field(default_factory=RetryConfig)
+    pool: BrowserPoolConfig = field(default_factory=BrowserPoolConfig)
+    parser: ParserConfig = field(default_factory=ParserConfig)
+    blocking: ResourceBlockingConfig = field(default_factory=ResourceBlockingConfig)
+    pagination: PaginationConfig = field(default_factory=PaginationConfig)
+    throttle: ThrottleConfig = field(default_factory=ThrottleConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
 
 
 @dataclass
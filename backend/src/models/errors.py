@@ -93,3 +93,15 @@ class AuthenticationError(ProposalGenError):
     """認証エラー"""
 
     code = ErrorCode.AUTH_ERROR
+
+
+class DatabaseError(NetworkError):
+    """データベース呼び出しの失敗（PostgREST・接続エラー）"""
+
+    pass
+
+
+class DatabaseTimeoutError(NetworkError):
+    """データベース呼び出しのタイムアウト"""
+
+    pass
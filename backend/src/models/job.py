@@ -1,9 +1,13 @@
 """案件情報モデル"""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, TypeVar
+
+from src.models.job_codec import job_to_api_dict
+
+T = TypeVar("T")
 
 
 class Service(str, Enum):
@@ -50,6 +54,37 @@ class JobCategory(str, Enum):
     OTHER = "other"
 
 
+def _slotted(cls: type[T]) -> type[T]:
+    """frozen dataclass を __slots__ 付きのクラスに作り直す
+
+    dataclass(slots=True) は Python 3.10 以降のため自前で行う。インスタンスごとの
+    __dict__ がなくなり、案件を大量に保持したときのメモリが減る。
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)  # デフォルト値（__init__ が保持している）
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+
+    # frozen のため、pickle（解析プロセスとの受け渡し）の復元は object.__setattr__ で行う
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in names)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__getstate__"] = __getstate__
+    namespace["__setstate__"] = __setstate__
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+@_slotted
 @dataclass(frozen=True)
 class ClientInfo:
     """クライアント情報"""
@@ -68,6 +103,7 @@ class ClientInfo:
         }
 
 
+@_slotted
 @dataclass(frozen=True)
 class JobInfo:
     """案件情報"""
@@ -94,28 +130,7 @@ class JobInfo:
     scraped_at: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> dict:
-        return {
-            "title": self.title,
-            "description": self.description,
-            "category": self.category.value,
-            "budget_type": self.budget_type.value,
-            "job_id": self.job_id,
-            "job_type": self.job_type.value,
-            "status": self.status.value,
-            "budget_min": self.budget_min,
-            "budget_max": self.budget_max,
-            "deadline": self.deadline,
-            "remaining_days": self.remaining_days,
-            "required_skills": self.required_skills,
-            "tags": self.tags,
-            "feature_tags": self.feature_tags,
-            "proposal_count": self.proposal_count,
-            "recruitment_count": self.recruitment_count,
-            "source": self.source.value,
-            "url": self.url,
-            "client": self.client.to_dict() if self.client else None,
-            "scraped_at": self.scraped_at.isoformat(),
-        }
+        return job_to_api_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "JobInfo":
@@ -0,0 +1,125 @@
+"""案件の一括正規化
+
+JobInfo の一覧・スクレイピング結果の dict・DB レコードのどれからでも、DB の jobs
+テーブルのカラムごとの値の列（列指向のバッチ）を作り、保存用のレコードを組み立てる。
+変換規則は job_codec の定義表の1か所になる。DB から読んだレコードの変換は1件ずつの
+方が速いため、job_codec.db_record_to_job で行う。
+
+列はカラムごとに一括で作る（属性の取り出しは operator.attrgetter を map で回し、
+行ごとの dict 生成は最後の zip の1回だけ）。
+"""
+
+from datetime import datetime
+from operator import attrgetter, itemgetter
+from typing import Any, Iterator, Optional, Sequence
+
+from src.models.job import JobInfo
+from src.models.job_codec import CLIENT_FIELDS, DB_COLUMNS
+
+# カラム名（DB の jobs テーブル・API の案件データ共通）
+COLUMNS: list[str] = [column for column, _ in DB_COLUMNS]
+
+# JobInfo の Enum の属性から作るカラム
+_ENUM_COLUMNS = {"budget_type", "job_type", "status", "source"}
+
+# DB の client_ 付きカラム → ClientInfo / client dict のキー
+_CLIENT_COLUMNS = {f"client_{name}": name for name in CLIENT_FIELDS}
+
+
+def _nested_client(record: dict) -> Optional[dict]:
+    """ネストした client dict（なければ None）"""
+    client = record.get("client")
+    return client if isinstance(client, dict) else None
+
+
+class JobColumns:
+    """jobs テーブルのカラムごとの値の列
+
+    Args:
+        columns: カラム名 → 値のリスト（すべて同じ長さ、COLUMNS の順）
+    """
+
+    def __init__(self, columns: dict[str, list]) -> None:
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def __getitem__(self, column: str) -> list:
+        return self.columns[column]
+
+    @classmethod
+    def from_jobs(cls, jobs: Sequence[JobInfo], category: Optional[str] = None) -> "JobColumns":
+        """JobInfo の一覧から作る
+
+        category には Lancers の検索カテゴリを渡す（None なら "other"）。
+        自動分類カテゴリ（JobInfo.category）は subcategory に入れる。
+        """
+        count = len(jobs)
+        columns: dict[str, list] = {}
+        clients = list(map(attrgetter("client"), jobs))
+        for column in COLUMNS:
+            if column == "category":
+                values = [category or "other"] * count
+            elif column == "subcategory":
+                values = [value.value for value in map(attrgetter("category"), jobs)]
+            elif column in _ENUM_COLUMNS:
+                values = [value.value for value in map(attrgetter(column), jobs)]
+            elif column == "scraped_at":
+                values = [value.isoformat() for value in map(attrgetter("scraped_at"), jobs)]
+            elif column in _CLIENT_COLUMNS:
+                get = attrgetter(_CLIENT_COLUMNS[column])
+                values = [get(client) if client is not None else None for client in clients]
+            else:
+                values = list(map(attrgetter(column), jobs))
+            columns[column] = values
+        return cls(columns)
+
+    @classmethod
+    def from_records(cls, records: Sequence[dict]) -> "JobColumns":
+        """案件 dict（API・スクレイピング結果）または DB レコードの一覧から作る
+
+        クライアント情報はネストした client dict があればそこから、なければ
+        client_ 付きのキーから取る。欠けているキーは DB_COLUMNS のデフォルト値に
+        なり、scraped_at がなければ現在時刻にする。
+        """
+        columns: dict[str, list] = {}
+        clients = list(map(_nested_client, records))
+        now = datetime.now().isoformat()
+        for column, default in DB_COLUMNS:
+            if column in _CLIENT_COLUMNS:
+                key = _CLIENT_COLUMNS[column]
+                values = [
+                    client.get(key) if client is not None else record.get(column)
+                    for client, record in zip(clients, records)
+                ]
+            elif column == "scraped_at":
+                values = [record.get(column, now) for record in records]
+            elif isinstance(default, list):
+                # 行ごとに別のリストにする
+                values = [record[column] if column in record else [] for record in records]
+            else:
+                values = [record.get(column, default) for record in records]
+            columns[column] = values
+        return cls(columns)
+
+    def rows(self) -> Iterator[dict]:
+        """1件ずつの dict（DB レコード・API の案件データ）"""
+        names = list(self.columns)
+        return (dict(zip(names, values)) for values in zip(*self.columns.values()))
+
+    def to_rows(self) -> list[dict]:
+        """dict のリスト（DB レコード・API の案件データ）"""
+        return list(self.rows())
+
+    def filter(self, column: str, predicate: Any = bool) -> "JobColumns":
+        """column の値が predicate を満たす行だけのバッチ"""
+        keep = [index for index, value in enumerate(self.columns[column]) if predicate(value)]
+        if len(keep) == len(self):
+            return self
+        if not keep:
+            return JobColumns({name: [] for name in self.columns})
+        pick = itemgetter(*keep)
+        if len(keep) == 1:
+            return JobColumns({name: [pick(values)] for name, values in self.columns.items()})
+        return JobColumns({name: list(pick(values)) for name, values in self.columns.items()})
@@ -0,0 +1,193 @@
+"""案件データの変換・エンコード
+
+案件のフィールド定義（API 用 dict のキー・DB の jobs テーブルのカラム）を持つ。
+JobInfo → API 用 dict の変換は、定義表から1つの dict リテラルを返す関数として
+生成する（exec）。フィールドごとにループや getattr を回さないため、手書きの変換と
+同じ速さで、フィールドの追加は定義表の1行で済む。DB から読んだレコード →
+API 用 dict の変換も同じく1行ずつの関数として生成する。保存用の DB レコードへの
+変換は job_batch.JobColumns が同じ定義表から行う。
+
+JSON エンコードは orjson がインストールされていれば使い、なければ標準の json を使う。
+"""
+
+import json
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 任意の依存
+    orjson = None
+
+# 値の変換方法
+ATTR = "attr"  # 属性をそのまま
+ENUM = "enum"  # Enum の value
+ISO = "iso"  # datetime の isoformat()
+
+# JobInfo → API 用 dict（JobInfo.to_dict）: (キー, 属性, 変換)
+API_FIELDS: list[tuple[str, str, str]] = [
+    ("title", "title", ATTR),
+    ("description", "description", ATTR),
+    ("category", "category", ENUM),
+    ("budget_type", "budget_type", ENUM),
+    ("job_id", "job_id", ATTR),
+    ("job_type", "job_type", ENUM),
+    ("status", "status", ENUM),
+    ("budget_min", "budget_min", ATTR),
+    ("budget_max", "budget_max", ATTR),
+    ("deadline", "deadline", ATTR),
+    ("remaining_days", "remaining_days", ATTR),
+    ("required_skills", "required_skills", ATTR),
+    ("tags", "tags", ATTR),
+    ("feature_tags", "feature_tags", ATTR),
+    ("proposal_count", "proposal_count", ATTR),
+    ("recruitment_count", "recruitment_count", ATTR),
+    ("source", "source", ENUM),
+    ("url", "url", ATTR),
+    ("client", "client", "client"),
+    ("scraped_at", "scraped_at", ISO),
+]
+
+# ClientInfo のフィールド（API では client の dict、DB では client_ 付きのカラム）
+CLIENT_FIELDS = ["name", "rating", "review_count", "order_history"]
+
+# DB の jobs テーブルのカラム: (カラム, 読み出し時のデフォルト値)
+DB_COLUMNS: list[tuple[str, Any]] = [
+    ("job_id", None),
+    ("title", ""),
+    ("description", ""),
+    ("category", "other"),
+    ("subcategory", None),
+    ("budget_type", "unknown"),
+    ("job_type", "project"),
+    ("status", "open"),
+    ("budget_min", None),
+    ("budget_max", None),
+    ("deadline", None),
+    ("remaining_days", None),
+    ("required_skills", []),
+    ("tags", []),
+    ("feature_tags", []),
+    ("proposal_count", None),
+    ("recruitment_count", None),
+    ("source", "lancers"),
+    ("url", ""),
+    ("client_name", None),
+    ("client_rating", None),
+    ("client_review_count", None),
+    ("client_order_history", None),
+    ("scraped_at", None),
+]
+
+
+def _value_expr(attr: str, kind: str) -> str:
+    if kind == ENUM:
+        return f"job.{attr}.value"
+    if kind == ISO:
+        return f"job.{attr}.isoformat()"
+    return f"job.{attr}"
+
+
+def _compile(name: str, source: str) -> Callable:
+    """生成したソースから関数を作る"""
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<job_codec {name}>", "exec"), namespace)
+    function = namespace[name]
+    function.__source__ = source
+    return function
+
+
+def _build_job_to_api_dict() -> Callable:
+    client_dict = ", ".join(f'"{name}": client.{name}' for name in CLIENT_FIELDS)
+    lines = []
+    for key, attr, kind in API_FIELDS:
+        if kind == "client":
+            expr = f"{{{client_dict}}} if client is not None else None"
+        else:
+            expr = _value_expr(attr, kind)
+        lines.append(f'        "{key}": {expr},')
+    body = "\n".join(lines)
+    source = (
+        "def job_to_api_dict(job):\n"
+        "    client = job.client\n"
+        "    return {\n"
+        f"{body}\n"
+        "    }\n"
+    )
+    return _compile("job_to_api_dict", source)
+
+
+job_to_api_dict: Callable[[Any], dict] = _build_job_to_api_dict()
+job_to_api_dict.__doc__ = "JobInfo を API 用 dict に変換（JobInfo.to_dict）"
+
+
+def _build_db_record_to_job() -> Callable:
+    lines = []
+    for column, default in DB_COLUMNS:
+        if isinstance(default, list):
+            # 行ごとに別のリストにする
+            expr = f'record["{column}"] if "{column}" in record else []'
+        else:
+            expr = f'get("{column}", {default!r})'
+        lines.append(f'        "{column}": {expr},')
+    body = "\n".join(lines)
+    source = (
+        "def db_record_to_job(record):\n"
+        "    get = record.get\n"
+        "    return {\n"
+        f"{body}\n"
+        "    }\n"
+    )
+    return _compile("db_record_to_job", source)
+
+
+db_record_to_job: Callable[[dict], dict] = _build_db_record_to_job()
+db_record_to_job.__doc__ = "DB の jobs テーブルのレコードを API 用 dict に変換（欠けたカラムはデフォルト値）"
+
+
+def db_records_to_jobs(records: Iterable[dict], fields: Optional[Sequence[str]] = None) -> list[dict]:
+    """DB レコードの一覧を API 用 dict に変換（fields 指定時はそのカラムのみ）"""
+    if fields is None:
+        return [db_record_to_job(record) for record in records]
+    defaults = dict(DB_COLUMNS)
+    return [
+        {
+            column: record.get(column, [] if isinstance(defaults[column], list) else defaults[column])
+            for column in fields
+        }
+        for record in records
+    ]
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """JSON にエンコード（UTF-8 のバイト列、日本語はエスケープしない）
+
+    dataclass（JobInfo 等）・Enum・datetime はそのままエンコードでき、
+    その他の型は str() にする。
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        default=_json_default,
+    ).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    """標準 json 用: orjson と同じく dataclass・datetime を変換"""
+    if hasattr(value, "__dataclass_fields__"):
+        return {name: getattr(value, name) for name in value.__dataclass_fields__}
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def loads(data: "bytes | str") -> Any:
+    """JSON をデコード"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
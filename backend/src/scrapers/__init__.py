@@ -1,11 +1,21 @@
 """スクレイピングモジュール"""
 
 from src.scrapers.base import BaseScraper
+from src.scrapers.browser_pool import (
+    BrowserPool,
+    current_browser_pool,
+    get_browser_pool,
+    shutdown_browser_pool,
+)
 from src.scrapers.lancers import LancersScraper
 from src.scrapers.factory import get_scraper, get_supported_services
 
 __all__ = [
     "BaseScraper",
+    "BrowserPool",
+    "current_browser_pool",
+    "get_browser_pool",
+    "shutdown_browser_pool",
     "LancersScraper",
     "get_scraper",
     "get_supported_services",
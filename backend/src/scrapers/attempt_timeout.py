@@ -0,0 +1,94 @@
+"""再試行1回分のタイムアウト（順番待ちの時間を除く）
+
+with_retry は1回の試行を timeout 秒で打ち切る。ブラウザプールの貸し出し待ちと
+ホスト単位のリミッターの待機は、リクエストを送る前の順番待ちで、混雑時ほど長くなる。
+これを試行時間に含めると、何も送らないうちにタイムアウトしてリトライ予算を使ってしまう。
+
+試行を実行するタスクには AttemptClock をコンテキスト変数で渡す。順番待ちをする側は
+waiting() で囲み、囲まれた時間はタイムアウトの計測から除く。試行の外
+（AttemptClock がない場合）では waiting() は何もしない。
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AttemptClock:
+    """1回の試行の経過時間（waiting() の間は止まる）"""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self._started = time.monotonic()
+        self._waited = 0.0
+        self._waiting = 0
+        self._wait_started = 0.0
+
+    def pause(self) -> None:
+        if self._waiting == 0:
+            self._wait_started = time.monotonic()
+        self._waiting += 1
+
+    def resume(self) -> None:
+        self._waiting -= 1
+        if self._waiting == 0:
+            self._waited += time.monotonic() - self._wait_started
+
+    @property
+    def waited(self) -> float:
+        """順番待ちに使った秒数"""
+        if self._waiting:
+            return self._waited + time.monotonic() - self._wait_started
+        return self._waited
+
+    def remaining(self) -> float:
+        """タイムアウトまでの秒数（順番待ちの間は減らない）"""
+        return self.timeout - (time.monotonic() - self._started - self.waited)
+
+
+_current_clock: ContextVar[Optional[AttemptClock]] = ContextVar("attempt_clock", default=None)
+
+
+@asynccontextmanager
+async def waiting() -> AsyncGenerator[None, None]:
+    """囲んだ区間を試行のタイムアウトの計測から除く（リソースの順番待ち用）"""
+    clock = _current_clock.get()
+    if clock is None:
+        yield
+        return
+    clock.pause()
+    try:
+        yield
+    finally:
+        clock.resume()
+
+
+async def run_with_timeout(operation: Callable[[], Awaitable[T]], timeout: float) -> T:
+    """operation を timeout 秒で打ち切って実行（waiting() の時間は含めない）
+
+    Raises:
+        asyncio.TimeoutError: 順番待ちを除いた経過時間が timeout を超えた場合
+    """
+    clock = AttemptClock(timeout)
+    # タスクは作成時のコンテキストを引き継ぐため、作成の間だけ設定する
+    token = _current_clock.set(clock)
+    try:
+        task = asyncio.ensure_future(operation())
+    finally:
+        _current_clock.reset(token)
+
+    try:
+        while not task.done():
+            remaining = clock.remaining()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            await asyncio.wait({task}, timeout=remaining)
+        return task.result()
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
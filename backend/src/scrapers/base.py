@@ -4,19 +4,33 @@ import asyncio
 import random
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Awaitable, Callable, Optional, TypeVar
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import BrowserContext, Page, Response
 
 from src.auth.session import SessionManager
 from src.models.config import ScrapingConfig
 from src.models.job import JobCategory, JobInfo, Service
+from src.scrapers.browser_pool import BrowserPool, get_browser_pool
+from src.scrapers.resource_policy import ResourceBlocker
+from src.scrapers.retry import RetryBudget, with_retry
+from src.scrapers.throttle import (
+    AdaptiveLimiter,
+    get_host_limiter,
+    is_blocked_title,
+    parse_retry_after,
+)
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+T = TypeVar("T")
 
 
 class BaseScraper(ABC):
     """スクレイパーの基底クラス"""
 
     SERVICE: Service
+    BASE_URL: str
     URL_PATTERN: str
 
     # カテゴリ判定キーワード
@@ -80,10 +94,18 @@ class BaseScraper(ABC):
         ],
     }
 
-    def __init__(self, config: ScrapingConfig) -> None:
+    # CATEGORY_KEYWORDS から構築したオートマトン（上書きする場合は両方を定義する）
+    CATEGORY_MATCHER: KeywordMatcher[JobCategory] = KeywordMatcher(
+        (keyword, category)
+        for category, keywords in CATEGORY_KEYWORDS.items()
+        for keyword in keywords
+    )
+
+    def __init__(self, config: ScrapingConfig, retry_budget: Optional[RetryBudget] = None) -> None:
         self.config = config
-        self._browser: Optional[Browser] = None
         self._session_manager = SessionManager()
+        # 1回の実行で共有するリトライ予算（複数のスクレイパーで共有する場合は渡す）
+        self.retry_budget = retry_budget or RetryBudget(config.retry.budget)
 
     @abstractmethod
     async def scrape(self, url: str) -> JobInfo:
@@ -95,42 +117,89 @@ class BaseScraper(ABC):
         """このURLを処理できるか判定"""
         pass
 
+    def _get_pool(self) -> BrowserPool:
+        """共有ブラウザプールを取得"""
+        return get_browser_pool(self.config.pool, headless=self.config.headless)
+
+    def _context_key(self) -> str:
+        """コンテキスト再利用キー（サービス + 保存済みセッションのパス）"""
+        storage_state = self._session_manager.get_storage_state_path(self.SERVICE)
+        return f"{self.SERVICE.value}:{storage_state or ''}"
+
+    def _context_options(self) -> dict:
+        """コンテキスト生成オプション"""
+        return {
+            "viewport": {"width": 1920, "height": 1080},
+            "user_agent": self._get_user_agent(),
+            "locale": "ja-JP",
+            "timezone_id": "Asia/Tokyo",
+            # Cookieを読み込み
+            "storage_state": self._session_manager.get_storage_state_path(self.SERVICE),
+        }
+
+    async def _init_context(self, context: BrowserContext) -> None:
+        """コンテキスト生成時の初期化（不要リソースのブロック）"""
+        await ResourceBlocker(self.config.blocking, self.SERVICE).install(context)
+
     @asynccontextmanager
-    async def _get_browser(self) -> AsyncGenerator[Browser, None]:
-        """ブラウザを取得"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.config.headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                ],
-            )
-            try:
-                yield browser
-            finally:
-                await browser.close()
+    async def _get_context(self) -> AsyncGenerator[BrowserContext, None]:
+        """プールからコンテキストを借りる（セッションがあれば使用）"""
+        async with self._get_pool().context(
+            key=self._context_key(),
+            context_options=self._context_options(),
+            initializer=self._init_context,
+        ) as context:
+            yield context
 
     @asynccontextmanager
     async def _get_page(self) -> AsyncGenerator[Page, None]:
-        """ページを取得（セッションがあれば使用）"""
-        async with self._get_browser() as browser:
-            # 保存済みセッションがあれば使用
-            storage_state = self._session_manager.get_storage_state_path(self.SERVICE)
-
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=self._get_user_agent(),
-                locale="ja-JP",
-                timezone_id="Asia/Tokyo",
-                storage_state=storage_state,  # Cookieを読み込み
+        """プールからページを借りる（セッションがあれば使用）"""
+        async with self._get_pool().page(
+            key=self._context_key(),
+            context_options=self._context_options(),
+            initializer=self._init_context,
+        ) as page:
+            yield page
+
+    def _get_limiter(self) -> AdaptiveLimiter:
+        """サービスのホスト単位の共有リミッターを取得"""
+        return get_host_limiter(self.BASE_URL, self.config.throttle)
+
+    async def _goto(self, page: Page, url: str, timeout: Optional[int] = None) -> Optional[Response]:
+        """リミッターを通してページを開く（ステータスと閲覧制限ページを通知）"""
+        async with self._get_limiter().request() as ticket:
+            response = await page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=timeout or self.config.timeout.page_load,
             )
-            page = await context.new_page()
-            try:
-                yield page
-            finally:
-                await page.close()
-                await context.close()
+            if response is not None:
+                ticket.report(
+                    status=response.status,
+                    blocked=is_blocked_title(await page.title()),
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
+            return response
+
+    async def _with_retry(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        label: str,
+        timeout: Optional[float] = None,
+    ) -> T:
+        """操作を設定（config.retry）に従って再試行付きで実行
+
+        1回の試行は timeout 秒（省略時は config.timeout.operation）で打ち切る。
+        ブラウザプールの貸し出し待ちとリミッターの待機はこの時間に含めない
+        （順番待ちだけでタイムアウトしてリトライ予算を使わないように）。
+        """
+        return await with_retry(
+            operation,
+            self.config.retry,
+            self.retry_budget,
+            label=label,
+            timeout=timeout or self.config.timeout.operation / 1000,
+        )
 
     def is_logged_in(self) -> bool:
         """ログイン済みか確認"""
@@ -145,15 +214,6 @@ class BaseScraper(ABC):
         ]
         return random.choice(user_agents)
 
-    async def _human_like_wait(self) -> None:
-        """人間らしい待機"""
-        if self.config.human_like.enabled:
-            delay = random.uniform(
-                self.config.human_like.min_delay,
-                self.config.human_like.max_delay,
-            )
-            await asyncio.sleep(delay)
-
     async def _human_like_scroll(self, page: Page) -> None:
         """人間らしいスクロール"""
         if not self.config.human_like.enabled:
@@ -182,16 +242,11 @@ class BaseScraper(ABC):
             pass
         return None
 
-    def _categorize(self, text: str) -> JobCategory:
-        """テキストからカテゴリを判定"""
-        text_lower = text.lower()
-        scores: dict[JobCategory, int] = {}
-
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw.lower() in text_lower)
-            if score > 0:
-                scores[category] = score
-
+    @classmethod
+    def _categorize(cls, text: str) -> JobCategory:
+        """テキストからカテゴリを判定（一致したキーワード数が最も多いカテゴリ）"""
+        scores = cls.CATEGORY_MATCHER.count_labels(text)
         if scores:
-            return max(scores, key=lambda k: scores[k])
+            # 同数の場合は CATEGORY_KEYWORDS の定義順で先のカテゴリ
+            return max(cls.CATEGORY_KEYWORDS, key=lambda category: scores.get(category, 0))
         return JobCategory.OTHER
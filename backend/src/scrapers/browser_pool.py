@@ -0,0 +1,435 @@
+"""共有ブラウザプール
+
+Chromium の起動はページ取得より桁違いに重いため、プロセス内で
+Playwright とブラウザを使い回し、スクレイパーはコンテキストを借りて使う。
+
+- ブラウザを N 個起動し、それぞれ最大 M 個のコンテキストを保持
+- 同じ storage_state（Cookie）のコンテキストを優先して再利用
+- K 回ナビゲーションしたコンテキストは破棄して作り直す
+- 切断されたブラウザは次回貸し出し時に再起動
+- 接続したまま応答しなくなったブラウザは死活検査で見つけて再起動する
+  （health_check_interval 秒ごとに、空いているブラウザでコンテキストを
+  開閉できるかを health_check_timeout 秒以内で確かめる）
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Frame,
+    Page,
+    Playwright,
+    async_playwright,
+)
+
+from src.models.config import BrowserPoolConfig
+from src.scrapers.attempt_timeout import waiting
+
+
+# コンテキスト生成直後に呼ばれるフック（ルーティング設定など）
+ContextInitializer = Callable[[BrowserContext], Awaitable[None]]
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+]
+
+
+@dataclass
+class _ContextSlot:
+    """プール内のコンテキスト"""
+
+    context: BrowserContext
+    key: Optional[str]
+    navigations: int = 0
+    in_use: bool = False
+    broken: bool = False
+
+
+@dataclass
+class _BrowserSlot:
+    """プール内のブラウザ"""
+
+    browser: Browser
+    contexts: list[_ContextSlot] = field(default_factory=list)
+    launches: int = 1
+    healthy: bool = True
+    last_checked: Optional[float] = None
+    last_error: Optional[str] = None
+
+    @property
+    def idle(self) -> bool:
+        """貸し出し中のコンテキストがないか"""
+        return not any(slot.in_use for slot in self.contexts)
+
+
+class BrowserPool:
+    """プロセス共有のブラウザプール"""
+
+    def __init__(self, config: BrowserPoolConfig, headless: bool = True) -> None:
+        self.config = config
+        self.headless = headless
+        self._playwright: Optional[Playwright] = None
+        self._browsers: list[_BrowserSlot] = []
+        self._lock = asyncio.Lock()
+        self._capacity = asyncio.Semaphore(self.capacity)
+        self._closed = False
+        self._health_task: Optional[asyncio.Task] = None
+        self._last_health_check: Optional[float] = None
+        self._stats = {
+            "leases": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "browsers_launched": 0,
+            "browsers_relaunched": 0,
+            "health_checks": 0,
+            "health_check_failures": 0,
+        }
+
+    @property
+    def capacity(self) -> int:
+        """同時に貸し出せるコンテキスト数"""
+        return max(1, self.config.browsers) * max(1, self.config.contexts_per_browser)
+
+    async def _launch_browser(self) -> Browser:
+        """ブラウザを起動"""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=LAUNCH_ARGS,
+        )
+        self._stats["browsers_launched"] += 1
+        return browser
+
+    async def _relaunch(self, slot: _BrowserSlot) -> None:
+        """ブラウザを閉じて起動し直す（貸し出し中のコンテキストは返却時に破棄）"""
+        # 空きコンテキストはブラウザと一緒に閉じる
+        for context_slot in slot.contexts:
+            if context_slot.in_use:
+                context_slot.broken = True
+            else:
+                self._stats["contexts_recycled"] += 1
+        slot.contexts = []
+        try:
+            await asyncio.wait_for(slot.browser.close(), self.config.health_check_timeout)
+        except Exception:
+            pass
+        slot.browser = await self._launch_browser()
+        slot.launches += 1
+        slot.healthy = True
+        self._stats["browsers_relaunched"] += 1
+
+    async def _ensure_browsers(self) -> None:
+        """ブラウザ数を設定値まで揃え、切断されたものは再起動"""
+        for slot in self._browsers:
+            if not slot.browser.is_connected():
+                print("ブラウザの切断を検知したため再起動します")
+                await self._relaunch(slot)
+
+        while len(self._browsers) < max(1, self.config.browsers):
+            self._browsers.append(_BrowserSlot(browser=await self._launch_browser()))
+
+    async def _probe(self, slot: _BrowserSlot) -> Optional[str]:
+        """コンテキストを開閉できるか確かめる（失敗時はその理由）"""
+        timeout = self.config.health_check_timeout
+        if not slot.browser.is_connected():
+            return "切断"
+        try:
+            context = await asyncio.wait_for(slot.browser.new_context(), timeout)
+            await asyncio.wait_for(context.close(), timeout)
+        except asyncio.TimeoutError:
+            return f"{timeout}秒以内に応答なし"
+        except Exception as e:
+            return str(e) or type(e).__name__
+        return None
+
+    async def health_check(self) -> dict:
+        """空いているブラウザを検査し、応答しないものを再起動して状態を返す
+
+        貸し出し中のブラウザは使用中のスクレイパーの邪魔をしないよう検査しない
+        （切断されていれば再起動する）。
+        """
+        async with self._lock:
+            if self._closed or not self._browsers:
+                return self.stats()
+
+            self._stats["health_checks"] += 1
+            self._last_health_check = time.time()
+            for slot in self._browsers:
+                if not slot.idle and slot.browser.is_connected():
+                    continue
+                error = await self._probe(slot)
+                slot.last_checked = time.time()
+                slot.last_error = error
+                slot.healthy = error is None
+                if error is None:
+                    continue
+                self._stats["health_check_failures"] += 1
+                print(f"ブラウザの死活検査に失敗したため再起動します: {error}")
+                try:
+                    await self._relaunch(slot)
+                except Exception as e:
+                    print(f"ブラウザの再起動に失敗しました: {e}")
+        return self.stats()
+
+    def _start_health_checks(self) -> None:
+        """定期的な死活検査を開始（無効または開始済みなら何もしない）"""
+        if self.config.health_check_interval <= 0 or self._health_task is not None:
+            return
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.config.health_check_interval)
+            try:
+                await self.health_check()
+            except Exception as e:
+                print(f"ブラウザの死活検査エラー: {e}")
+
+    async def _acquire_slot(
+        self,
+        key: Optional[str],
+        context_options: dict[str, Any],
+        initializer: Optional[ContextInitializer],
+    ) -> _ContextSlot:
+        """空きコンテキストを確保（なければ作成）"""
+        async with self._lock:
+            if self._closed:
+                raise RuntimeError("BrowserPool is closed")
+
+            await self._ensure_browsers()
+            self._start_health_checks()
+
+            # 1. 同じキーの空きコンテキストを再利用
+            for browser_slot in self._browsers:
+                for slot in browser_slot.contexts:
+                    if not slot.in_use and slot.key == key:
+                        slot.in_use = True
+                        return slot
+
+            # 2. 枠に余裕があるブラウザで新規作成（最も空いているものを選ぶ）
+            browser_slot = min(self._browsers, key=lambda b: len(b.contexts))
+            if len(browser_slot.contexts) >= max(1, self.config.contexts_per_browser):
+                # 3. 別キーの空きコンテキストを破棄して枠を空ける
+                browser_slot, victim = self._find_idle_slot()
+                browser_slot.contexts.remove(victim)
+                await self._close_context(victim)
+
+            context = await browser_slot.browser.new_context(**context_options)
+            if initializer is not None:
+                await initializer(context)
+            slot = _ContextSlot(context=context, key=key, in_use=True)
+            browser_slot.contexts.append(slot)
+            self._stats["contexts_created"] += 1
+            return slot
+
+    def _find_idle_slot(self) -> tuple[_BrowserSlot, _ContextSlot]:
+        """空きコンテキストを探す（セマフォにより必ず存在する）"""
+        for browser_slot in self._browsers:
+            for slot in browser_slot.contexts:
+                if not slot.in_use:
+                    return browser_slot, slot
+        raise RuntimeError("BrowserPool has no idle context")
+
+    async def _release_slot(self, slot: _ContextSlot) -> None:
+        """コンテキストを返却（上限到達・異常時は破棄）"""
+        async with self._lock:
+            slot.in_use = False
+            expired = slot.navigations >= max(1, self.config.max_navigations)
+            if not (expired or slot.broken or self._closed):
+                return
+
+            for browser_slot in self._browsers:
+                if slot in browser_slot.contexts:
+                    browser_slot.contexts.remove(slot)
+                    break
+            await self._close_context(slot)
+
+    async def _close_context(self, slot: _ContextSlot) -> None:
+        """コンテキストを閉じる"""
+        self._stats["contexts_recycled"] += 1
+        try:
+            await asyncio.wait_for(slot.context.close(), self.config.health_check_timeout)
+        except Exception:
+            pass
+
+    def _track_navigations(self, page: Page, slot: _ContextSlot) -> None:
+        """メインフレームの遷移回数を数える"""
+
+        def on_navigated(frame: Frame) -> None:
+            if frame == page.main_frame:
+                slot.navigations += 1
+
+        page.on("framenavigated", on_navigated)
+
+    @asynccontextmanager
+    async def context(
+        self,
+        key: Optional[str] = None,
+        context_options: Optional[dict[str, Any]] = None,
+        initializer: Optional[ContextInitializer] = None,
+    ) -> AsyncGenerator[BrowserContext, None]:
+        """コンテキストを借りる
+
+        Args:
+            key: コンテキストの再利用キー（storage_state のパス等）
+            context_options: browser.new_context() に渡すオプション
+            initializer: コンテキスト生成直後に一度だけ呼ぶフック
+
+        空き待ち・コンテキストの確保にかかる時間は再試行のタイムアウトに含めない。
+        """
+        async with waiting():
+            await self._capacity.acquire()
+        try:
+            async with waiting():
+                slot = await self._acquire_slot(key, context_options or {}, initializer)
+            self._stats["leases"] += 1
+            try:
+                yield slot.context
+            except GeneratorExit:
+                # 非同期ジェネレータ内で借りたまま途中終了した場合（正常終了扱い）
+                raise
+            except BaseException:
+                # 失敗したコンテキストは状態が不明なので作り直す
+                slot.broken = True
+                raise
+            finally:
+                await self._release_slot(slot)
+        finally:
+            self._capacity.release()
+
+    @asynccontextmanager
+    async def page(
+        self,
+        key: Optional[str] = None,
+        context_options: Optional[dict[str, Any]] = None,
+        initializer: Optional[ContextInitializer] = None,
+    ) -> AsyncGenerator[Page, None]:
+        """ページを借りる（コンテキストはプールに返却される）"""
+        async with self.context(key, context_options, initializer) as context:
+            page = await self.new_page(context)
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    async def new_page(self, context: BrowserContext) -> Page:
+        """借りているコンテキストに新しいタブを開く"""
+        page = await context.new_page()
+        for browser_slot in self._browsers:
+            for slot in browser_slot.contexts:
+                if slot.context is context:
+                    self._track_navigations(page, slot)
+        return page
+
+    def stats(self) -> dict:
+        """プールの状態"""
+        return {
+            **self._stats,
+            "browsers": len(self._browsers),
+            "contexts": sum(len(b.contexts) for b in self._browsers),
+            "contexts_in_use": sum(
+                1 for b in self._browsers for c in b.contexts if c.in_use
+            ),
+            "capacity": self.capacity,
+            "closed": self._closed,
+            "browsers_healthy": sum(1 for b in self._browsers if b.healthy),
+            "last_health_check": self._last_health_check,
+            "browser_health": [
+                {
+                    "healthy": b.healthy,
+                    "launches": b.launches,
+                    "last_checked": b.last_checked,
+                    "last_error": b.last_error,
+                }
+                for b in self._browsers
+            ],
+        }
+
+    async def close(self) -> None:
+        """全ブラウザと Playwright を終了"""
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        async with self._lock:
+            self._closed = True
+            for browser_slot in self._browsers:
+                for slot in browser_slot.contexts:
+                    await self._close_context(slot)
+                try:
+                    await asyncio.wait_for(
+                        browser_slot.browser.close(), self.config.health_check_timeout
+                    )
+                except Exception:
+                    pass
+            self._browsers = []
+
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception:
+                    pass
+                self._playwright = None
+
+
+# プロセス共有インスタンス（イベントループごと）
+_pool: Optional[BrowserPool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_browser_pool(
+    config: Optional[BrowserPoolConfig] = None,
+    headless: bool = True,
+) -> BrowserPool:
+    """共有ブラウザプールを取得（初回呼び出し時の設定で生成）
+
+    Raises:
+        RuntimeError: 別のイベントループで作ったプールが終了されていない場合
+    """
+    global _pool, _pool_loop
+
+    loop = asyncio.get_running_loop()
+    if _pool is not None and not _pool._closed and _pool_loop is not loop:
+        # 別ループのブラウザはこのループから閉じられないため、置き換えると
+        # Chromium のプロセスが残る。ループごとに shutdown_browser_pool() で終了する
+        raise RuntimeError(
+            "BrowserPool is bound to another event loop; "
+            "call shutdown_browser_pool() before the loop exits"
+        )
+    if _pool is None or _pool._closed:
+        _pool = BrowserPool(config or BrowserPoolConfig(), headless=headless)
+        _pool_loop = loop
+    return _pool
+
+
+def current_browser_pool() -> Optional[BrowserPool]:
+    """このイベントループで動いている共有ブラウザプール（なければ None、生成はしない）"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    if _pool is None or _pool._closed or _pool_loop is not loop:
+        return None
+    return _pool
+
+
+async def shutdown_browser_pool() -> None:
+    """共有ブラウザプールを終了（FastAPI lifespan / CLI 終了時に呼ぶ）"""
+    global _pool, _pool_loop
+
+    pool = _pool
+    _pool = None
+    _pool_loop = None
+    if pool is not None:
+        await pool.close()
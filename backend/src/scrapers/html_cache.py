@@ -0,0 +1,234 @@
+"""取得済みHTMLのディスクキャッシュ
+
+URL の SHA-256 をキーに、gzip 圧縮した HTML と取得時刻・ETag・Last-Modified を
+1ファイルに保存する。TTL 内のエントリはネットワークを使わずに返し、TTL を過ぎた
+エントリは ETag / Last-Modified による条件付き再取得に使う。合計サイズが上限を
+超えたら、最後に参照された時刻（ファイルの mtime）が古い順に削除する（LRU）。
+
+ファイル操作は同期処理なので、イベントループからは asyncio.to_thread で呼ぶ。
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.models.config import CacheConfig
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "output" / "html_cache"
+
+# 上限を超えたときに、この割合まで削除する（削除が毎回走らないように余裕を持たせる）
+EVICT_TARGET_RATIO = 0.9
+
+_SUFFIX = ".json.gz"
+
+
+@dataclass
+class CachedPage:
+    """キャッシュされたページ"""
+
+    url: str
+    html: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def age(self) -> float:
+        """取得からの経過秒数"""
+        return time.time() - self.fetched_at
+
+    def validators(self) -> dict[str, str]:
+        """条件付き再取得用のリクエストヘッダー"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HtmlCache:
+    """URL単位の圧縮HTMLキャッシュ"""
+
+    def __init__(self, directory: Path, ttl: float, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+        # 統計
+        self.hits = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / key[:2] / f"{key}{_SUFFIX}"
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """TTL 内のエントリか"""
+        return page.age < self.ttl
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """キャッシュを取得（期限切れでも返す。鮮度は is_fresh で判定）"""
+        path = self._path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            # 書き込み途中で落ちた等の壊れたファイルは捨てる
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        if data.get("url") != url:
+            self.misses += 1
+            return None
+
+        # 参照時刻を更新（LRU の順序に使う）
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        page = CachedPage(
+            url=url,
+            html=data["html"],
+            fetched_at=data["fetched_at"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+        )
+        # 期限切れは再取得が必要なのでヒットに数えない
+        if self.is_fresh(page):
+            self.hits += 1
+        else:
+            self.stale += 1
+        return page
+
+    def put(
+        self,
+        url: str,
+        html: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedPage:
+        """HTMLを保存（同じURLのエントリは置き換える）"""
+        page = CachedPage(
+            url=url,
+            html=html,
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        payload = json.dumps(
+            {
+                "url": url,
+                "fetched_at": page.fetched_at,
+                "etag": etag,
+                "last_modified": last_modified,
+                "html": html,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        data = gzip.compress(payload, compresslevel=6)
+
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self.stores += 1
+            self._total_bytes = self._current_total() - old_size + len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return page
+
+    def refresh(self, page: CachedPage) -> CachedPage:
+        """再検証で変更なし（304）だった場合に取得時刻を更新"""
+        self.revalidated += 1
+        return self.put(page.url, page.html, page.etag, page.last_modified)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """全エントリの (最終参照時刻, サイズ, パス)"""
+        entries = []
+        for path in self.directory.glob(f"*/*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _current_total(self) -> int:
+        """合計サイズ（初回のみディレクトリを走査）"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        """最終参照が古い順に削除して上限の EVICT_TARGET_RATIO 以下にする"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        for _, size, path in entries:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+                self.evictions += 1
+        self._total_bytes = total
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "stale": self.stale,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bytes": self._current_total(),
+        }
+
+
+_caches: dict[Path, HtmlCache] = {}
+
+
+def get_html_cache(config: CacheConfig) -> Optional[HtmlCache]:
+    """共有キャッシュを取得（無効なら None、ディレクトリごとに初回の設定で生成）"""
+    if not config.enabled:
+        return None
+
+    directory = Path(config.directory).expanduser() if config.directory else DEFAULT_CACHE_DIR
+    cache = _caches.get(directory)
+    if cache is None:
+        cache = HtmlCache(
+            directory,
+            ttl=config.ttl_hours * 3600,
+            max_bytes=int(config.max_mb * 1024 * 1024),
+        )
+        _caches[directory] = cache
+    return cache
@@ -0,0 +1,85 @@
+"""共有HTTPクライアント
+
+ブラウザを使わずに取得できるページ用に、接続プール付きの
+httpx.AsyncClient をセッション（storage_state）ごとに使い回す。
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+# 同一ホストへの同時接続数
+MAX_CONNECTIONS = 10
+
+_clients: dict[Optional[str], httpx.AsyncClient] = {}
+_clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _build_cookies(cookies: list[dict]) -> httpx.Cookies:
+    """Playwright の storage_state 形式のCookieを httpx.Cookies に変換"""
+    jar = httpx.Cookies()
+    for cookie in cookies:
+        name = cookie.get("name")
+        if not name:
+            continue
+        jar.set(
+            name,
+            cookie.get("value", ""),
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+    return jar
+
+
+def get_http_client(
+    key: Optional[str],
+    cookies: list[dict],
+    user_agent: str,
+    timeout: float = 30.0,
+) -> httpx.AsyncClient:
+    """共有HTTPクライアントを取得（key ごとに初回呼び出し時の設定で生成）
+
+    Args:
+        key: クライアントの再利用キー（storage_state のパス等）
+        cookies: storage_state 形式のCookie一覧
+        user_agent: User-Agent
+        timeout: タイムアウト（秒）
+    """
+    global _clients, _clients_loop
+
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        # asyncio.run() ごとにループが変わるため、別ループのクライアントは使えない
+        _clients = {}
+        _clients_loop = loop
+
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            cookies=_build_cookies(cookies),
+            headers={
+                "User-Agent": user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "ja-JP,ja;q=0.9",
+            },
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+            ),
+        )
+        _clients[key] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """共有HTTPクライアントをすべて閉じる"""
+    global _clients, _clients_loop
+
+    clients = list(_clients.values())
+    _clients = {}
+    _clients_loop = None
+    for client in clients:
+        await client.aclose()
@@ -1,17 +1,21 @@
 """Lancersスクレイパーパッケージ"""
 
 from .scraper import LancersScraper
+from .http_scraper import LancersHttpScraper
 from .constants import SERVICE, BASE_URL, CATEGORY_SLUGS
 from . import url_utils
 from . import card_parser
 from . import detail_parser
+from . import html_parser
 
 __all__ = [
     "LancersScraper",
+    "LancersHttpScraper",
     "SERVICE",
     "BASE_URL",
     "CATEGORY_SLUGS",
     "url_utils",
     "card_parser",
     "detail_parser",
+    "html_parser",
 ]
@@ -1,7 +1,7 @@
 """Lancers案件カードパーサー"""
 
 import re
-from typing import Optional
+from typing import Callable, Optional
 
 from playwright.async_api import Page, ElementHandle
 
@@ -13,43 +13,152 @@ from src.models.job import (
     JobStatus,
     JobType,
 )
-from src.scrapers.base import BaseScraper
 from .constants import BASE_URL, SERVICE
 from .url_utils import extract_job_id_from_onclick
 
 
-async def parse_job_card(
-    card: ElementHandle,
+CARD_SELECTOR = ".p-search-job-media"
+
+# 全カードの生データを1回の evaluate で取得するスクリプト
+# （キーは build_job_from_card_data が受け取る dict と対応）
+CARD_EXTRACT_SCRIPT = """
+(cards) => cards.map((card) => {
+  const q = (sel) => card.querySelector(sel);
+  const qa = (sel) => Array.from(card.querySelectorAll(sel));
+  const text = (el) => (el ? el.innerText : null);
+  const href = (el) => (el ? el.getAttribute("href") : null);
+  const titleLink = q(".p-search-job-media__title");
+  let workType = "unknown";
+  if (q(".c-badge--worktype-project")) workType = "project";
+  else if (q(".c-badge--worktype-task")) workType = "task";
+  else if (q(".c-badge--worktype-competition")) workType = "competition";
+  return {
+    onclick: card.getAttribute("onclick"),
+    title_href: href(titleLink),
+    detail_href: href(q("a[href*='/work/detail/']")),
+    title: text(titleLink),
+    tags_text: text(q(".p-search-job-media__tags")),
+    status_text: text(q(".p-search-job-media__time-text")),
+    remaining_text: text(q(".p-search-job-media__time-remaining")),
+    tags: qa(".p-search-job-media__tag").map(text),
+    job_type: workType,
+    prices: qa(".p-search-job-media__number").map(text),
+    feature_tags: qa(".p-search-job-media__tag-list").map(text),
+    propose_numbers: qa(".p-search-job-media__propose-number").map(text),
+    client_name: text(q(".p-search-job-media__avatar-note a")),
+    client_subnotes: qa(".p-search-job-media__avatar-subnote").map(text),
+  };
+})
+"""
+
+
+async def parse_job_cards(
     page: Page,
-    categorize_fn,
+    categorize_fn: Callable[[str], JobCategory],
+    max_items: int = 50,
+) -> list[JobInfo]:
+    """一覧ページの全案件カードを解析
+
+    1回の evaluate で全カードの生データを取得し、Python側で JobInfo に変換する。
+    スクリプトが失敗した場合は要素ごとの取得にフォールバックする。
+    """
+    try:
+        cards_data = await page.eval_on_selector_all(CARD_SELECTOR, CARD_EXTRACT_SCRIPT)
+    except Exception as e:
+        print(f"一括抽出に失敗したため要素ごとに解析します: {e}")
+        return await _parse_job_cards_per_element(page, categorize_fn, max_items)
+
+    jobs = []
+    for data in cards_data[:max_items]:
+        try:
+            job = build_job_from_card_data(data, categorize_fn)
+            if job:
+                jobs.append(job)
+        except Exception:
+            continue
+    return jobs
+
+
+async def _parse_job_cards_per_element(
+    page: Page,
+    categorize_fn: Callable[[str], JobCategory],
+    max_items: int,
+) -> list[JobInfo]:
+    """要素ごとに案件カードを解析（フォールバック）"""
+    job_cards = await page.query_selector_all(CARD_SELECTOR)
+    jobs = []
+    for card in job_cards[:max_items]:
+        try:
+            job = await parse_job_card(card, page, categorize_fn)
+            if job:
+                jobs.append(job)
+        except Exception:
+            continue
+    return jobs
+
+
+def build_job_from_card_data(
+    data: dict,
+    categorize_fn: Callable[[str], JobCategory],
 ) -> Optional[JobInfo]:
-    """案件カードから情報を抽出"""
-    # 案件ID取得
-    job_id = await _extract_card_job_id(card)
+    """カードの生データ（CARD_EXTRACT_SCRIPT の戻り値）から JobInfo を構築"""
+    job_id = (
+        extract_job_id_from_onclick(data.get("onclick") or "")
+        or _job_id_from_href(data.get("title_href"))
+        or _job_id_from_href(data.get("detail_href"))
+    )
     if not job_id:
         return None
 
-    job_url = f"{BASE_URL}/work/detail/{job_id}"
+    title = _strip_tags_from_title(data.get("title") or "", data.get("tags_text"))
+    budget_min, budget_max = _parse_prices(data.get("prices") or [])
+    proposal_count, recruitment_count = _parse_counts(data.get("propose_numbers") or [])
+    client_name = data.get("client_name")
 
-    # 各種情報を抽出
-    title = await _extract_card_title(card)
-    status = await _extract_card_status(card)
-    remaining_days = await _extract_card_remaining_days(card)
-    tags = await _extract_card_tags(card)
-    job_type = await _extract_card_job_type(card)
-    budget_min, budget_max = await _extract_card_budget(card)
-    feature_tags = await _extract_card_feature_tags(card)
-    proposal_count, recruitment_count = await _extract_card_counts(card)
-    client = await _extract_card_client(card)
-    category = categorize_fn(title)
+    return _build_job_info(
+        job_id=job_id,
+        title=title,
+        status=_parse_status(data.get("status_text")),
+        remaining_days=_parse_remaining_days(data.get("remaining_text")),
+        tags=_clean_texts(data.get("tags") or []),
+        job_type=JobType(data.get("job_type") or "unknown"),
+        budget_min=budget_min,
+        budget_max=budget_max,
+        feature_tags=_clean_texts(data.get("feature_tags") or []),
+        proposal_count=proposal_count,
+        recruitment_count=recruitment_count,
+        client=(
+            _parse_client(client_name, data.get("client_subnotes") or [])
+            if client_name is not None
+            else None
+        ),
+        category=categorize_fn(title),
+    )
 
+
+def _build_job_info(
+    job_id: str,
+    title: str,
+    status: JobStatus,
+    remaining_days: Optional[int],
+    tags: list[str],
+    job_type: JobType,
+    budget_min: Optional[int],
+    budget_max: Optional[int],
+    feature_tags: list[str],
+    proposal_count: Optional[int],
+    recruitment_count: Optional[int],
+    client: Optional[ClientInfo],
+    category: JobCategory,
+) -> JobInfo:
+    """抽出結果から JobInfo を組み立てる"""
     return JobInfo(
         title=title,
         description="",
         category=category,
         budget_type=BudgetType.FIXED if job_type == JobType.PROJECT else BudgetType.UNKNOWN,
         source=SERVICE,
-        url=job_url,
+        url=f"{BASE_URL}/work/detail/{job_id}",
         job_id=job_id,
         job_type=job_type,
         status=status,
@@ -64,57 +173,31 @@ async def parse_job_card(
     )
 
 
-async def _extract_card_job_id(card: ElementHandle) -> Optional[str]:
-    """カードから案件IDを抽出"""
-    # 方法1: onclick属性から
-    onclick = await card.get_attribute("onclick")
-    if onclick:
-        job_id = extract_job_id_from_onclick(onclick)
-        if job_id:
-            return job_id
-
-    # 方法2: タイトルリンクから
-    title_link = await card.query_selector(".p-search-job-media__title")
-    if title_link:
-        href = await title_link.get_attribute("href")
-        if href:
-            match = re.search(r'/work/detail/(\d+)', href)
-            if match:
-                return match.group(1)
-
-    # 方法3: 任意のdetailリンクから
-    any_link = await card.query_selector("a[href*='/work/detail/']")
-    if any_link:
-        href = await any_link.get_attribute("href")
-        if href:
-            match = re.search(r'/work/detail/(\d+)', href)
-            if match:
-                return match.group(1)
+# =============================================================================
+# テキスト解析（一括抽出・要素ごと抽出で共通）
+# =============================================================================
 
+def _job_id_from_href(href: Optional[str]) -> Optional[str]:
+    """リンクのhrefから案件IDを抽出"""
+    if href:
+        match = re.search(r'/work/detail/(\d+)', href)
+        if match:
+            return match.group(1)
     return None
 
 
-async def _extract_card_title(card: ElementHandle) -> str:
-    """カードからタイトルを抽出"""
-    title_el = await card.query_selector(".p-search-job-media__title")
-    title = await title_el.inner_text() if title_el else ""
+def _strip_tags_from_title(title: str, tags_text: Optional[str]) -> str:
+    """タイトルに含まれるタグ文字列を除去"""
     title = title.strip()
-
-    # タグを除去
-    tags_container = await card.query_selector(".p-search-job-media__tags")
-    if tags_container:
-        tags_text = await tags_container.inner_text()
+    if tags_text:
         for tag in tags_text.split():
             title = title.replace(tag.strip(), "").strip()
-
     return title
 
 
-async def _extract_card_status(card: ElementHandle) -> JobStatus:
-    """カードから募集状態を抽出"""
-    status_el = await card.query_selector(".p-search-job-media__time-text")
-    if status_el:
-        status_text = await status_el.inner_text()
+def _parse_status(status_text: Optional[str]) -> JobStatus:
+    """募集状態テキストを解析"""
+    if status_text:
         if "募集中" in status_text:
             return JobStatus.OPEN
         elif "終了" in status_text or "締切" in status_text:
@@ -122,46 +205,25 @@ async def _extract_card_status(card: ElementHandle) -> JobStatus:
     return JobStatus.UNKNOWN
 
 
-async def _extract_card_remaining_days(card: ElementHandle) -> Optional[int]:
-    """カードから残り日数を抽出"""
-    remaining_el = await card.query_selector(".p-search-job-media__time-remaining")
-    if remaining_el:
-        remaining_text = await remaining_el.inner_text()
+def _parse_remaining_days(remaining_text: Optional[str]) -> Optional[int]:
+    """残り日数テキストを解析"""
+    if remaining_text:
         match = re.search(r"あと(\d+)日", remaining_text)
         if match:
             return int(match.group(1))
     return None
 
 
-async def _extract_card_tags(card: ElementHandle) -> list[str]:
-    """カードからタグを抽出"""
-    tags = []
-    tag_elements = await card.query_selector_all(".p-search-job-media__tag")
-    for tag_el in tag_elements:
-        tag_text = await tag_el.inner_text()
-        if tag_text.strip():
-            tags.append(tag_text.strip())
-    return tags
+def _clean_texts(texts: list[Optional[str]]) -> list[str]:
+    """空でないテキストをstripして返す"""
+    return [text.strip() for text in texts if text and text.strip()]
 
 
-async def _extract_card_job_type(card: ElementHandle) -> JobType:
-    """カードから案件形式を抽出"""
-    if await card.query_selector(".c-badge--worktype-project"):
-        return JobType.PROJECT
-    elif await card.query_selector(".c-badge--worktype-task"):
-        return JobType.TASK
-    elif await card.query_selector(".c-badge--worktype-competition"):
-        return JobType.COMPETITION
-    return JobType.UNKNOWN
-
-
-async def _extract_card_budget(card: ElementHandle) -> tuple[Optional[int], Optional[int]]:
-    """カードから報酬を抽出"""
-    price_numbers = await card.query_selector_all(".p-search-job-media__number")
+def _parse_prices(texts: list[Optional[str]]) -> tuple[Optional[int], Optional[int]]:
+    """報酬の数値テキストを解析"""
     prices = []
-    for price_el in price_numbers:
-        text = await price_el.inner_text()
-        price_text = text.replace(",", "").strip()
+    for text in texts:
+        price_text = (text or "").replace(",", "").strip()
         if price_text.isdigit():
             prices.append(int(price_text))
 
@@ -172,45 +234,27 @@ async def _extract_card_budget(card: ElementHandle) -> tuple[Optional[int], Opti
     return None, None
 
 
-async def _extract_card_feature_tags(card: ElementHandle) -> list[str]:
-    """カードから特徴タグを抽出"""
-    feature_tags = []
-    feature_elements = await card.query_selector_all(".p-search-job-media__tag-list")
-    for feature_el in feature_elements:
-        feature_text = await feature_el.inner_text()
-        if feature_text.strip():
-            feature_tags.append(feature_text.strip())
-    return feature_tags
-
-
-async def _extract_card_counts(card: ElementHandle) -> tuple[Optional[int], Optional[int]]:
-    """カードから提案数・募集人数を抽出"""
+def _parse_counts(texts: list[Optional[str]]) -> tuple[Optional[int], Optional[int]]:
+    """提案数・募集人数テキストを解析"""
     proposal_count = None
     recruitment_count = None
-    propose_numbers = await card.query_selector_all(".p-search-job-media__propose-number")
-    if len(propose_numbers) >= 2:
-        text1 = await propose_numbers[0].inner_text()
-        text2 = await propose_numbers[1].inner_text()
-        if text1.strip().isdigit():
-            proposal_count = int(text1.strip())
-        if text2.strip().isdigit():
-            recruitment_count = int(text2.strip())
+    if len(texts) >= 2:
+        text1 = (texts[0] or "").strip()
+        text2 = (texts[1] or "").strip()
+        if text1.isdigit():
+            proposal_count = int(text1)
+        if text2.isdigit():
+            recruitment_count = int(text2)
     return proposal_count, recruitment_count
 
 
-async def _extract_card_client(card: ElementHandle) -> Optional[ClientInfo]:
-    """カードからクライアント情報を抽出"""
-    client_name_el = await card.query_selector(".p-search-job-media__avatar-note a")
-    if not client_name_el:
-        return None
-
-    client_name = await client_name_el.inner_text()
+def _parse_client(client_name: str, subnotes: list[Optional[str]]) -> ClientInfo:
+    """クライアント名・補足テキストを解析"""
     order_count = None
     rating = None
 
-    subnotes = await card.query_selector_all(".p-search-job-media__avatar-subnote")
-    for subnote in subnotes:
-        text = await subnote.inner_text()
+    for text in subnotes:
+        text = text or ""
         if "発注" in text:
             match = re.search(r"(\d+)", text)
             if match:
@@ -225,3 +269,133 @@ async def _extract_card_client(card: ElementHandle) -> Optional[ClientInfo]:
         rating=rating,
         order_history=order_count,
     )
+
+
+# =============================================================================
+# 要素ごとの抽出（フォールバック）
+# =============================================================================
+
+async def parse_job_card(
+    card: ElementHandle,
+    page: Page,
+    categorize_fn,
+) -> Optional[JobInfo]:
+    """案件カードから情報を抽出（要素ごとに取得）"""
+    # 案件ID取得
+    job_id = await _extract_card_job_id(card)
+    if not job_id:
+        return None
+
+    # 各種情報を抽出
+    title = await _extract_card_title(card)
+    budget_min, budget_max = await _extract_card_budget(card)
+    proposal_count, recruitment_count = await _extract_card_counts(card)
+
+    return _build_job_info(
+        job_id=job_id,
+        title=title,
+        status=await _extract_card_status(card),
+        remaining_days=await _extract_card_remaining_days(card),
+        tags=await _extract_card_tags(card),
+        job_type=await _extract_card_job_type(card),
+        budget_min=budget_min,
+        budget_max=budget_max,
+        feature_tags=await _extract_card_feature_tags(card),
+        proposal_count=proposal_count,
+        recruitment_count=recruitment_count,
+        client=await _extract_card_client(card),
+        category=categorize_fn(title),
+    )
+
+
+async def _inner_texts(card: ElementHandle, selector: str) -> list[str]:
+    """セレクタに一致する全要素のテキストを取得"""
+    return [await el.inner_text() for el in await card.query_selector_all(selector)]
+
+
+async def _inner_text(card: ElementHandle, selector: str) -> Optional[str]:
+    """セレクタに一致する最初の要素のテキストを取得"""
+    el = await card.query_selector(selector)
+    return await el.inner_text() if el else None
+
+
+async def _extract_card_job_id(card: ElementHandle) -> Optional[str]:
+    """カードから案件IDを抽出"""
+    # 方法1: onclick属性から
+    onclick = await card.get_attribute("onclick")
+    if onclick:
+        job_id = extract_job_id_from_onclick(onclick)
+        if job_id:
+            return job_id
+
+    # 方法2: タイトルリンク → 方法3: 任意のdetailリンクから
+    for selector in [".p-search-job-media__title", "a[href*='/work/detail/']"]:
+        link = await card.query_selector(selector)
+        if link:
+            job_id = _job_id_from_href(await link.get_attribute("href"))
+            if job_id:
+                return job_id
+
+    return None
+
+
+async def _extract_card_title(card: ElementHandle) -> str:
+    """カードからタイトルを抽出"""
+    title = await _inner_text(card, ".p-search-job-media__title") or ""
+    tags_text = await _inner_text(card, ".p-search-job-media__tags")
+    return _strip_tags_from_title(title, tags_text)
+
+
+async def _extract_card_status(card: ElementHandle) -> JobStatus:
+    """カードから募集状態を抽出"""
+    return _parse_status(await _inner_text(card, ".p-search-job-media__time-text"))
+
+
+async def _extract_card_remaining_days(card: ElementHandle) -> Optional[int]:
+    """カードから残り日数を抽出"""
+    return _parse_remaining_days(
+        await _inner_text(card, ".p-search-job-media__time-remaining")
+    )
+
+
+async def _extract_card_tags(card: ElementHandle) -> list[str]:
+    """カードからタグを抽出"""
+    return _clean_texts(await _inner_texts(card, ".p-search-job-media__tag"))
+
+
+async def _extract_card_job_type(card: ElementHandle) -> JobType:
+    """カードから案件形式を抽出"""
+    if await card.query_selector(".c-badge--worktype-project"):
+        return JobType.PROJECT
+    elif await card.query_selector(".c-badge--worktype-task"):
+        return JobType.TASK
+    elif await card.query_selector(".c-badge--worktype-competition"):
+        return JobType.COMPETITION
+    return JobType.UNKNOWN
+
+
+async def _extract_card_budget(card: ElementHandle) -> tuple[Optional[int], Optional[int]]:
+    """カードから報酬を抽出"""
+    return _parse_prices(await _inner_texts(card, ".p-search-job-media__number"))
+
+
+async def _extract_card_feature_tags(card: ElementHandle) -> list[str]:
+    """カードから特徴タグを抽出"""
+    return _clean_texts(await _inner_texts(card, ".p-search-job-media__tag-list"))
+
+
+async def _extract_card_counts(card: ElementHandle) -> tuple[Optional[int], Optional[int]]:
+    """カードから提案数・募集人数を抽出"""
+    return _parse_counts(
+        await _inner_texts(card, ".p-search-job-media__propose-number")
+    )
+
+
+async def _extract_card_client(card: ElementHandle) -> Optional[ClientInfo]:
+    """カードからクライアント情報を抽出"""
+    client_name = await _inner_text(card, ".p-search-job-media__avatar-note a")
+    if client_name is None:
+        return None
+
+    subnotes = await _inner_texts(card, ".p-search-job-media__avatar-subnote")
+    return _parse_client(client_name, subnotes)
@@ -7,6 +7,9 @@ URL_PATTERN = r"lancers\.jp/work/detail/(\d+)"
 LIST_URL_PATTERN = r"lancers\.jp/work/search"
 BASE_URL = "https://www.lancers.jp"
 
+# 検索結果1ページあたりの件数（これ未満なら最終ページ）
+SEARCH_PAGE_SIZE = 20
+
 # カテゴリマッピング
 CATEGORY_SLUGS = {
     "system": "system",
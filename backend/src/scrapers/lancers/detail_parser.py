@@ -5,8 +5,19 @@ from typing import Optional
 
 from playwright.async_api import Page
 
-from src.models.job import BudgetType
-from .constants import SKILL_KEYWORDS
+from src.models.job import (
+    BudgetType,
+    ClientInfo,
+    JobCategory,
+    JobInfo,
+    JobStatus,
+    JobType,
+)
+from src.utils.keyword_matcher import KeywordMatcher
+from .constants import SERVICE, SKILL_KEYWORDS
+
+# スキルキーワードのオートマトン（説明文を1回走査して全スキルを検出）
+SKILL_MATCHER: KeywordMatcher[str] = KeywordMatcher((skill, skill) for skill in SKILL_KEYWORDS)
 
 
 async def extract_title(page: Page) -> str:
@@ -119,14 +130,55 @@ async def extract_client_info(page: Page) -> tuple[Optional[str], Optional[int],
 
 async def extract_skills(page: Page, description: str) -> list[str]:
     """必要スキルを抽出"""
-    skills = []
-    desc_lower = description.lower()
-
-    for skill in SKILL_KEYWORDS:
-        if skill.lower() in desc_lower:
-            skills.append(skill)
-
-    return skills
+    return match_skills(description)
+
+
+def match_skills(description: str) -> list[str]:
+    """説明文に含まれるスキルキーワードを抽出（SKILL_KEYWORDS の順）"""
+    return SKILL_MATCHER.find(description)
+
+
+def build_detail_job(
+    url: str,
+    job_id: str,
+    title: str,
+    description: str,
+    budget: tuple[Optional[int], Optional[int], BudgetType],
+    deadline: Optional[str],
+    client_info: tuple[Optional[str], Optional[int], Optional[float]],
+    skills: list[str],
+    tags: tuple[list[str], list[str]],
+    category: JobCategory,
+) -> JobInfo:
+    """詳細ページの抽出結果から JobInfo を組み立てる"""
+    budget_min, budget_max, budget_type = budget
+    client_name, order_count, rating = client_info
+    general_tags, feature_tags = tags
+
+    client = ClientInfo(
+        name=client_name,
+        rating=rating,
+        order_history=order_count,
+    ) if client_name else None
+
+    return JobInfo(
+        title=title,
+        description=description,
+        category=category,
+        budget_type=budget_type,
+        source=SERVICE,
+        url=url,
+        job_id=job_id,
+        job_type=JobType.PROJECT,
+        status=JobStatus.OPEN,
+        budget_min=budget_min,
+        budget_max=budget_max,
+        deadline=deadline,
+        required_skills=skills,
+        tags=general_tags,
+        feature_tags=feature_tags,
+        client=client,
+    )
 
 
 async def extract_all_tags(page: Page) -> tuple[list[str], list[str]]:
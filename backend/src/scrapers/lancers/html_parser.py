@@ -0,0 +1,261 @@
+"""Lancers生HTMLパーサー（ブラウザ非依存）
+
+page.content() などで得た HTML 文字列から card_parser / detail_parser と
+同じ JobInfo を組み立てる。Playwright に依存しないため、保存済みHTMLの
+再解析・ベンチマーク・プロセスプールでの並列解析に使える。
+"""
+
+import re
+from typing import Optional
+
+import lxml.html
+from lxml.html import HtmlElement
+
+from src.models.errors import AccessDeniedError
+from src.models.job import BudgetType, JobInfo
+from src.scrapers.base import BaseScraper
+from .card_parser import CARD_SELECTOR, build_job_from_card_data
+from .detail_parser import build_detail_job, match_skills
+from .url_utils import extract_job_id
+
+
+# innerText で前後に改行が入る要素
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tr", "ul",
+}
+# innerText に含まれない要素
+_SKIP_TAGS = {"script", "style", "noscript", "template", "head"}
+
+
+def parse_list_html(html: str, max_items: int = 50) -> list[JobInfo]:
+    """一覧ページのHTMLから案件リストを取得"""
+    root = lxml.html.fromstring(html)
+
+    jobs = []
+    for card in root.cssselect(CARD_SELECTOR)[:max_items]:
+        try:
+            job = build_job_from_card_data(extract_card_data(card), BaseScraper._categorize)
+            if job:
+                jobs.append(job)
+        except Exception:
+            continue
+    return jobs
+
+
+def parse_detail_html(html: str, url: str) -> JobInfo:
+    """詳細ページのHTMLから案件情報を取得"""
+    job_id = extract_job_id(url)
+    if not job_id:
+        raise ValueError(f"Invalid Lancers URL: {url}")
+
+    root = lxml.html.fromstring(html)
+    if "閲覧制限" in _page_title(root):
+        raise AccessDeniedError("この案件は閲覧制限されています")
+
+    title = extract_title(root)
+    description = extract_description(root)
+
+    return build_detail_job(
+        url=url,
+        job_id=job_id,
+        title=title,
+        description=description,
+        budget=extract_budget(root),
+        deadline=extract_deadline(root),
+        client_info=extract_client_info(root),
+        skills=match_skills(description),
+        tags=extract_all_tags(root),
+        category=BaseScraper._categorize(f"{title} {description}"),
+    )
+
+
+# =============================================================================
+# 一覧ページ
+# =============================================================================
+
+def extract_card_data(card: HtmlElement) -> dict:
+    """カード要素から生データを抽出（card_parser.CARD_EXTRACT_SCRIPT と同じ形式）"""
+    title_link = _first(card, ".p-search-job-media__title")
+    detail_link = _first(card, "a[href*='/work/detail/']")
+
+    job_type = "unknown"
+    for candidate in ("project", "task", "competition"):
+        if _first(card, f".c-badge--worktype-{candidate}") is not None:
+            job_type = candidate
+            break
+
+    return {
+        "onclick": card.get("onclick"),
+        "title_href": title_link.get("href") if title_link is not None else None,
+        "detail_href": detail_link.get("href") if detail_link is not None else None,
+        "title": _text_of(card, ".p-search-job-media__title"),
+        "tags_text": _text_of(card, ".p-search-job-media__tags"),
+        "status_text": _text_of(card, ".p-search-job-media__time-text"),
+        "remaining_text": _text_of(card, ".p-search-job-media__time-remaining"),
+        "tags": _texts_of(card, ".p-search-job-media__tag"),
+        "job_type": job_type,
+        "prices": _texts_of(card, ".p-search-job-media__number"),
+        "feature_tags": _texts_of(card, ".p-search-job-media__tag-list"),
+        "propose_numbers": _texts_of(card, ".p-search-job-media__propose-number"),
+        "client_name": _text_of(card, ".p-search-job-media__avatar-note a"),
+        "client_subnotes": _texts_of(card, ".p-search-job-media__avatar-subnote"),
+    }
+
+
+# =============================================================================
+# 詳細ページ（detail_parser と同じ抽出ルール）
+# =============================================================================
+
+def extract_title(root: HtmlElement) -> str:
+    """タイトルを抽出"""
+    title = get_meta_content(root, "keywords")
+    if title:
+        return title.strip()
+
+    title_tag = _page_title(root)
+    if title_tag:
+        match = re.match(r"(.+?)の副業", title_tag)
+        if match:
+            return match.group(1).strip()
+        return title_tag.split("|")[0].strip()
+
+    return ""
+
+
+def extract_description(root: HtmlElement) -> str:
+    """詳細説明を抽出"""
+    selectors = [
+        ".c-definition-list__description",
+        ".p-work-detail-lancer__postscript-description",
+        "[class*='description']",
+    ]
+
+    for selector in selectors:
+        elements = root.cssselect(selector)
+        if elements:
+            texts = []
+            for el in elements:
+                text = inner_text(el)
+                if text and len(text) > 50:
+                    texts.append(text.strip())
+            if texts:
+                return "\n\n".join(texts)
+
+    desc = get_meta_content(root, "description")
+    return desc or ""
+
+
+def extract_budget(root: HtmlElement) -> tuple[Optional[int], Optional[int], BudgetType]:
+    """報酬情報を抽出"""
+    prices = []
+    for text in _texts_of(root, ".price-number"):
+        price_text = text.replace(",", "").replace("円", "").strip()
+        if price_text.isdigit():
+            prices.append(int(price_text))
+
+    if len(prices) >= 2:
+        return prices[0], prices[1], BudgetType.FIXED
+    elif len(prices) == 1:
+        return prices[0], prices[0], BudgetType.FIXED
+    return None, None, BudgetType.UNKNOWN
+
+
+def extract_deadline(root: HtmlElement) -> Optional[str]:
+    """締切日を抽出"""
+    for item in root.cssselect(".p-work-detail-schedule__item"):
+        title_text = _text_of(item, ".p-work-detail-schedule__item__title")
+        if title_text is not None and "締切" in title_text:
+            text = _text_of(item, ".p-work-detail-schedule__text")
+            if text is not None:
+                return text.strip()
+    return None
+
+
+def extract_client_info(root: HtmlElement) -> tuple[Optional[str], Optional[int], Optional[float]]:
+    """クライアント情報を抽出"""
+    client_name = None
+
+    avatar = _first(root, ".p-work-detail-sub-heading__avatar-image")
+    if avatar is not None:
+        client_name = avatar.get("alt")
+
+    if not client_name:
+        client_name = _text_of(root, 'a[href^="/client/"]')
+
+    return client_name, None, None
+
+
+def extract_all_tags(root: HtmlElement) -> tuple[list[str], list[str]]:
+    """全タグを抽出（一般タグ・特徴タグ）"""
+    feature_tags = [text.strip() for text in _texts_of(root, ".c-tag.p-work-detail-tag") if text]
+    return [], feature_tags
+
+
+def get_meta_content(root: HtmlElement, name: str) -> Optional[str]:
+    """metaタグの内容を取得"""
+    meta = _first(root, f'meta[name="{name}"]')
+    return meta.get("content") if meta is not None else None
+
+
+# =============================================================================
+# テキスト取得
+# =============================================================================
+
+def inner_text(el: HtmlElement) -> str:
+    """要素のテキストを取得（ブラウザの innerText に近い整形）
+
+    空白類は1つのスペースにまとめ、<br> とブロック要素の境界を改行にする。
+    CSS による非表示は考慮しない。
+    """
+    parts: list[str] = []
+
+    def walk(node: HtmlElement) -> None:
+        tag = node.tag if isinstance(node.tag, str) else None
+        if tag in _SKIP_TAGS:
+            return
+        if tag == "br":
+            parts.append("\n")
+        is_block = tag in _BLOCK_TAGS
+        if is_block:
+            parts.append("\n")
+        # コメント等はテキストを持たないが tail は持つ
+        if tag is not None and node.text:
+            parts.append(re.sub(r"\s+", " ", node.text))
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(re.sub(r"\s+", " ", child.tail))
+        if is_block:
+            parts.append("\n")
+
+    walk(el)
+
+    lines = [line.strip() for line in "".join(parts).split("\n")]
+    text = "\n".join(lines)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def _page_title(root: HtmlElement) -> str:
+    """<title> の内容を取得"""
+    title = root.find(".//title")
+    return (title.text_content() or "").strip() if title is not None else ""
+
+
+def _first(el: HtmlElement, selector: str) -> Optional[HtmlElement]:
+    """セレクタに一致する最初の要素"""
+    found = el.cssselect(selector)
+    return found[0] if found else None
+
+
+def _text_of(el: HtmlElement, selector: str) -> Optional[str]:
+    """セレクタに一致する最初の要素のテキスト（要素がなければ None）"""
+    found = _first(el, selector)
+    return inner_text(found) if found is not None else None
+
+
+def _texts_of(el: HtmlElement, selector: str) -> list[str]:
+    """セレクタに一致する全要素のテキスト"""
+    return [inner_text(found) for found in el.cssselect(selector)]
@@ -0,0 +1,129 @@
+"""Lancers HTTPスクレイパー（一覧ページをブラウザなしで取得）"""
+
+import re
+from contextlib import asynccontextmanager
+import asyncio
+from typing import AsyncGenerator, Awaitable, Callable, Optional
+
+import httpx
+
+from src.models.errors import AccessDeniedError, ElementNotFoundError
+from src.models.job import JobInfo
+from src.scrapers.html_cache import CachedPage
+from src.scrapers.http_client import get_http_client
+from src.scrapers.throttle import BLOCKED_STATUS_CODES, is_blocked_title, parse_retry_after
+
+from . import html_parser
+from .card_parser import CARD_SELECTOR
+from .scraper import LancersScraper
+
+# 案件カードのクラス名（CSSセレクタの先頭の "." を除いたもの）
+CARD_CLASS = CARD_SELECTOR.lstrip(".")
+
+# 詳細ページのメインコンテンツのクラス名
+DETAIL_CLASS = "p-work-detail"
+
+
+class LancersHttpScraper(LancersScraper):
+    """一覧ページをHTTPで取得するLancersスクレイパー
+
+    検索結果はサーバーサイドでレンダリングされるため、httpx で取得して
+    生HTMLを解析する。詳細ページも HTTP で取得し、期限切れのキャッシュがあれば
+    ETag / Last-Modified で条件付き再取得する。チャレンジページや目的の要素が
+    見つからない場合のみ Playwright の経路にフォールバックする。
+    """
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """保存済みセッションのCookieを持つ共有HTTPクライアントを取得"""
+        return get_http_client(
+            key=self._context_key(),
+            cookies=self._session_manager.load_cookies(self.SERVICE),
+            user_agent=self._get_user_agent(),
+            timeout=self.config.timeout.page_load / 1000,
+        )
+
+    async def _fetch(self, url: str, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+        """ページを取得（ブロックされた場合は AccessDeniedError、304 はそのまま返す）"""
+        async with self._get_limiter().request() as ticket:
+            response = await self._get_http_client().get(url, headers=headers)
+
+            title_match = re.search(
+                r"<title[^>]*>(.*?)</title>", response.text, re.IGNORECASE | re.DOTALL
+            )
+            title = title_match.group(1) if title_match else ""
+            ticket.report(
+                status=response.status_code,
+                blocked=is_blocked_title(title),
+                retry_after=parse_retry_after(response.headers.get("retry-after")),
+            )
+
+        if response.status_code in BLOCKED_STATUS_CODES:
+            raise AccessDeniedError(f"HTTP {response.status_code}: {url}")
+        if is_blocked_title(title):
+            raise AccessDeniedError(f"チャレンジ/閲覧制限ページ: {title.strip()}")
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    async def _fetch_html(self, url: str) -> str:
+        """HTMLを取得（ブロックされた場合は AccessDeniedError）"""
+        response = await self._fetch(url)
+        return response.text
+
+    async def _scrape_list_http(self, url: str, max_items: int) -> list[JobInfo]:
+        """HTTPで一覧ページを取得して解析"""
+        html = await self._fetch_html(url)
+        if CARD_CLASS not in html:
+            raise ElementNotFoundError(f"案件カードが見つかりません: {url}")
+        return await self._parse_html(html_parser.parse_list_html, html, max_items)
+
+    async def _scrape_list_once(self, url: str, max_items: int) -> list[JobInfo]:
+        """一覧ページを1回取得（HTTP優先、取得できなければブラウザ）"""
+        try:
+            return await self._scrape_list_http(url, max_items)
+        except (AccessDeniedError, ElementNotFoundError, httpx.HTTPError) as e:
+            print(f"HTTP取得できないためブラウザで再取得します: {url} - {e}")
+            return await super()._scrape_list_once(url, max_items)
+
+    @asynccontextmanager
+    async def _list_page_fetcher(
+        self, max_items: int
+    ) -> AsyncGenerator[Callable[[str], Awaitable[list[JobInfo]]], None]:
+        """一覧ページを1回取得する関数（HTTPで並列取得、ブロック時はページ単位でブラウザ）"""
+
+        async def fetch(url: str) -> list[JobInfo]:
+            return await self._scrape_list_once(url, max_items)
+
+        yield fetch
+
+    async def _scrape_detail_once(
+        self, url: str, job_id: str, cached: Optional[CachedPage] = None
+    ) -> JobInfo:
+        """案件詳細ページを1回取得（HTTP優先、取得できなければブラウザ）"""
+        try:
+            html = await self._fetch_detail_html(url, cached)
+        except (AccessDeniedError, ElementNotFoundError, httpx.HTTPError) as e:
+            print(f"HTTP取得できないためブラウザで再取得します: {url} - {e}")
+            return await super()._scrape_detail_once(url, job_id, cached)
+        return await self._parse_html(html_parser.parse_detail_html, html, url)
+
+    async def _fetch_detail_html(self, url: str, cached: Optional[CachedPage]) -> str:
+        """詳細ページのHTMLを取得してキャッシュ（変更なし(304)ならキャッシュを延長）"""
+        response = await self._fetch(url, headers=cached.validators() if cached else None)
+
+        if response.status_code == 304 and cached is not None:
+            cache = self._get_html_cache()
+            if cache is not None:
+                await asyncio.to_thread(cache.refresh, cached)
+            return cached.html
+
+        html = response.text
+        if DETAIL_CLASS not in html:
+            raise ElementNotFoundError(f"案件詳細が見つかりません: {url}")
+        await self._store_html(
+            url,
+            html,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        return html
@@ -1,22 +1,25 @@
 """Lancersスクレイパーメインクラス"""
 
-from typing import Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional, TypeVar
 
 from playwright.async_api import Page
 
-from src.models.job import (
-    BudgetType,
-    ClientInfo,
-    JobInfo,
-    JobStatus,
-    JobType,
-)
+from src.models.errors import AccessDeniedError, ElementNotFoundError
+from src.models.job import JobInfo
 from src.scrapers.base import BaseScraper
+from src.scrapers.html_cache import CachedPage, HtmlCache, get_html_cache
+from src.scrapers.paginator import Paginator
+from src.scrapers.parse_pool import run_in_parse_pool
 
-from .constants import SERVICE, BASE_URL
+from .constants import SERVICE, BASE_URL, SEARCH_PAGE_SIZE
 from . import url_utils
 from . import card_parser
 from . import detail_parser
+from . import html_parser
+
+T = TypeVar("T")
 
 
 class LancersScraper(BaseScraper):
@@ -44,6 +47,12 @@ class LancersScraper(BaseScraper):
         """検索URLを構築"""
         return url_utils.build_search_url(category, subcategory, job_types, open_only, page)
 
+    async def _parse_html(self, fn: Callable[..., T], *args: Any) -> T:
+        """生HTMLを解析（html バックエンドならプロセスプールで実行）"""
+        if self.config.parser.backend == "html":
+            return await run_in_parse_pool(fn, *args, max_workers=self.config.parser.workers)
+        return fn(*args)
+
     async def scrape_list(
         self,
         url: Optional[str] = None,
@@ -54,38 +63,130 @@ class LancersScraper(BaseScraper):
     ) -> list[JobInfo]:
         """案件一覧ページから複数の案件情報を取得"""
         if url is None:
-            url = self.build_search_url(category, job_types, open_only)
+            url = self.build_search_url(category, job_types=job_types, open_only=open_only)
+
+        return await self._with_retry(lambda: self._scrape_list_once(url, max_items), url)
 
+    async def _scrape_list_once(self, url: str, max_items: int) -> list[JobInfo]:
+        """一覧ページを1回取得（再試行しない）"""
         async with self._get_page() as page:
-            # ページ読み込み
-            try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            except Exception as e:
-                print(f"ページ読み込みエラー: {url} - {e}")
-                return []
+            return await self._scrape_list_page(page, url, max_items)
 
-            # 案件カードの出現を待機
-            try:
-                await page.wait_for_selector(".p-search-job-media", timeout=5000)
-            except Exception:
-                pass
+    async def _scrape_list_page(self, page: Page, url: str, max_items: int) -> list[JobInfo]:
+        """開いているタブで一覧ページを読み込んで解析"""
+        # ページ読み込み（失敗は呼び出し元で再試行）
+        await self._goto(page, url, timeout=30000)
 
-            # 案件カードを取得
-            job_cards = await page.query_selector_all(".p-search-job-media")
-            if not job_cards:
-                print(f"案件カードが見つかりません: {url}")
-                return []
+        # 案件カードの出現を待機
+        try:
+            await page.wait_for_selector(".p-search-job-media", timeout=5000)
+        except Exception:
+            pass
+
+        # 案件カードを一括解析（html バックエンドは別プロセスで解析）
+        if self.config.parser.backend == "html":
+            html = await page.content()
+            jobs = await self._parse_html(html_parser.parse_list_html, html, max_items)
+        else:
+            jobs = await card_parser.parse_job_cards(page, self._categorize, max_items)
+        if not jobs:
+            print(f"案件カードが見つかりません: {url}")
+        return jobs
+
+    @asynccontextmanager
+    async def _list_page_fetcher(
+        self, max_items: int
+    ) -> AsyncGenerator[Callable[[str], Awaitable[list[JobInfo]]], None]:
+        """一覧ページを1回取得する関数（1つのコンテキストを借り、ページごとにタブを開く）"""
+        async with self._get_context() as context:
 
-            jobs = []
-            for card in job_cards[:max_items]:
+            async def fetch(url: str) -> list[JobInfo]:
+                page = await self._get_pool().new_page(context)
                 try:
-                    job = await card_parser.parse_job_card(card, page, self._categorize)
-                    if job:
-                        jobs.append(job)
-                except Exception:
-                    continue
+                    return await self._scrape_list_page(page, url, max_items)
+                finally:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+
+            yield fetch
+
+    async def iter_pages(
+        self,
+        category: Optional[str] = None,
+        job_types: Optional[list[str]] = None,
+        max_pages: int = 1,
+        subcategory: Optional[str] = None,
+        open_only: bool = True,
+        max_items: int = 50,
+        page_timeout: Optional[float] = None,
+        throttle: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> AsyncGenerator[tuple[int, list[JobInfo]], None]:
+        """検索結果をページ単位で返す非同期ジェネレータ
+
+        config.pagination.window ページまでを並列に先読みし、ページ番号順に返す。
+        件数が SEARCH_PAGE_SIZE 未満のページで終了する。各ページは config.retry に
+        従って再試行し、それでも取得できないページは config.retry.skip_pages ページまで
+        飛ばして続ける。途中で抜ける場合は aclose() で先読み中の取得を止めること。
 
-            return jobs
+        Args:
+            page_timeout: 1ページの1回の取得タイムアウト（秒）
+            throttle: 各ページの取得前に待機する関数（リクエスト間隔の制御用）
+
+        Yields:
+            (ページ番号, 案件リスト)
+        """
+        async with self._list_page_fetcher(max_items) as fetch_url:
+
+            async def fetch(page_num: int) -> list[JobInfo]:
+                if throttle is not None:
+                    await throttle()
+                url = self.build_search_url(category, subcategory, job_types, open_only, page_num)
+                return await self._with_retry(lambda: fetch_url(url), url, timeout=page_timeout)
+
+            paginator = Paginator(
+                fetch,
+                max_pages=max_pages,
+                page_size=SEARCH_PAGE_SIZE,
+                window=self.config.pagination.window,
+                max_failures=self.config.retry.skip_pages,
+            )
+            pages = paginator.pages()
+            try:
+                async for page_num, jobs in pages:
+                    yield page_num, jobs
+            finally:
+                await pages.aclose()
+
+    async def iter_jobs(
+        self,
+        category: Optional[str] = None,
+        job_types: Optional[list[str]] = None,
+        max_pages: int = 1,
+        subcategory: Optional[str] = None,
+        open_only: bool = True,
+        max_items: int = 50,
+    ) -> AsyncGenerator[JobInfo, None]:
+        """検索結果を1件ずつ返す非同期ジェネレータ（次ページを先読み）
+
+        保持するのは現在のページと先読み中のページだけなので、ページ数に
+        関係なくメモリ使用量は一定。
+        """
+        pages = self.iter_pages(
+            category=category,
+            job_types=job_types,
+            max_pages=max_pages,
+            subcategory=subcategory,
+            open_only=open_only,
+            max_items=max_items,
+        )
+        try:
+            async for _, jobs in pages:
+                for job in jobs:
+                    yield job
+        finally:
+            await pages.aclose()
 
     async def scrape(self, url: str) -> JobInfo:
         """案件詳細ページから情報を取得"""
@@ -93,58 +194,89 @@ class LancersScraper(BaseScraper):
         if not job_id:
             raise ValueError(f"Invalid Lancers URL: {url}")
 
+        # TTL 内のキャッシュがあればブラウザを開かずに解析
+        cache = self._get_html_cache()
+        cached = await asyncio.to_thread(cache.get, url) if cache else None
+        if cached is not None and cache.is_fresh(cached):
+            return await self._parse_html(html_parser.parse_detail_html, cached.html, url)
+
+        return await self._with_retry(lambda: self._scrape_detail_once(url, job_id, cached), url)
+
+    def _get_html_cache(self) -> Optional[HtmlCache]:
+        """詳細ページのキャッシュ（無効なら None）"""
+        return get_html_cache(self.config.cache)
+
+    async def _store_html(
+        self,
+        url: str,
+        html: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """取得した詳細ページをキャッシュに保存"""
+        cache = self._get_html_cache()
+        if cache is not None:
+            await asyncio.to_thread(cache.put, url, html, etag, last_modified)
+
+    async def _scrape_detail_once(
+        self, url: str, job_id: str, cached: Optional[CachedPage] = None
+    ) -> JobInfo:
+        """案件詳細ページを1回取得（再試行しない）
+
+        cached は期限切れのキャッシュ（条件付き再取得に使う。ブラウザでは使わない）
+        """
         async with self._get_page() as page:
-            await page.goto(url, wait_until="domcontentloaded", timeout=self.config.timeout.page_load)
+            await self._goto(page, url)
 
             # メインコンテンツの出現を待機
             try:
                 await page.wait_for_selector(".p-work-detail", timeout=5000)
+                found = True
             except Exception:
-                pass
+                found = False
 
             # 閲覧制限ページかチェック
             page_title = await page.title()
             if "閲覧制限" in page_title:
-                raise ValueError("この案件は閲覧制限されています")
+                raise AccessDeniedError("この案件は閲覧制限されています")
+            if not found:
+                raise ElementNotFoundError(f"案件詳細が見つかりません: {url}")
+
+            if self.config.parser.backend == "html" or self._get_html_cache() is not None:
+                html = await page.content()
+                await self._store_html(url, html)
+
+                # 生HTMLを別プロセスで解析
+                if self.config.parser.backend == "html":
+                    return await self._parse_html(html_parser.parse_detail_html, html, url)
 
             # 情報抽出
             title = await detail_parser.extract_title(page)
             description = await detail_parser.extract_description(page)
-            budget_min, budget_max, budget_type = await detail_parser.extract_budget(page)
+            budget = await detail_parser.extract_budget(page)
             deadline = await detail_parser.extract_deadline(page)
-            client_name, order_count, rating = await detail_parser.extract_client_info(page)
+            client_info = await detail_parser.extract_client_info(page)
             skills = await detail_parser.extract_skills(page, description)
-            tags, feature_tags = await detail_parser.extract_all_tags(page)
-
-            # カテゴリ判定
-            category = self._categorize(f"{title} {description}")
-
-            # クライアント情報
-            client = ClientInfo(
-                name=client_name,
-                rating=rating,
-                order_history=order_count,
-            ) if client_name else None
+            tags = await detail_parser.extract_all_tags(page)
 
-            return JobInfo(
-                title=title,
-                description=description,
-                category=category,
-                budget_type=budget_type,
-                source=self.SERVICE,
+            return detail_parser.build_detail_job(
                 url=url,
                 job_id=job_id,
-                job_type=JobType.PROJECT,
-                status=JobStatus.OPEN,
-                budget_min=budget_min,
-                budget_max=budget_max,
+                title=title,
+                description=description,
+                budget=budget,
                 deadline=deadline,
-                required_skills=skills,
+                client_info=client_info,
+                skills=skills,
                 tags=tags,
-                feature_tags=feature_tags,
-                client=client,
+                category=self._categorize(f"{title} {description}"),
             )
 
+    async def fetch_job_list(self, url: str, max_items: int = 50) -> list[dict]:
+        """案件一覧を取得してdict形式で返す"""
+        jobs = await self.scrape_list(url=url, max_items=max_items)
+        return [job.to_dict() for job in jobs]
+
     async def fetch_job_detail(self, url: str) -> Optional[dict]:
         """案件詳細を取得してdict形式で返す"""
         try:
@@ -0,0 +1,15 @@
+"""スクレイパー共有リソースの終了処理"""
+
+from src.scrapers.browser_pool import shutdown_browser_pool
+from src.scrapers.http_client import close_http_clients
+from src.scrapers.parse_pool import shutdown_parse_pool
+
+
+async def shutdown_scrapers() -> None:
+    """ブラウザプール・HTTPクライアント・解析プロセスを終了
+
+    FastAPI lifespan の終了時や CLI / スクリプトの終了時に呼ぶ。
+    """
+    await shutdown_browser_pool()
+    await close_http_clients()
+    shutdown_parse_pool()
@@ -0,0 +1,132 @@
+"""作業キュー上での検索結果ページの先読み
+
+API からの実行は一覧ページ1件を作業キューの1単位として処理する。Paginator と
+同じ規則で、各カテゴリについて最大 window ページ先までの作業を登録しておく。
+
+- 開始時に各カテゴリの 1〜window ページ目を登録する
+- ページが埋まっていれば（page_size 件）、window ページ先を登録する
+- page_size 件未満のページを最終ページとし、それより後の未着手ページを取り消す
+- 取得できなかったページは skip_pages ページまで飛ばして続け、超えたらその
+  カテゴリの残りのページを取り消す
+
+登録は同じキーの作業があれば何もしないため、中断された実行では restore() で
+キューの状態から同じ判定をやり直して続きを登録する。
+"""
+
+from typing import Optional
+
+from .work_queue import UNIT_PAGE, WorkQueue
+
+
+def page_key(label: str, page: int) -> str:
+    """一覧ページの作業キー"""
+    return f"{label}:{page}"
+
+
+class PageWindow:
+    """実行1回分の一覧ページ作業の登録
+
+    Args:
+        queue: 作業キュー
+        run_id: 実行ID
+        labels: カテゴリごとの表示名（作業の payload の selection はこの番号）
+        max_pages: カテゴリごとの最大ページ数
+        page_size: 1ページの件数（これ未満なら最終ページ）
+        window: 先に登録しておくページ数
+        skip_pages: 取得に失敗しても飛ばして続けるページ数
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        run_id: str,
+        labels: list[str],
+        max_pages: int,
+        page_size: int,
+        window: int = 3,
+        skip_pages: int = 0,
+    ) -> None:
+        self.queue = queue
+        self.run_id = run_id
+        self.labels = labels
+        self.max_pages = max_pages
+        self.page_size = page_size
+        self.window = max(1, window)
+        self.skip_pages = skip_pages
+        # カテゴリごとの最終ページ（分かっているもの）と失敗したページ数
+        self.last_pages: dict[int, int] = {}
+        self.failures: dict[int, int] = {}
+
+    def start(self) -> None:
+        """各カテゴリの先頭 window ページを登録"""
+        for selection in range(len(self.labels)):
+            for page in range(1, min(self.window, self.max_pages) + 1):
+                self._enqueue(selection, page)
+
+    def restore(self) -> None:
+        """キューに記録された完了・失敗から、最終ページの判定と後続の登録をやり直す"""
+        for unit in self.queue.units(self.run_id, UNIT_PAGE):
+            selection, page = unit["payload"]["selection"], unit["payload"]["page"]
+            if unit["status"] == "done":
+                self.page_done(selection, page, len((unit["result"] or {}).get("jobs", [])))
+            elif unit["status"] == "failed":
+                self.page_failed(selection, page)
+
+    def last_page(self, selection: int) -> Optional[int]:
+        """最終ページ（まだ分からなければ None）"""
+        return self.last_pages.get(selection)
+
+    def page_done(self, selection: int, page: int, count: int) -> bool:
+        """ページの取得完了を反映
+
+        Returns:
+            最終ページだった場合 True
+        """
+        if count < self.page_size:
+            self._stop(selection, page)
+            return True
+        self._advance(selection, page)
+        return False
+
+    def page_failed(self, selection: int, page: int) -> bool:
+        """ページの取得失敗（再試行なし）を反映
+
+        Returns:
+            飛ばして続ける場合 True（skip_pages を超えたら False）
+        """
+        failures = self.failures.get(selection, 0) + 1
+        self.failures[selection] = failures
+        if failures > self.skip_pages:
+            self._stop(selection, page)
+            return False
+        self._advance(selection, page)
+        return True
+
+    def _advance(self, selection: int, page: int) -> None:
+        """window ページ先を登録（最終ページより後・最大ページ数を超える分は登録しない）"""
+        next_page = page + self.window
+        last = self.last_pages.get(selection)
+        if next_page > self.max_pages or (last is not None and next_page > last):
+            return
+        self._enqueue(selection, next_page)
+
+    def _stop(self, selection: int, page: int) -> None:
+        """page より後のページを取り消す"""
+        last = self.last_pages.get(selection)
+        if last is not None and last <= page:
+            return
+        self.last_pages[selection] = page
+        label = self.labels[selection]
+        self.queue.discard(
+            self.run_id,
+            UNIT_PAGE,
+            [page_key(label, later) for later in range(page + 1, self.max_pages + 1)],
+        )
+
+    def _enqueue(self, selection: int, page: int) -> None:
+        self.queue.enqueue(
+            self.run_id,
+            UNIT_PAGE,
+            page_key(self.labels[selection], page),
+            {"selection": selection, "page": page},
+        )
@@ -0,0 +1,86 @@
+"""検索結果ページの先読み取得
+
+最大 window ページを並列に取得し、ページ番号順に返す。
+件数が page_size 未満のページ（最終ページ）を受け取った時点で、
+先読み中の後続ページを取り消して終了する。取得に失敗したページは
+max_failures ページまで飛ばして続ける。
+"""
+
+import asyncio
+from typing import AsyncGenerator, Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Paginator(Generic[T]):
+    """ページ単位の先読み取得
+
+    Args:
+        fetch_page: ページ番号を受け取り、そのページの要素を返す関数
+        max_pages: 取得する最大ページ数
+        page_size: 1ページの件数（これ未満なら最終ページ）
+        window: 同時に取得するページ数
+        max_failures: 取得に失敗しても飛ばして続けるページ数（超えたら例外を送出）
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int], Awaitable[list[T]]],
+        max_pages: int,
+        page_size: int,
+        window: int = 3,
+        max_failures: int = 0,
+    ) -> None:
+        self.fetch_page = fetch_page
+        self.max_pages = max_pages
+        self.page_size = page_size
+        self.window = max(1, window)
+        self.max_failures = max_failures
+        self.failed_pages: list[int] = []
+
+    async def pages(self) -> AsyncGenerator[tuple[int, list[T]], None]:
+        """(ページ番号, 要素リスト) をページ番号順に返す"""
+        in_flight: dict[int, asyncio.Task] = {}
+        next_page = 1
+
+        def fill() -> None:
+            nonlocal next_page
+            while next_page <= self.max_pages and len(in_flight) < self.window:
+                in_flight[next_page] = asyncio.create_task(self.fetch_page(next_page))
+                next_page += 1
+
+        try:
+            fill()
+            for page_num in range(1, self.max_pages + 1):
+                try:
+                    items = await in_flight.pop(page_num)
+                except Exception as e:
+                    if len(self.failed_pages) >= self.max_failures:
+                        raise
+                    self.failed_pages.append(page_num)
+                    print(f"{page_num}ページ目を取得できないため飛ばします: {e}")
+                    fill()
+                    continue
+
+                is_last = len(items) < self.page_size
+                if is_last:
+                    # 後続ページは存在しないので取得を止める
+                    await self._cancel(in_flight)
+                else:
+                    fill()
+
+                yield page_num, items
+
+                if is_last:
+                    return
+        finally:
+            await self._cancel(in_flight)
+
+    @staticmethod
+    async def _cancel(in_flight: dict[int, asyncio.Task]) -> None:
+        """取得中のページを取り消す"""
+        tasks = list(in_flight.values())
+        in_flight.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,44 @@
+"""HTML解析用プロセスプール
+
+ブラウザはナビゲーションだけを担当し、CPU負荷の高い解析は
+別プロセスに分散する。投入する関数・引数・戻り値は pickle 可能であること。
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_executor(max_workers: int = 0) -> ProcessPoolExecutor:
+    """共有プロセスプールを取得（初回呼び出し時の設定で生成）"""
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+    return _executor
+
+
+async def run_in_parse_pool(
+    fn: Callable[..., T],
+    *args: Any,
+    max_workers: int = 0,
+) -> T:
+    """関数をプロセスプールで実行して結果を待つ"""
+    loop = asyncio.get_running_loop()
+    executor = get_parse_executor(max_workers)
+    return await loop.run_in_executor(executor, partial(fn, *args))
+
+
+def shutdown_parse_pool() -> None:
+    """共有プロセスプールを終了"""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
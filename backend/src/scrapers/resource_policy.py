@@ -0,0 +1,105 @@
+"""不要リソースのブロック
+
+テキスト抽出に使わない画像・フォント・解析タグ等を context.route で遮断し、
+遮断件数と実際に受信したバイト数を集計する。
+"""
+
+from collections import Counter
+from typing import Optional
+
+from playwright.async_api import BrowserContext, Request, Response, Route
+
+from src.models.config import ResourceBlockingConfig
+from src.models.job import Service
+
+
+class ResourceBlockStats:
+    """ブロック状況の集計（プロセス全体で共有）
+
+    ブロックしたリクエストは受信しないためサイズは分からない。
+    通過したレスポンスの Content-Length を合計し、ブロック有無での
+    差分から削減量を測る。
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """集計をリセット（実行単位で計測する場合に呼ぶ）"""
+        self.blocked_by_type: Counter = Counter()
+        self.blocked_by_pattern: Counter = Counter()
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+
+    @property
+    def blocked_requests(self) -> int:
+        return sum(self.blocked_by_type.values())
+
+    def record_blocked(self, resource_type: str, pattern: Optional[str]) -> None:
+        self.blocked_by_type[resource_type] += 1
+        if pattern:
+            self.blocked_by_pattern[pattern] += 1
+
+    def record_response(self, response: Response) -> None:
+        self.allowed_requests += 1
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.allowed_bytes += int(length)
+
+    def snapshot(self) -> dict:
+        """現在の集計値"""
+        return {
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "blocked_by_pattern": dict(self.blocked_by_pattern),
+            "allowed_requests": self.allowed_requests,
+            "allowed_bytes": self.allowed_bytes,
+        }
+
+
+block_stats = ResourceBlockStats()
+
+
+class ResourceBlocker:
+    """サービス単位のブロックポリシー"""
+
+    def __init__(
+        self,
+        config: ResourceBlockingConfig,
+        service: Service,
+        stats: ResourceBlockStats = block_stats,
+    ) -> None:
+        self.config = config
+        self.service = service
+        self.stats = stats
+        self._resource_types = set(config.resource_types)
+        self._allowlist = config.allowlist.get(service.value, [])
+
+    def match(self, url: str, resource_type: str) -> tuple[bool, Optional[str]]:
+        """ブロック対象か判定
+
+        Returns:
+            (ブロックするか, 一致したURLパターン)
+        """
+        if any(allowed in url for allowed in self._allowlist):
+            return False, None
+        for pattern in self.config.url_patterns:
+            if pattern in url:
+                return True, pattern
+        return resource_type in self._resource_types, None
+
+    async def _handle_route(self, route: Route, request: Request) -> None:
+        """リクエストを遮断または通過させる"""
+        blocked, pattern = self.match(request.url, request.resource_type)
+        if blocked:
+            self.stats.record_blocked(request.resource_type, pattern)
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    async def install(self, context: BrowserContext) -> None:
+        """コンテキストにポリシーを適用"""
+        if not self.config.enabled:
+            return
+        await context.route("**/*", self._handle_route)
+        context.on("response", self.stats.record_response)
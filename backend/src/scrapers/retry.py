@@ -0,0 +1,130 @@
+"""スクレイピング操作のリトライ
+
+ページ遷移・要素取得などの操作を、失敗の種類に応じて指数バックオフ（ジッター付き）で
+再試行する。1回の実行（run）全体で使えるリトライ回数には上限（予算）を設け、
+サイト側の障害時に再試行が積み重なって実行が終わらなくなるのを防ぐ。
+"""
+
+import asyncio
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.models.config import RetryConfig
+from src.models.errors import (
+    AccessDeniedError,
+    ElementNotFoundError,
+    LoginRequiredError,
+    NetworkError,
+)
+from src.scrapers.attempt_timeout import run_with_timeout
+
+T = TypeVar("T")
+
+# 失敗の種類
+ERROR_TIMEOUT = "timeout"
+ERROR_NAVIGATION = "navigation"
+ERROR_SELECTOR_MISSING = "selector_missing"
+ERROR_RESTRICTED = "restricted"
+ERROR_OTHER = "other"
+
+# 再試行する失敗の種類（閲覧制限は待っても変わらず、ブロックはリミッターが待機する）
+RETRYABLE_ERRORS = {ERROR_TIMEOUT, ERROR_NAVIGATION, ERROR_SELECTOR_MISSING}
+
+
+def classify_error(error: BaseException) -> str:
+    """例外を失敗の種類に分類"""
+    if isinstance(error, (asyncio.TimeoutError, PlaywrightTimeoutError, httpx.TimeoutException)):
+        return ERROR_TIMEOUT
+    if isinstance(error, (AccessDeniedError, LoginRequiredError)):
+        return ERROR_RESTRICTED
+    if isinstance(error, ElementNotFoundError):
+        return ERROR_SELECTOR_MISSING
+    if isinstance(error, (PlaywrightError, httpx.TransportError, NetworkError)):
+        return ERROR_NAVIGATION
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code >= 500:
+        return ERROR_NAVIGATION
+    return ERROR_OTHER
+
+
+class RetryBudget:
+    """1回の実行全体で使えるリトライ回数"""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self.by_error: dict[str, int] = {}
+        self._exhausted_logged = False
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.used)
+
+    def consume(self, error_type: str) -> bool:
+        """リトライを1回分使う（残っていなければ False）"""
+        if self.used >= self.limit:
+            if not self._exhausted_logged:
+                print(f"[retry] リトライ上限（{self.limit}回）に達したため、以降は再試行しません")
+                self._exhausted_logged = True
+            return False
+        self.used += 1
+        self.by_error[error_type] = self.by_error.get(error_type, 0) + 1
+        return True
+
+    def stats(self) -> dict:
+        return {"limit": self.limit, "used": self.used, "by_error": dict(self.by_error)}
+
+
+def backoff_delay(config: RetryConfig, attempt: int) -> float:
+    """attempt 回目の失敗後の待機秒数（指数バックオフ + ジッター）"""
+    base = min(config.max_delay, config.delay * (2 ** (attempt - 1)))
+    return base / 2 + random.uniform(0, base / 2)
+
+
+async def with_retry(
+    operation: Callable[[], Awaitable[T]],
+    config: RetryConfig,
+    budget: Optional[RetryBudget] = None,
+    label: str = "",
+    timeout: Optional[float] = None,
+    retry_on: set[str] = RETRYABLE_ERRORS,
+) -> T:
+    """操作を再試行付きで実行
+
+    Args:
+        operation: 実行する操作（呼び出すたびに新しく実行されること）
+        config: 試行回数・待機時間の設定
+        budget: 実行全体のリトライ予算（None なら試行回数のみで制限）
+        label: ログ用の名前（URL等）
+        timeout: 1回の試行のタイムアウト（秒、ブラウザの貸し出し・リミッターの待機時間は含めない）
+        retry_on: 再試行する失敗の種類
+
+    Raises:
+        最後の試行で発生した例外
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            if timeout is None:
+                return await operation()
+            return await run_with_timeout(operation, timeout)
+        except Exception as e:
+            error_type = classify_error(e)
+            if (
+                error_type not in retry_on
+                or attempt >= config.max_attempts
+                or (budget is not None and not budget.consume(error_type))
+            ):
+                raise
+
+            delay = backoff_delay(config, attempt)
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+            print(
+                f"[retry] {label} {error_type}: {reason} → {delay:.1f}秒後に再試行 "
+                f"({attempt + 1}/{config.max_attempts})"
+            )
+            await asyncio.sleep(delay)
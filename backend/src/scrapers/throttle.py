@@ -0,0 +1,248 @@
+"""ホスト単位の適応的リクエスト制御
+
+同じホストへのリクエストを、全スクレイパーで共有するリミッターで制御する。
+同時リクエスト数とリクエスト開始間隔を AIMD（加算的増加・乗算的減少）で調整する。
+
+- 正常な応答が続く間は、同時数を少しずつ増やし、間隔を少しずつ縮める
+- 429/403/503 や閲覧制限ページ（ブロック）を受けたら、同時数を割り、間隔を倍にして
+  Retry-After（なければ cooldown 秒）の間は新しいリクエストを止める
+- 応答が遅い場合（混雑）は、停止はせずに同時数と間隔だけを絞る
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+from urllib.parse import urlparse
+
+from src.models.config import ThrottleConfig
+from src.scrapers.attempt_timeout import waiting
+
+# ブロックとみなすHTTPステータス
+BLOCKED_STATUS_CODES = {403, 429, 503}
+
+# ブロックとみなすページタイトル（閲覧制限・チャレンジページ）
+BLOCKED_TITLE_MARKERS = ["閲覧制限", "Just a moment", "Attention Required", "Access Denied"]
+
+# 応答時間の平滑化係数（指数移動平均）
+LATENCY_SMOOTHING = 0.2
+
+
+def is_blocked_title(title: str) -> bool:
+    """閲覧制限・チャレンジページのタイトルか判定"""
+    return any(marker in title for marker in BLOCKED_TITLE_MARKERS)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After ヘッダーを秒数に変換（秒数形式のみ対応）"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value.strip()))
+    except ValueError:
+        return None
+
+
+class RequestTicket:
+    """リミッターを通した1リクエスト（結果を report で伝える）"""
+
+    def __init__(self) -> None:
+        self.started_at = time.monotonic()
+        self.status: Optional[int] = None
+        self.blocked = False
+        self.retry_after: Optional[float] = None
+        self.reported = False
+
+    def report(
+        self,
+        status: Optional[int] = None,
+        blocked: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """応答結果を記録
+
+        Args:
+            status: HTTPステータス（不明なら None）
+            blocked: 閲覧制限・チャレンジページだった場合 True
+            retry_after: サーバーが指定した待機秒数（Retry-After）
+        """
+        self.status = status
+        self.blocked = blocked or status in BLOCKED_STATUS_CODES
+        self.retry_after = retry_after
+        self.reported = True
+
+
+class AdaptiveLimiter:
+    """ホスト単位の AIMD リミッター"""
+
+    def __init__(self, host: str, config: Optional[ThrottleConfig] = None) -> None:
+        self.host = host
+        self.config = config or ThrottleConfig()
+        self.concurrency = float(max(1, self.config.initial_concurrency))
+        self.delay = self.config.initial_delay
+        self.in_flight = 0
+        self._next_start = 0.0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+        # 統計
+        self.requests = 0
+        self.blocked = 0
+        self.slow = 0
+        self.errors = 0
+        self.latency: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        """現在の同時リクエスト数の上限"""
+        return int(self.concurrency)
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        """開始できるまでの秒数（同時数の空き待ちなら None）"""
+        if self.in_flight >= self.limit:
+            return None
+        return max(0.0, self._paused_until - now, self._next_start - now)
+
+    def _wake(self) -> None:
+        """待機中のリクエストを起こす（各自で開始できるか再確認する）"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _acquire(self) -> RequestTicket:
+        """開始できるまで待機して枠を確保"""
+        loop = asyncio.get_running_loop()
+        while True:
+            wait = self._wait_time(time.monotonic())
+            if wait == 0:
+                break
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, wait)
+            except asyncio.TimeoutError:
+                pass
+
+        self.in_flight += 1
+        self.requests += 1
+        jitter = self.config.jitter
+        self._next_start = time.monotonic() + self.delay * random.uniform(1 - jitter, 1 + jitter)
+        return RequestTicket()
+
+    def _release(self, ticket: RequestTicket, failed: bool) -> None:
+        """枠を返して応答結果を反映"""
+        self.in_flight -= 1
+        latency = time.monotonic() - ticket.started_at
+
+        if ticket.reported and ticket.blocked:
+            self.blocked += 1
+            pause = ticket.retry_after if ticket.retry_after is not None else self.config.cooldown
+            self._decrease(ticket, pause, f"ブロックを検知 (HTTP {ticket.status or '-'})")
+        elif failed and not ticket.reported:
+            # 例外（タイムアウト・通信エラー等）は速度を変えずに記録だけする
+            self.errors += 1
+        else:
+            self.latency = (
+                latency
+                if self.latency is None
+                else self.latency + LATENCY_SMOOTHING * (latency - self.latency)
+            )
+            if latency > self.config.slow_latency:
+                self.slow += 1
+                self._decrease(ticket, 0.0, f"応答遅延 ({latency:.1f}秒)")
+            else:
+                self._increase()
+
+        self._wake()
+
+    def _increase(self) -> None:
+        """加算的増加（同時数は上限まで1周ごとに+1、間隔は一定量ずつ短縮）"""
+        self.concurrency = min(
+            float(self.config.max_concurrency), self.concurrency + 1 / self.concurrency
+        )
+        self.delay = max(self.config.min_delay, self.delay - self.config.delay_step)
+
+    def _decrease(self, ticket: RequestTicket, pause: float, reason: str) -> None:
+        """乗算的減少（直前の減少より前に開始したリクエストの結果では重ねて減らさない）"""
+        now = time.monotonic()
+        if pause > 0:
+            self._paused_until = max(self._paused_until, now + pause)
+        if ticket.started_at < self._last_decrease:
+            return
+
+        factor = self.config.backoff_factor
+        self.concurrency = max(1.0, self.concurrency / factor)
+        self.delay = min(self.config.max_delay, max(self.delay, self.config.min_delay) * factor)
+        self._last_decrease = now
+        print(
+            f"[throttle] {self.host}: {reason} → 同時{self.limit}件, 間隔{self.delay:.2f}秒"
+            + (f", {pause:.1f}秒停止" if pause > 0 else "")
+        )
+
+    @asynccontextmanager
+    async def request(self) -> AsyncGenerator[RequestTicket, None]:
+        """1リクエスト分の枠を確保（応答を受けたら ticket.report で結果を伝える）
+
+        report しなかった場合、例外なく終われば成功として応答時間だけで判断する。
+        枠が空くまでの待機は再試行のタイムアウトに含めない。
+        """
+        async with waiting():
+            ticket = await self._acquire()
+        failed = True
+        try:
+            yield ticket
+            failed = False
+        finally:
+            self._release(ticket, failed)
+
+    @property
+    def rate(self) -> float:
+        """現在の推定リクエスト速度（件/秒）"""
+        interval_rate = 1 / self.delay if self.delay > 0 else float("inf")
+        if not self.latency:
+            return interval_rate
+        return min(interval_rate, self.limit / self.latency)
+
+    def stats(self) -> dict:
+        """現在の制御状態"""
+        return {
+            "host": self.host,
+            "concurrency": self.limit,
+            "delay": round(self.delay, 3),
+            "rate": round(self.rate, 3),
+            "in_flight": self.in_flight,
+            "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 1),
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "requests": self.requests,
+            "blocked": self.blocked,
+            "slow": self.slow,
+            "errors": self.errors,
+        }
+
+
+# ホストごとの共有リミッター
+_host_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def host_of(url: str) -> str:
+    """URLからホスト名を取得（ホスト名がそのまま渡された場合はそのまま返す）"""
+    return urlparse(url).netloc or url
+
+
+def get_host_limiter(url: str, config: Optional[ThrottleConfig] = None) -> AdaptiveLimiter:
+    """ホスト単位の共有リミッターを取得（初回呼び出し時の設定で生成）"""
+    host = host_of(url)
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        limiter = AdaptiveLimiter(host, config)
+        _host_limiters[host] = limiter
+    return limiter
+
+
+def limiter_stats() -> list[dict]:
+    """全ホストの制御状態"""
+    return [limiter.stats() for limiter in _host_limiters.values()]
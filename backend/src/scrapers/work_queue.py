@@ -0,0 +1,438 @@
+"""永続スクレイピングキュー（SQLite）
+
+1回の実行（run）を一覧ページ単位 (category, page) と詳細単位 (job_id, detail) の
+作業に分けて保存する。ワーカーは作業を1つずつ取り出し、結果を記録してから
+完了にするため、プロセスが落ちても未完了の作業から再開できる。
+
+実行はそれを処理しているプロセス（owner）とハートビートの時刻を持つ。
+複数のプロセスが同じキューを使う場合、再開できるのは owner が終了しているか
+ハートビートが途絶えた実行だけで、他のプロセスが処理中の作業は取り上げない。
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+# 作業の種類
+UNIT_PAGE = "page"
+UNIT_DETAIL = "detail"
+
+# 実行の状態
+RUN_RUNNING = "running"
+RUN_DONE = "done"
+RUN_CANCELLED = "cancelled"
+RUN_ERROR = "error"
+
+DEFAULT_QUEUE_PATH = Path(__file__).parent.parent.parent / "output" / "scrape_queue.sqlite3"
+
+# ハートビートの間隔と、途絶えたとみなすまでの時間（秒）
+HEARTBEAT_INTERVAL = 30.0
+STALE_AFTER_SECONDS = float(os.getenv("SCRAPE_QUEUE_STALE_SECONDS", "120"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    summary TEXT,
+    owner TEXT,
+    heartbeat_at TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    claimed_by TEXT,
+    updated_at TEXT NOT NULL,
+    UNIQUE (run_id, kind, key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_units_run_status ON units(run_id, status, id);
+"""
+
+
+@dataclass
+class WorkUnit:
+    """取り出した作業"""
+
+    id: int
+    run_id: str
+    kind: str
+    key: str
+    payload: dict
+    attempts: int
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _new_owner() -> str:
+    """このプロセスの owner（ホスト名:PID:インスタンスごとの値）"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _owner_alive(owner: str, current: str) -> bool:
+    """owner のプロセスが動いている可能性があるか
+
+    同じホストのプロセスは PID で判定する（同じ PID でも current と異なる owner は
+    再起動前のプロセス）。別ホストのプロセスは判定できないため True を返す。
+    """
+    host, _, rest = owner.partition(":")
+    pid, _, _ = rest.partition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+    if int(pid) == os.getpid():
+        return owner == current
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WorkQueue:
+    """SQLite に保存する作業キュー
+
+    SQLite の操作は1ms未満なのでイベントループ上で直接呼ぶ。
+    スレッドから使う場合に備えて接続はロックで保護する。
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        owner: Optional[str] = None,
+        stale_after: float = STALE_AFTER_SECONDS,
+    ) -> None:
+        self.path = Path(path or os.getenv("SCRAPE_QUEUE_PATH") or DEFAULT_QUEUE_PATH)
+        self.owner = owner or _new_owner()
+        self.stale_after = stale_after
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """既存ファイルに不足しているカラムを追加"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(runs)")}
+        for column in ("summary", "owner", "heartbeat_at"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE runs ADD COLUMN {column} TEXT")
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(units)")}
+        if "claimed_by" not in columns:
+            self._conn.execute("ALTER TABLE units ADD COLUMN claimed_by TEXT")
+
+    # -------------------------------------------------------------------------
+    # 実行（run）
+    # -------------------------------------------------------------------------
+
+    def create_run(self, params: dict) -> str:
+        """実行を登録して run_id を返す"""
+        run_id = uuid.uuid4().hex
+        now = _now()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO runs (run_id, params, status, owner, heartbeat_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, json.dumps(params, ensure_ascii=False), RUN_RUNNING, self.owner, now, now, now),
+            )
+        return run_id
+
+    def acquire_run(self, run_id: str) -> bool:
+        """中断された実行をこのプロセスの処理にする
+
+        owner が終了している・ハートビートが途絶えた・owner のない実行のみ取得できる。
+
+        Returns:
+            取得できた（既にこのプロセスの実行だった場合を含む）場合 True
+        """
+        cutoff = (datetime.now() - timedelta(seconds=self.stale_after)).isoformat()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT owner, heartbeat_at FROM runs WHERE run_id = ? AND status = ?",
+                    (run_id, RUN_RUNNING),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return False
+                owner, heartbeat_at = row["owner"], row["heartbeat_at"]
+                available = (
+                    owner is None
+                    or owner == self.owner
+                    or heartbeat_at is None
+                    or heartbeat_at < cutoff
+                    or not _owner_alive(owner, self.owner)
+                )
+                if available:
+                    self._conn.execute(
+                        "UPDATE runs SET owner = ?, heartbeat_at = ? WHERE run_id = ?",
+                        (self.owner, _now(), run_id),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return available
+
+    def heartbeat(self, run_id: str) -> bool:
+        """処理中であることを記録
+
+        Returns:
+            まだこのプロセスの実行である場合 True（他のプロセスに引き継がれていれば False）
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE runs SET heartbeat_at = ? WHERE run_id = ? AND owner = ?",
+                (_now(), run_id, self.owner),
+            )
+        return cursor.rowcount > 0
+
+    def get_run(self, run_id: str) -> Optional[dict]:
+        """実行の情報を取得"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return self._run_to_dict(row) if row else None
+
+    def unfinished_runs(self) -> list[dict]:
+        """完了していない実行（古い順）"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM runs WHERE status = ? ORDER BY created_at",
+                (RUN_RUNNING,),
+            ).fetchall()
+        return [self._run_to_dict(row) for row in rows]
+
+    def finish_run(
+        self,
+        run_id: str,
+        status: str,
+        error: Optional[str] = None,
+        summary: Optional[dict] = None,
+    ) -> None:
+        """実行を終了状態にする（summary は履歴表示用の集計）
+
+        他のプロセスに引き継がれた実行は変更しない。
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, error = ?, summary = ?, updated_at = ? "
+                "WHERE run_id = ? AND (owner IS NULL OR owner = ?)",
+                (
+                    status,
+                    error,
+                    json.dumps(summary, ensure_ascii=False) if summary is not None else None,
+                    _now(),
+                    run_id,
+                    self.owner,
+                ),
+            )
+
+    def finished_runs(self, limit: int = 20) -> list[dict]:
+        """終了した実行（新しい順）"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM runs WHERE status != ? ORDER BY updated_at DESC LIMIT ?",
+                (RUN_RUNNING, limit),
+            ).fetchall()
+        return [self._run_to_dict(row) for row in rows]
+
+    def delete_finished_runs(self, keep: int = 100) -> None:
+        """終了した実行を新しい順に keep 件だけ残して削除"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM runs WHERE status != ? AND run_id NOT IN ("
+                "  SELECT run_id FROM runs WHERE status != ? ORDER BY created_at DESC LIMIT ?"
+                ")",
+                (RUN_RUNNING, RUN_RUNNING, keep),
+            )
+
+    @staticmethod
+    def _run_to_dict(row: sqlite3.Row) -> dict:
+        return {
+            "run_id": row["run_id"],
+            "params": json.loads(row["params"]),
+            "status": row["status"],
+            "error": row["error"],
+            "summary": json.loads(row["summary"]) if row["summary"] else None,
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    # -------------------------------------------------------------------------
+    # 作業（unit）
+    # -------------------------------------------------------------------------
+
+    def enqueue(self, run_id: str, kind: str, key: str, payload: dict) -> bool:
+        """作業を追加（同じ run・種類・キーの作業が既にあれば追加しない）"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO units (run_id, kind, key, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (run_id, kind, key, json.dumps(payload, ensure_ascii=False), _now()),
+            )
+        return cursor.rowcount > 0
+
+    def claim(self, run_id: str, kind: Optional[str] = None) -> Optional[WorkUnit]:
+        """未着手の作業を1つ取り出す（追加順）"""
+        query = "SELECT * FROM units WHERE run_id = ? AND status = 'pending'"
+        params: list[Any] = [run_id]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY id LIMIT 1"
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(query, params).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE units SET status = 'claimed', claimed_by = ?, attempts = attempts + 1, "
+                    "updated_at = ? WHERE id = ?",
+                    (self.owner, _now(), row["id"]),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return WorkUnit(
+            id=row["id"],
+            run_id=row["run_id"],
+            kind=row["kind"],
+            key=row["key"],
+            payload=json.loads(row["payload"]),
+            attempts=row["attempts"] + 1,
+        )
+
+    def complete(self, unit: WorkUnit, result: Any = None) -> None:
+        """作業を完了にして結果を記録（チェックポイント）"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET status = 'done', result = ?, error = NULL, updated_at = ? "
+                "WHERE id = ?",
+                (json.dumps(result, ensure_ascii=False, default=str), _now(), unit.id),
+            )
+
+    def fail(self, unit: WorkUnit, error: str, max_attempts: int = 3) -> bool:
+        """作業を失敗にする（試行回数に余裕があれば未着手に戻す）
+
+        Returns:
+            再試行のためキューに戻した場合 True
+        """
+        retry = unit.attempts < max_attempts
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                ("pending" if retry else "failed", error, _now(), unit.id),
+            )
+        return retry
+
+    def release_claimed(self, run_id: str) -> int:
+        """取り出し中のまま残った作業を未着手に戻す（中断された実行の再開用）
+
+        acquire_run で取得した実行について、以前の owner が取り出したまま
+        残った作業を戻す。このプロセスが取り出し中の作業はそのまま。
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET status = 'pending', claimed_by = NULL, updated_at = ? "
+                "WHERE run_id = ? AND status = 'claimed' "
+                "AND (claimed_by IS NULL OR claimed_by != ?) "
+                "AND EXISTS (SELECT 1 FROM runs WHERE runs.run_id = units.run_id AND runs.owner = ?)",
+                (_now(), run_id, self.owner, self.owner),
+            )
+        return cursor.rowcount
+
+    def discard(self, run_id: str, kind: str, keys: list[str]) -> int:
+        """未着手の作業を取り消す（取り出し中・完了済みはそのまま）"""
+        if not keys:
+            return 0
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM units WHERE run_id = ? AND kind = ? AND status = 'pending' "
+                f"AND key IN ({placeholders})",
+                (run_id, kind, *keys),
+            )
+        return cursor.rowcount
+
+    def units(self, run_id: str, kind: str) -> list[dict]:
+        """作業の状態・内容・結果（追加順）"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, payload, result FROM units WHERE run_id = ? AND kind = ? ORDER BY id",
+                (run_id, kind),
+            ).fetchall()
+        return [
+            {
+                "status": row["status"],
+                "payload": json.loads(row["payload"]),
+                "result": json.loads(row["result"]) if row["result"] is not None else None,
+            }
+            for row in rows
+        ]
+
+    def progress(self, run_id: str) -> dict[str, dict[str, int]]:
+        """種類・状態ごとの作業数（例: {"page": {"done": 3, "pending": 1}}）"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, status, COUNT(*) AS n FROM units WHERE run_id = ? GROUP BY kind, status",
+                (run_id,),
+            ).fetchall()
+        counts: dict[str, dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row["kind"], {})[row["status"]] = row["n"]
+        return counts
+
+    def results(self, run_id: str, kind: str) -> list[Any]:
+        """完了した作業の結果（追加順）"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result FROM units WHERE run_id = ? AND kind = ? AND status = 'done' ORDER BY id",
+                (run_id, kind),
+            ).fetchall()
+        return [json.loads(row["result"]) for row in rows if row["result"] is not None]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_queue: Optional[WorkQueue] = None
+
+
+def get_work_queue() -> WorkQueue:
+    """共有作業キューを取得"""
+    global _queue
+
+    if _queue is None:
+        _queue = WorkQueue()
+    return _queue
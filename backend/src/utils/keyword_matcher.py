@@ -0,0 +1,129 @@
+"""複数キーワードの一括検出
+
+キーワード群を一度だけ前処理しておき、テキスト中に含まれるキーワードを
+（重なりも含めて）まとめて検出する。大文字小文字は区別しない。
+
+"AI" や "Go" のような短い英数字キーワードは、前後が英数字でない位置でのみ
+一致させる（"Django" 中の "Go" や "mail" 中の "ai" を拾わない）。
+
+pyahocorasick がインストールされていれば Aho–Corasick オートマトンでテキストを
+1回だけ走査する。なければキーワードごとに str.find で走査する（CPython では
+数十語程度なら Python で書いたオートマトンより C 実装の find の方が速い）。
+どちらも結果は同じ。
+"""
+
+from typing import Generic, Hashable, Iterable, Optional, TypeVar
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - 任意の依存
+    ahocorasick = None
+
+K = TypeVar("K", bound=Hashable)
+
+# この文字数以下の英数字だけのキーワードは単語境界でのみ一致させる
+DEFAULT_BOUNDARY_MAX_LEN = 3
+
+
+def _is_ascii_alnum(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def needs_boundary(keyword: str, max_len: int = DEFAULT_BOUNDARY_MAX_LEN) -> bool:
+    """単語境界が必要なキーワードか（短い英数字のみのキーワード）"""
+    return len(keyword) <= max_len and all(_is_ascii_alnum(c) for c in keyword)
+
+
+def _at_boundary(text: str, start: int, end: int) -> bool:
+    """text[start:end] の前後が英数字でないか"""
+    if start > 0 and _is_ascii_alnum(text[start - 1]):
+        return False
+    return not (end < len(text) and _is_ascii_alnum(text[end]))
+
+
+class KeywordMatcher(Generic[K]):
+    """キーワード → ラベルの対応から、テキスト中のキーワードを一括検出する
+
+    Args:
+        keywords: (キーワード, ラベル) の組。同じキーワードを複数のラベルに登録できる
+        boundary_max_len: この文字数以下の英数字キーワードは単語境界でのみ一致させる
+        use_automaton: オートマトンを使うか（None: pyahocorasick があれば使う）
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[tuple[str, K]],
+        boundary_max_len: int = DEFAULT_BOUNDARY_MAX_LEN,
+        use_automaton: Optional[bool] = None,
+    ) -> None:
+        self.keywords: list[str] = []
+        self.labels: list[K] = []
+        for keyword, label in keywords:
+            self.keywords.append(keyword)
+            self.labels.append(label)
+
+        self._patterns = [keyword.lower() for keyword in self.keywords]
+        self._boundary = [needs_boundary(keyword, boundary_max_len) for keyword in self.keywords]
+
+        if use_automaton is None:
+            use_automaton = ahocorasick is not None
+        if use_automaton and ahocorasick is None:
+            raise ImportError("pyahocorasick がインストールされていません")
+
+        self.backend = "automaton" if use_automaton else "find"
+        self._automaton = None
+        if use_automaton:
+            # 同じ文字列のキーワードは1つの語にまとめ、値に (番号, 文字数) を持たせる
+            words: dict[str, list[int]] = {}
+            for index, pattern in enumerate(self._patterns):
+                words.setdefault(pattern, []).append(index)
+            automaton = ahocorasick.Automaton()
+            for pattern, indexes in words.items():
+                automaton.add_word(pattern, (indexes, len(pattern)))
+            if words:
+                automaton.make_automaton()
+                self._automaton = automaton
+
+    def _match_indexes(self, text: str) -> set[int]:
+        """一致したキーワードの番号（境界条件を満たす出現が1つ以上あるもの）"""
+        lowered = text.lower()
+        found: set[int] = set()
+
+        if self.backend == "automaton":
+            if self._automaton is None:
+                return found
+            boundary = self._boundary
+            for end, (indexes, length) in self._automaton.iter(lowered):
+                for index in indexes:
+                    if index in found:
+                        continue
+                    if boundary[index] and not _at_boundary(lowered, end - length + 1, end + 1):
+                        continue
+                    found.add(index)
+            return found
+
+        for index, pattern in enumerate(self._patterns):
+            start = lowered.find(pattern)
+            if not self._boundary[index]:
+                if start >= 0:
+                    found.add(index)
+                continue
+            # 境界条件を満たす出現が見つかるまで探す
+            while start >= 0:
+                if _at_boundary(lowered, start, start + len(pattern)):
+                    found.add(index)
+                    break
+                start = lowered.find(pattern, start + 1)
+        return found
+
+    def find(self, text: str) -> list[str]:
+        """含まれるキーワード（重複なし、登録順）"""
+        return [self.keywords[index] for index in sorted(self._match_indexes(text))]
+
+    def count_labels(self, text: str) -> dict[K, int]:
+        """ラベルごとの一致キーワード数（同じキーワードの複数回の出現は1回と数える）"""
+        counts: dict[K, int] = {}
+        for index in self._match_indexes(text):
+            label = self.labels[index]
+            counts[label] = counts.get(label, 0) + 1
+        return counts
@@ -0,0 +1,73 @@
+"""有効期限付きのプロセス内キャッシュ
+
+同じデータを短時間に繰り返し DB から読まないためのキャッシュ。期限切れの
+エントリは参照時に捨て、上限件数を超えたら古く登録されたものから削除する。
+スレッドから呼ばれてもよいようにロックで保護する。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """キー → 値のキャッシュ（登録から ttl 秒で期限切れ）
+
+    Args:
+        ttl: 有効期間（秒）
+        max_entries: 保持する最大件数
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 統計
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """値を取得（なければ・期限切れなら None）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """値を登録（同じキーは置き換える）"""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys: Iterable[K]) -> None:
+        """指定キーを削除"""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """全件削除"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,52 @@
+"""DB 呼び出しのタイムアウトが 504 になることのテスト"""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.db as api_db
+from src.api.server import app
+from src.db import set_client_factory
+from src.db.executor import run_db
+
+
+class HangingQuery:
+    """どのクエリ構築メソッドも自身を返し、execute は解放されるまで待つ"""
+
+    def __init__(self, release: threading.Event) -> None:
+        self.release = release
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self
+
+    def execute(self) -> None:
+        self.release.wait(5)
+
+
+class HangingClient:
+    def __init__(self, release: threading.Event) -> None:
+        self.release = release
+
+    def table(self, name: str) -> HangingQuery:
+        return HangingQuery(self.release)
+
+
+@pytest.fixture
+def hanging_db(monkeypatch):
+    release = threading.Event()
+    set_client_factory(lambda: HangingClient(release))
+
+    async def short_run_db(fn, *args, **kwargs):
+        return await run_db(fn, *args, **{**kwargs, "timeout": 0.05})
+
+    monkeypatch.setattr(api_db, "run_db", short_run_db)
+    yield
+    release.set()
+    set_client_factory(None)
+
+
+def test_job_list_timeout_returns_504(hanging_db):
+    response = TestClient(app).get("/api/jobs", params={"limit": 10})
+    assert response.status_code == 504
+    assert "タイムアウト" in response.json()["detail"]
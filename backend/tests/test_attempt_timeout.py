@@ -0,0 +1,87 @@
+"""再試行のタイムアウトから順番待ちを除くことのテスト"""
+
+import asyncio
+
+import pytest
+
+from src.models.config import RetryConfig, ThrottleConfig
+from src.scrapers.attempt_timeout import run_with_timeout, waiting
+from src.scrapers.retry import RetryBudget, with_retry
+from src.scrapers.throttle import AdaptiveLimiter
+
+RETRY = RetryConfig(max_attempts=2, delay=0.01, max_delay=0.01, budget=5)
+
+
+class TestRunWithTimeout:
+    def test_waiting_is_not_counted(self):
+        async def operation():
+            async with waiting():
+                await asyncio.sleep(0.15)
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        assert asyncio.run(run_with_timeout(operation, 0.05)) == "ok"
+
+    def test_work_is_counted(self):
+        cancelled = []
+
+        async def operation():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run_with_timeout(operation, 0.05))
+        assert cancelled == [True]
+
+    def test_exception_is_propagated(self):
+        async def operation():
+            raise ValueError("失敗")
+
+        with pytest.raises(ValueError, match="失敗"):
+            asyncio.run(run_with_timeout(operation, 1))
+
+    def test_waiting_outside_attempt_is_noop(self):
+        async def run():
+            async with waiting():
+                return "ok"
+
+        assert asyncio.run(run()) == "ok"
+
+
+class TestWithRetry:
+    def test_limiter_wait_does_not_spend_budget(self):
+        limiter = AdaptiveLimiter("example.com", ThrottleConfig(initial_concurrency=1, initial_delay=0))
+        budget = RetryBudget(RETRY.budget)
+
+        async def request():
+            async with limiter.request():
+                await asyncio.sleep(0.01)
+                return "ok"
+
+        async def run():
+            # 他のリクエストが枠を 0.15 秒使っている間、タイムアウト 0.05 秒の試行が待つ
+            async def hold():
+                async with limiter.request():
+                    await asyncio.sleep(0.15)
+
+            holder = asyncio.create_task(hold())
+            await asyncio.sleep(0)
+            result = await with_retry(request, RETRY, budget, label="test", timeout=0.05)
+            await holder
+            return result
+
+        assert asyncio.run(run()) == "ok"
+        assert budget.used == 0
+
+    def test_slow_request_spends_budget(self):
+        budget = RetryBudget(RETRY.budget)
+
+        async def request():
+            await asyncio.sleep(0.2)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(with_retry(request, RETRY, budget, label="test", timeout=0.05))
+        assert budget.by_error == {"timeout": 1}
@@ -0,0 +1,171 @@
+"""ブラウザプールの死活検査のテスト（Playwright の代わりに偽のブラウザを使う）"""
+
+import asyncio
+
+from src.models.config import BrowserPoolConfig, RetryConfig
+from src.scrapers.browser_pool import BrowserPool
+from src.scrapers.retry import RetryBudget, with_retry
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser") -> None:
+        self.browser = browser
+
+    async def close(self) -> None:
+        if self.browser.hung:
+            await asyncio.Event().wait()
+
+
+class FakeBrowser:
+    """hung=True にすると接続したまま応答しなくなる"""
+
+    def __init__(self) -> None:
+        self.hung = False
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, **options) -> FakeContext:
+        if self.hung:
+            await asyncio.Event().wait()
+        return FakeContext(self)
+
+    async def close(self) -> None:
+        if self.hung:
+            await asyncio.Event().wait()
+        self.connected = False
+
+
+def make_pool(browsers: int = 2, interval: float = 0) -> BrowserPool:
+    config = BrowserPoolConfig(
+        browsers=browsers,
+        contexts_per_browser=2,
+        health_check_interval=interval,
+        health_check_timeout=0.05,
+    )
+    pool = BrowserPool(config)
+    launched: list[FakeBrowser] = []
+
+    async def launch() -> FakeBrowser:
+        browser = FakeBrowser()
+        launched.append(browser)
+        pool._stats["browsers_launched"] += 1
+        return browser
+
+    pool._launch_browser = launch
+    pool.launched = launched
+    return pool
+
+
+async def start(pool: BrowserPool) -> None:
+    """1回貸し出してブラウザを起動させる"""
+    async with pool.context():
+        pass
+
+
+class TestHealthCheck:
+    def test_healthy_browsers_are_kept(self):
+        async def run():
+            pool = make_pool()
+            await start(pool)
+            stats = await pool.health_check()
+            await pool.close()
+            return pool, stats
+
+        pool, stats = asyncio.run(run())
+        assert stats["health_checks"] == 1
+        assert stats["health_check_failures"] == 0
+        assert stats["browsers_healthy"] == 2
+        assert stats["browsers_relaunched"] == 0
+        assert len(pool.launched) == 2
+
+    def test_hung_browser_is_relaunched(self):
+        async def run():
+            pool = make_pool()
+            await start(pool)
+            pool.launched[0].hung = True
+            stats = await pool.health_check()
+            await pool.close()
+            return pool, stats
+
+        pool, stats = asyncio.run(run())
+        assert stats["health_check_failures"] == 1
+        assert stats["browsers_relaunched"] == 1
+        assert stats["browsers_healthy"] == 2
+        assert len(pool.launched) == 3
+        assert "応答なし" in stats["browser_health"][0]["last_error"]
+
+    def test_leased_browser_is_not_probed(self):
+        async def run():
+            pool = make_pool(browsers=1)
+            async with pool.context():
+                pool.launched[0].hung = True
+                stats = await pool.health_check()
+                pool.launched[0].hung = False
+            await pool.close()
+            return stats
+
+        stats = asyncio.run(run())
+        assert stats["health_check_failures"] == 0
+        assert stats["browsers_relaunched"] == 0
+
+    def test_periodic_check_recycles_hung_browser(self):
+        async def run():
+            pool = make_pool(browsers=1, interval=0.01)
+            await start(pool)
+            pool.launched[0].hung = True
+            for _ in range(100):
+                if pool.stats()["browsers_relaunched"]:
+                    break
+                await asyncio.sleep(0.01)
+            # 新しいブラウザで貸し出せる
+            async with pool.context():
+                pass
+            await pool.close()
+            return pool
+
+        pool = asyncio.run(run())
+        assert pool.stats()["browsers_relaunched"] >= 1
+        assert pool._health_task is None
+
+    def test_closed_pool_skips_check(self):
+        async def run():
+            pool = make_pool()
+            await start(pool)
+            await pool.close()
+            return await pool.health_check()
+
+        stats = asyncio.run(run())
+        assert stats["health_checks"] == 0
+        assert stats["closed"]
+
+
+class TestLeaseWait:
+    def test_lease_wait_is_not_part_of_attempt_timeout(self):
+        budget = RetryBudget(5)
+
+        async def run():
+            pool = make_pool(browsers=1)
+            pool.config.contexts_per_browser = 1
+            pool._capacity = asyncio.Semaphore(1)
+
+            async def hold():
+                async with pool.context():
+                    await asyncio.sleep(0.15)
+
+            async def attempt():
+                async with pool.context():
+                    return "ok"
+
+            holder = asyncio.create_task(hold())
+            await asyncio.sleep(0.01)
+            result = await with_retry(
+                attempt, RetryConfig(max_attempts=2, delay=0.01), budget, label="test", timeout=0.05
+            )
+            await holder
+            await pool.close()
+            return result
+
+        assert asyncio.run(run()) == "ok"
+        assert budget.used == 0
@@ -0,0 +1,92 @@
+"""一括 upsert のチャンク分割と失敗時の二分割再送のテスト"""
+
+import asyncio
+import threading
+
+from src.db.bulk_upsert import bulk_upsert, chunk_by_bytes, record_size
+
+
+def make_record(i: int, text: str = "", bad: bool = False) -> dict:
+    return {"job_id": str(i), "title": text, "bad": bad}
+
+
+class FakeQuery:
+    def __init__(self, client: "FakeClient") -> None:
+        self.client = client
+
+    def upsert(self, rows: list[dict], on_conflict: str) -> "FakeQuery":
+        self.rows = rows
+        return self
+
+    def execute(self) -> None:
+        with self.client.lock:
+            self.client.requests.append([row["job_id"] for row in self.rows])
+        if any(row["bad"] for row in self.rows):
+            raise ValueError("invalid row")
+
+
+class FakeClient:
+    """bad=True の行を含むチャンクの upsert を失敗させるクライアント"""
+
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+        self.lock = threading.Lock()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self)
+
+
+class TestChunkByBytes:
+    def test_respects_max_rows(self):
+        chunks = chunk_by_bytes([make_record(i) for i in range(7)], max_rows=3)
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+    def test_respects_max_bytes(self):
+        records = [make_record(i, "あ" * 100) for i in range(10)]
+        max_bytes = record_size(records[0]) * 3 + 10
+        chunks = chunk_by_bytes(records, max_bytes=max_bytes)
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        for chunk in chunks:
+            assert 2 + sum(record_size(r) + 1 for r in chunk) <= max_bytes
+
+    def test_oversized_record_is_own_chunk(self):
+        records = [make_record(0), make_record(1, "x" * 1000), make_record(2)]
+        chunks = chunk_by_bytes(records, max_bytes=200)
+        assert [[r["job_id"] for r in chunk] for chunk in chunks] == [["0"], ["1"], ["2"]]
+
+    def test_keeps_order(self):
+        records = [make_record(i) for i in range(10)]
+        chunks = chunk_by_bytes(records, max_rows=4)
+        assert [r for chunk in chunks for r in chunk] == records
+
+    def test_empty(self):
+        assert chunk_by_bytes([]) == []
+
+
+class TestBulkUpsert:
+    def test_all_rows_written(self):
+        client = FakeClient()
+        result = asyncio.run(bulk_upsert(client, "jobs", [make_record(i) for i in range(10)], max_rows=4))
+
+        assert result.written == 10
+        assert result.requests == 3
+        assert result.failed_keys == []
+
+    def test_bisects_failed_chunk(self):
+        client = FakeClient()
+        records = [make_record(i, bad=i == 5) for i in range(8)]
+        result = asyncio.run(bulk_upsert(client, "jobs", records, max_rows=8))
+
+        # 8 → 4+4 → 2+2 → 1+1 と分割し、不正な1行だけを失敗にする
+        assert result.written == 7
+        assert result.failed_keys == ["5"]
+        assert result.errors == ["invalid row"]
+        assert result.requests == 7
+        written = {job_id for ids in client.requests if "5" not in ids for job_id in ids}
+        assert written == {str(i) for i in range(8)} - {"5"}
+
+    def test_empty(self):
+        client = FakeClient()
+        result = asyncio.run(bulk_upsert(client, "jobs", []))
+        assert (result.written, result.requests, client.requests) == (0, 0, [])
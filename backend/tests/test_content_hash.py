@@ -0,0 +1,87 @@
+"""コンテンツハッシュによる新規・更新・変更なしの分類のテスト"""
+
+from src.db.content_hash import compute_content_hash, split_by_change, touch_scraped_at
+
+
+def make_record(job_id: str, title: str = "案件", scraped_at: str = "2026-01-01T00:00:00") -> dict:
+    return {"job_id": job_id, "title": title, "scraped_at": scraped_at}
+
+
+class FakeQuery:
+    def __init__(self, calls: list) -> None:
+        self.calls = calls
+
+    def update(self, values: dict) -> "FakeQuery":
+        self.values = values
+        return self
+
+    def in_(self, column: str, values: list) -> "FakeQuery":
+        self.calls.append((self.values, column, list(values)))
+        return self
+
+    def execute(self) -> None:
+        return None
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls: list = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self.calls)
+
+
+class TestComputeContentHash:
+    def test_ignores_scraped_at_and_key_order(self):
+        a = {"job_id": "1", "title": "案件", "scraped_at": "2026-01-01T00:00:00"}
+        b = {"scraped_at": "2026-02-01T00:00:00", "title": "案件", "job_id": "1"}
+        assert compute_content_hash(a) == compute_content_hash(b)
+
+    def test_content_change_changes_hash(self):
+        assert compute_content_hash(make_record("1")) != compute_content_hash(make_record("1", "別の案件"))
+
+
+class TestSplitByChange:
+    def test_classifies_records(self):
+        unchanged = make_record("1")
+        existing = {
+            "1": compute_content_hash(unchanged),
+            "2": compute_content_hash(make_record("2", "古いタイトル")),
+            "4": None,
+        }
+        records = [make_record("1"), make_record("2", "新しいタイトル"), make_record("3"), make_record("4")]
+
+        new, changed, same = split_by_change(records, existing)
+
+        assert [r["job_id"] for r in new] == ["3"]
+        # ハッシュ未計算（None）の行は更新として扱う
+        assert [r["job_id"] for r in changed] == ["2", "4"]
+        assert [r["job_id"] for r in same] == ["1"]
+
+    def test_sets_content_hash(self):
+        new, _, _ = split_by_change([make_record("1")], {})
+        assert new[0]["content_hash"] == compute_content_hash(make_record("1"))
+
+    def test_duplicate_job_id_uses_last_record(self):
+        new, _, _ = split_by_change([make_record("1", "古い"), make_record("1", "新しい")], {})
+        assert [r["title"] for r in new] == ["新しい"]
+
+    def test_skips_records_without_job_id(self):
+        new, changed, same = split_by_change([{"title": "IDなし"}, make_record("")], {})
+        assert (new, changed, same) == ([], [], [])
+
+
+class TestTouchScrapedAt:
+    def test_updates_latest_scraped_at_in_chunks(self, monkeypatch):
+        monkeypatch.setattr("src.db.content_hash.EXISTING_HASH_CHUNK_SIZE", 2)
+        client = FakeClient()
+        records = [make_record(str(i), scraped_at=f"2026-01-0{i + 1}T00:00:00") for i in range(5)]
+
+        assert touch_scraped_at(client, records) == 3
+        assert [ids for _, _, ids in client.calls] == [["0", "1"], ["2", "3"], ["4"]]
+        assert {values["scraped_at"] for values, _, _ in client.calls} == {"2026-01-05T00:00:00"}
+
+    def test_no_records_sends_nothing(self):
+        client = FakeClient()
+        assert touch_scraped_at(client, []) == 0
+        assert client.calls == []
@@ -0,0 +1,226 @@
+"""JobColumns・job_codec の変換が従来の手書き変換と同じ結果になることのテスト"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.job import BudgetType, ClientInfo, JobCategory, JobInfo, JobStatus, JobType, Service
+from src.models.job_batch import COLUMNS, JobColumns
+from src.models.job_codec import DB_COLUMNS, db_record_to_job, db_records_to_jobs
+
+
+# =============================================================================
+# 従来の変換（比較用）
+# =============================================================================
+
+def legacy_to_dict(job: JobInfo) -> dict:
+    """従来の JobInfo.to_dict"""
+    return {
+        "title": job.title,
+        "description": job.description,
+        "category": job.category.value,
+        "budget_type": job.budget_type.value,
+        "job_id": job.job_id,
+        "job_type": job.job_type.value,
+        "status": job.status.value,
+        "budget_min": job.budget_min,
+        "budget_max": job.budget_max,
+        "deadline": job.deadline,
+        "remaining_days": job.remaining_days,
+        "required_skills": job.required_skills,
+        "tags": job.tags,
+        "feature_tags": job.feature_tags,
+        "proposal_count": job.proposal_count,
+        "recruitment_count": job.recruitment_count,
+        "source": job.source.value,
+        "url": job.url,
+        "client": {
+            "name": job.client.name,
+            "rating": job.client.rating,
+            "review_count": job.client.review_count,
+            "order_history": job.client.order_history,
+        } if job.client else None,
+        "scraped_at": job.scraped_at.isoformat(),
+    }
+
+
+def legacy_job_info_to_dict(job: JobInfo, category: str) -> dict:
+    """従来の定期実行スクリプトの JobInfo → dict"""
+    return {
+        "title": job.title,
+        "description": job.description,
+        "category": category,
+        "subcategory": job.category.value if job.category else None,
+        "budget_type": job.budget_type.value if job.budget_type else "unknown",
+        "job_id": job.job_id,
+        "job_type": job.job_type.value if job.job_type else "project",
+        "status": job.status.value if job.status else "open",
+        "budget_min": job.budget_min,
+        "budget_max": job.budget_max,
+        "deadline": job.deadline,
+        "remaining_days": job.remaining_days,
+        "required_skills": job.required_skills or [],
+        "tags": job.tags or [],
+        "feature_tags": job.feature_tags or [],
+        "proposal_count": job.proposal_count,
+        "recruitment_count": job.recruitment_count,
+        "source": job.source.value if job.source else "lancers",
+        "url": job.url,
+        "client": {
+            "name": job.client.name if job.client else None,
+            "rating": job.client.rating if job.client else None,
+            "order_history": job.client.order_history if job.client else None,
+        } if job.client else None,
+        "scraped_at": job.scraped_at.isoformat(),
+    }
+
+
+def legacy_job_to_db_record(job: dict) -> dict:
+    """従来の dict → DB レコード"""
+    client = job.get("client") or {}
+    return {
+        "job_id": job.get("job_id"),
+        "title": job.get("title", ""),
+        "description": job.get("description", ""),
+        "category": job.get("category", "other"),
+        "subcategory": job.get("subcategory"),
+        "budget_type": job.get("budget_type", "unknown"),
+        "job_type": job.get("job_type", "project"),
+        "status": job.get("status", "open"),
+        "budget_min": job.get("budget_min"),
+        "budget_max": job.get("budget_max"),
+        "deadline": job.get("deadline"),
+        "remaining_days": job.get("remaining_days"),
+        "required_skills": job.get("required_skills", []),
+        "tags": job.get("tags", []),
+        "feature_tags": job.get("feature_tags", []),
+        "proposal_count": job.get("proposal_count"),
+        "recruitment_count": job.get("recruitment_count"),
+        "source": job.get("source", "lancers"),
+        "url": job.get("url", ""),
+        "client_name": client.get("name") if isinstance(client, dict) else job.get("client_name"),
+        "client_rating": client.get("rating") if isinstance(client, dict) else job.get("client_rating"),
+        "client_review_count": client.get("review_count") if isinstance(client, dict) else job.get("client_review_count"),
+        "client_order_history": client.get("order_history") if isinstance(client, dict) else job.get("client_order_history"),
+        "scraped_at": job.get("scraped_at", datetime.now().isoformat()),
+    }
+
+
+def legacy_db_record_to_job(record: dict) -> dict:
+    """従来の DB レコード → API 用 dict"""
+    return {column: record.get(column, default) for column, default in DB_COLUMNS}
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def make_job(i: int, client: bool = True) -> JobInfo:
+    categories = list(JobCategory)
+    return JobInfo(
+        title=f"Pythonでのスクレイピングツール開発 #{i}",
+        description=f"案件{i}の説明文。",
+        category=categories[i % len(categories)],
+        budget_type=BudgetType.FIXED,
+        source=Service.LANCERS,
+        url=f"https://www.lancers.jp/work/detail/{5000000 + i}",
+        job_id=str(5000000 + i),
+        job_type=JobType.PROJECT,
+        status=JobStatus.OPEN,
+        budget_min=50000,
+        budget_max=100000,
+        deadline="2026年1月31日",
+        remaining_days=i % 14,
+        required_skills=["Python", "スクレイピング"],
+        tags=["システム開発"],
+        feature_tags=["急募"],
+        proposal_count=i % 30,
+        recruitment_count=1,
+        client=ClientInfo(name=f"client{i}", rating=4.8, review_count=12, order_history=30) if client else None,
+        scraped_at=datetime(2026, 1, 1, 12, 0, 0),
+    )
+
+
+@pytest.fixture
+def jobs() -> list[JobInfo]:
+    return [make_job(i, client=i % 5 != 0) for i in range(20)]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+class TestJobToDict:
+    def test_matches_legacy(self, jobs):
+        for job in jobs:
+            assert job.to_dict() == legacy_to_dict(job)
+
+
+class TestFromJobs:
+    def test_matches_scheduled_script_records(self, jobs):
+        rows = JobColumns.from_jobs(jobs, "system").to_rows()
+        for job, row in zip(jobs, rows):
+            expected = legacy_job_to_db_record(legacy_job_info_to_dict(job, "system"))
+            # 従来のスクリプトは client の review_count が抜けていた
+            expected["client_review_count"] = job.client.review_count if job.client else None
+            assert row == expected
+
+    def test_matches_api_records(self, jobs):
+        rows = JobColumns.from_jobs(jobs, "system").to_rows()
+        for job, row in zip(jobs, rows):
+            api_job = {**job.to_dict(), "subcategory": job.category.value, "category": "system"}
+            assert row == legacy_job_to_db_record(api_job)
+
+    def test_default_category(self, jobs):
+        batch = JobColumns.from_jobs(jobs)
+        assert set(batch["category"]) == {"other"}
+
+    def test_columns_in_db_order(self, jobs):
+        row = JobColumns.from_jobs(jobs[:1]).to_rows()[0]
+        assert list(row) == COLUMNS
+
+
+class TestFromRecords:
+    def test_nested_client_matches_legacy(self, jobs):
+        api_jobs = [{**job.to_dict(), "category": "web"} for job in jobs]
+        assert JobColumns.from_records(api_jobs).to_rows() == [
+            legacy_job_to_db_record(job) for job in api_jobs
+        ]
+
+    def test_flat_client_round_trip(self, jobs):
+        # DB レコード（client_ 付きのカラム）はそのまま戻る
+        rows = JobColumns.from_jobs(jobs, "web").to_rows()
+        assert JobColumns.from_records(rows).to_rows() == rows
+
+    def test_missing_keys_use_defaults(self):
+        row = JobColumns.from_records([{"job_id": "1", "scraped_at": "2026-01-01T00:00:00"}]).to_rows()[0]
+        expected = legacy_job_to_db_record({"job_id": "1", "scraped_at": "2026-01-01T00:00:00"})
+        assert row == expected
+
+    def test_list_defaults_are_not_shared(self):
+        rows = JobColumns.from_records([{"job_id": "1"}, {"job_id": "2"}]).to_rows()
+        rows[0]["tags"].append("x")
+        assert rows[1]["tags"] == []
+
+    def test_filter_drops_rows_without_job_id(self):
+        batch = JobColumns.from_records([{"job_id": "1"}, {"job_id": None}, {"job_id": "3"}])
+        assert batch.filter("job_id")["job_id"] == ["1", "3"]
+
+
+class TestDbRecordToJob:
+    def test_matches_legacy(self, jobs):
+        rows = JobColumns.from_jobs(jobs, "system").to_rows()
+        assert [db_record_to_job(row) for row in rows] == [legacy_db_record_to_job(row) for row in rows]
+
+    def test_partial_record_matches_legacy(self):
+        record = {"job_id": "1", "title": "案件", "tags": None}
+        assert db_record_to_job(record) == legacy_db_record_to_job(record)
+
+    def test_list_defaults_are_not_shared(self):
+        first, second = db_records_to_jobs([{"job_id": "1"}, {"job_id": "2"}])
+        first["required_skills"].append("Python")
+        assert second["required_skills"] == []
+
+    def test_fields_projection(self):
+        jobs = db_records_to_jobs([{"job_id": "1", "title": "案件", "description": "長い説明"}], ["job_id", "title", "tags"])
+        assert jobs == [{"job_id": "1", "title": "案件", "tags": []}]
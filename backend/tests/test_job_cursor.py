@@ -0,0 +1,40 @@
+"""案件一覧のカーソルと fields パラメータのテスト"""
+
+import pytest
+
+from src.api.db import decode_job_cursor, encode_job_cursor, parse_job_fields
+
+
+class TestJobCursor:
+    def test_round_trip(self):
+        job = {"job_id": "5012345", "scraped_at": "2026-01-01T12:00:00.123456+00:00", "title": "案件"}
+        assert decode_job_cursor(encode_job_cursor(job)) == ("2026-01-01T12:00:00.123456+00:00", "5012345")
+
+    def test_url_safe_without_padding(self):
+        for length in range(1, 8):
+            cursor = encode_job_cursor({"job_id": "1" * length, "scraped_at": "2026-01-01"})
+            assert "=" not in cursor
+            assert all(c.isalnum() or c in "-_" for c in cursor)
+            assert decode_job_cursor(cursor) == ("2026-01-01", "1" * length)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WzEsMl0", "eyJhIjoxfQ"])
+    def test_invalid_cursor(self, cursor):
+        # 空・base64 でない・要素が文字列でない（[1,2]）・配列でない（{"a":1}）
+        with pytest.raises(ValueError):
+            decode_job_cursor(cursor)
+
+
+class TestParseJobFields:
+    def test_empty_means_all_columns(self):
+        assert parse_job_fields(None) is None
+        assert parse_job_fields("") is None
+
+    def test_adds_page_keys(self):
+        assert parse_job_fields("title, job_id ,budget_min") == ["title", "job_id", "budget_min", "scraped_at"]
+
+    def test_ignores_empty_names_and_duplicates(self):
+        assert parse_job_fields("title,,title") == ["title", "scraped_at", "job_id"]
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="password"):
+            parse_job_fields("title,password")
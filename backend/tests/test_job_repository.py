@@ -0,0 +1,88 @@
+"""案件リポジトリの取得とエラー処理のテスト"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.server import app
+from src.db import set_client_factory
+from src.db.job_repository import JobRepository, get_job_repository, job_id_from_key
+from src.models.errors import DatabaseError
+
+
+class FakeQuery:
+    """どのクエリ構築メソッドも自身を返し、execute で rows を返す（error があれば送出）"""
+
+    def __init__(self, client: "FakeClient") -> None:
+        self.client = client
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        self.client.executions += 1
+        if self.client.error is not None:
+            raise self.client.error
+        return type("Result", (), {"data": self.client.rows})()
+
+
+class FakeClient:
+    def __init__(self, rows: list[dict] = (), error: Exception = None) -> None:
+        self.rows = list(rows)
+        self.error = error
+        self.executions = 0
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self)
+
+
+class TestJobIdFromKey:
+    @pytest.mark.parametrize(
+        "key",
+        [
+            "5012345",
+            "https://www.lancers.jp/work/detail/5012345",
+            "https://www.lancers.jp/work/detail/5012345/?ref=top#detail",
+            "/work/detail/5012345",
+        ],
+    )
+    def test_extracts_last_segment(self, key):
+        assert job_id_from_key(key) == "5012345"
+
+
+class TestJobRepository:
+    def test_get_by_id_caches_copies(self):
+        client = FakeClient(rows=[{"job_id": "1", "title": "案件", "required_skills": ["Python"]}])
+        repository = JobRepository(lambda: client)
+
+        job = repository.get_by_id("1")
+        job["required_skills"].append("Go")
+
+        assert repository.get_by_id("1")["required_skills"] == ["Python"]
+        assert client.executions == 1
+
+    def test_database_error_is_translated(self):
+        repository = JobRepository(lambda: FakeClient(error=RuntimeError("PGRST301 connection refused")))
+
+        with pytest.raises(DatabaseError, match="PGRST301"):
+            repository.get_by_id("1")
+
+    def test_client_creation_error_is_translated(self):
+        def broken_factory():
+            raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment")
+
+        with pytest.raises(DatabaseError):
+            JobRepository(broken_factory).find("https://www.lancers.jp/work/detail/1")
+
+
+class TestJobRecordRoute:
+    @pytest.fixture
+    def client_error(self):
+        get_job_repository().invalidate()
+        set_client_factory(lambda: FakeClient(error=RuntimeError("PGRST301 connection refused")))
+        yield
+        set_client_factory(None)
+
+    def test_database_error_returns_500(self, client_error):
+        response = TestClient(app).get("/api/jobs/1/record")
+        assert response.status_code == 500
+        assert "案件の取得に失敗しました" in response.json()["detail"]
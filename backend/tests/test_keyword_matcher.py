@@ -0,0 +1,74 @@
+"""複数キーワードの一括検出のテスト（str.find とオートマトンの両方）"""
+
+import pytest
+
+from src.utils import keyword_matcher
+from src.utils.keyword_matcher import KeywordMatcher, needs_boundary
+
+BACKENDS = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(keyword_matcher.ahocorasick is None, reason="pyahocorasick がない"),
+    ),
+]
+
+KEYWORDS = [
+    ("AI", "ai"),
+    ("Go", "backend"),
+    ("Python", "backend"),
+    ("Django", "backend"),
+    ("機械学習", "ai"),
+]
+
+
+@pytest.fixture(params=BACKENDS, ids=["find", "automaton"])
+def matcher(request) -> KeywordMatcher[str]:
+    return KeywordMatcher(KEYWORDS, use_automaton=request.param)
+
+
+class TestNeedsBoundary:
+    @pytest.mark.parametrize("keyword", ["AI", "Go", "C", "PHP", "3D"])
+    def test_short_alnum(self, keyword):
+        assert needs_boundary(keyword)
+
+    @pytest.mark.parametrize("keyword", ["Python", "C++", "C#", "機械", "UI/UX"])
+    def test_long_or_symbols(self, keyword):
+        assert not needs_boundary(keyword)
+
+
+class TestKeywordMatcher:
+    def test_short_keyword_requires_word_boundary(self, matcher):
+        assert matcher.find("Djangoでのメール送信") == ["Django"]
+        assert matcher.find("email の自動送信") == []
+
+    def test_short_keyword_at_boundaries(self, matcher):
+        assert matcher.find("AI") == ["AI"]
+        assert matcher.find("Go/Python案件") == ["Go", "Python"]
+        # 日本語に挟まれていても英数字でなければ境界とみなす
+        assert matcher.find("生成AIを使った開発") == ["AI"]
+
+    def test_later_occurrence_at_boundary(self, matcher):
+        # 最初の出現が単語の途中でも、後ろに境界を満たす出現があれば一致
+        assert matcher.find("mail と AI") == ["AI"]
+
+    def test_case_insensitive(self, matcher):
+        assert matcher.find("python and go") == ["Go", "Python"]
+
+    def test_results_in_registration_order(self, matcher):
+        assert matcher.find("機械学習 Django Python AI") == ["AI", "Python", "Django", "機械学習"]
+
+    def test_count_labels(self, matcher):
+        assert matcher.count_labels("AI と機械学習、Python、AI") == {"ai": 2, "backend": 1}
+
+    def test_no_keywords(self):
+        assert KeywordMatcher([], use_automaton=False).find("AI") == []
+
+    def test_backends_agree(self):
+        if keyword_matcher.ahocorasick is None:
+            pytest.skip("pyahocorasick がない")
+        texts = ["Djangoとgo", "AIエンジニア", "email", "GO言語でAPI", "pythonista"]
+        find = KeywordMatcher(KEYWORDS, use_automaton=False)
+        automaton = KeywordMatcher(KEYWORDS, use_automaton=True)
+        for text in texts:
+            assert find.find(text) == automaton.find(text)
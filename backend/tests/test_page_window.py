@@ -0,0 +1,135 @@
+"""作業キュー上での一覧ページ先読みのテスト"""
+
+import pytest
+
+from src.scrapers.page_window import PageWindow
+from src.scrapers.work_queue import UNIT_PAGE, WorkQueue
+
+PAGE_SIZE = 20
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite3")
+    yield queue
+    queue.close()
+
+
+def make_window(queue: WorkQueue, run_id: str, **options) -> PageWindow:
+    options = {"max_pages": 10, "window": 3, "skip_pages": 1, **options}
+    return PageWindow(queue, run_id, labels=["system", "web"], page_size=PAGE_SIZE, **options)
+
+
+def pages(queue: WorkQueue, run_id: str, selection: int = 0, status: str = "pending") -> list[int]:
+    return sorted(
+        unit["payload"]["page"]
+        for unit in queue.units(run_id, UNIT_PAGE)
+        if unit["payload"]["selection"] == selection and unit["status"] == status
+    )
+
+
+def finish(queue: WorkQueue, run_id: str, window: PageWindow, count: int) -> int:
+    """次の作業を取り出し、count 件取得したとして完了にする"""
+    unit = queue.claim(run_id)
+    window.page_done(unit.payload["selection"], unit.payload["page"], count)
+    queue.complete(unit, {"jobs": [{}] * count})
+    return unit.payload["page"]
+
+
+class TestPageWindow:
+    def test_start_enqueues_window_per_selection(self, queue):
+        run_id = queue.create_run({})
+        make_window(queue, run_id).start()
+        assert pages(queue, run_id, 0) == [1, 2, 3]
+        assert pages(queue, run_id, 1) == [1, 2, 3]
+
+    def test_start_respects_max_pages(self, queue):
+        run_id = queue.create_run({})
+        make_window(queue, run_id, max_pages=2).start()
+        assert pages(queue, run_id, 0) == [1, 2]
+
+    def test_full_page_enqueues_window_ahead(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id)
+        window.start()
+        assert finish(queue, run_id, window, PAGE_SIZE) == 1
+        assert pages(queue, run_id, 0) == [2, 3, 4]
+
+    def test_no_pages_beyond_max_pages(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id, max_pages=3)
+        window.start()
+        window.page_done(0, 1, PAGE_SIZE)
+        assert pages(queue, run_id, 0) == [1, 2, 3]
+
+    def test_short_page_discards_later_pages(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id)
+        window.start()
+        window.page_done(0, 1, PAGE_SIZE)
+        assert pages(queue, run_id, 0) == [1, 2, 3, 4]
+
+        assert window.page_done(0, 2, 5)
+        assert window.last_page(0) == 2
+        assert pages(queue, run_id, 0) == [1, 2]
+        # 他のカテゴリには影響しない
+        assert pages(queue, run_id, 1) == [1, 2, 3]
+
+    def test_late_full_page_does_not_pass_last_page(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id)
+        window.start()
+        window.page_done(0, 2, 0)
+        # 先読みしていた1ページ目が後から埋まって完了しても、最終ページより先は登録しない
+        window.page_done(0, 1, PAGE_SIZE)
+        assert pages(queue, run_id, 0) == [1, 2]
+
+    def test_claimed_pages_are_not_discarded(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id)
+        window.start()
+        claimed = [queue.claim(run_id, UNIT_PAGE) for _ in range(3)]
+        window.page_done(0, 1, 0)
+        assert [unit.payload["page"] for unit in claimed] == [1, 2, 3]
+        assert pages(queue, run_id, 0, status="claimed") == [1, 2, 3]
+
+    def test_failed_page_is_skipped(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id, skip_pages=1)
+        window.start()
+        assert window.page_failed(0, 2)
+        assert pages(queue, run_id, 0) == [1, 2, 3, 5]
+
+    def test_stops_after_skip_pages(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id, skip_pages=1)
+        window.start()
+        window.page_failed(0, 1)
+        assert not window.page_failed(0, 2)
+        assert pages(queue, run_id, 0) == [1, 2]
+        assert window.last_page(0) == 2
+
+    def test_restore_replays_queue_state(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id)
+        window.start()
+        finish(queue, run_id, window, PAGE_SIZE)  # system:1
+        finish(queue, run_id, window, 3)  # system:2（最終ページ）
+
+        restored = make_window(queue, run_id)
+        restored.restore()
+        assert restored.last_page(0) == 2
+        assert restored.last_page(1) is None
+        assert pages(queue, run_id, 0) == []
+        assert pages(queue, run_id, 0, status="done") == [1, 2]
+
+    def test_restore_enqueues_missing_successor(self, queue):
+        run_id = queue.create_run({})
+        window = make_window(queue, run_id)
+        window.start()
+        # 後続を登録する前に落ちた場合（完了だけ記録されている）
+        unit = queue.claim(run_id)
+        queue.complete(unit, {"jobs": [{}] * PAGE_SIZE})
+
+        make_window(queue, run_id).restore()
+        assert pages(queue, run_id, 0) == [2, 3, 4]
@@ -0,0 +1,83 @@
+"""検索結果ページの先読み取得のテスト"""
+
+import asyncio
+
+import pytest
+
+from src.scrapers.paginator import Paginator
+
+PAGE_SIZE = 3
+
+
+class FakeSite:
+    """last_page までのページを返す（last_page は PAGE_SIZE 未満の件数）"""
+
+    def __init__(self, last_page: int, failing: frozenset[int] = frozenset()) -> None:
+        self.last_page = last_page
+        self.failing = failing
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def fetch_page(self, page: int) -> list[str]:
+        self.started.append(page)
+        try:
+            # 後のページほど先に終わらないよう、ページ番号順に少しずつ遅らせる
+            await asyncio.sleep(0.01 * page)
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        if page in self.failing:
+            raise RuntimeError(f"page {page} failed")
+        if page > self.last_page:
+            return []
+        size = 1 if page == self.last_page else PAGE_SIZE
+        return [f"{page}-{i}" for i in range(size)]
+
+
+async def collect(paginator: Paginator) -> list[tuple[int, list[str]]]:
+    return [(page, items) async for page, items in paginator.pages()]
+
+
+class TestPaginator:
+    def test_pages_in_order(self):
+        site = FakeSite(last_page=4)
+        pages = asyncio.run(collect(Paginator(site.fetch_page, max_pages=10, page_size=PAGE_SIZE, window=3)))
+
+        assert [page for page, _ in pages] == [1, 2, 3, 4]
+        assert pages[-1][1] == ["4-0"]
+
+    def test_short_page_cancels_prefetch(self):
+        site = FakeSite(last_page=2)
+        pages = asyncio.run(collect(Paginator(site.fetch_page, max_pages=10, page_size=PAGE_SIZE, window=3)))
+
+        assert [page for page, _ in pages] == [1, 2]
+        # 2ページ目が最終ページと分かった時点で先読み中のページを取り消す
+        assert max(site.started) <= 2 + 3
+        assert site.cancelled
+        assert all(page > 2 for page in site.cancelled)
+
+    def test_window_limits_in_flight_pages(self):
+        site = FakeSite(last_page=10)
+        asyncio.run(collect(Paginator(site.fetch_page, max_pages=2, page_size=PAGE_SIZE, window=5)))
+        assert site.started == [1, 2]
+
+    def test_skips_failed_pages(self):
+        site = FakeSite(last_page=4, failing=frozenset({2}))
+        paginator = Paginator(site.fetch_page, max_pages=10, page_size=PAGE_SIZE, window=2, max_failures=1)
+        pages = asyncio.run(collect(paginator))
+
+        assert [page for page, _ in pages] == [1, 3, 4]
+        assert paginator.failed_pages == [2]
+
+    def test_raises_after_max_failures(self):
+        site = FakeSite(last_page=5, failing=frozenset({2, 3}))
+        paginator = Paginator(site.fetch_page, max_pages=10, page_size=PAGE_SIZE, window=2, max_failures=1)
+
+        with pytest.raises(RuntimeError, match="page 3 failed"):
+            asyncio.run(collect(paginator))
+        assert paginator.failed_pages == [2]
+
+    def test_no_failures_allowed_by_default(self):
+        site = FakeSite(last_page=3, failing=frozenset({1}))
+        with pytest.raises(RuntimeError):
+            asyncio.run(collect(Paginator(site.fetch_page, max_pages=10, page_size=PAGE_SIZE)))
@@ -0,0 +1,75 @@
+"""有効期限付きキャッシュのテスト"""
+
+import pytest
+
+from src.utils import ttl_cache
+from src.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic を手動で進める時計"""
+
+    class Clock:
+        now = 1000.0
+
+        def advance(self, seconds: float) -> None:
+            self.now += seconds
+
+    fake = Clock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: fake.now)
+    return fake
+
+
+class TestTTLCache:
+    def test_hit_before_expiry(self, clock):
+        cache: TTLCache[str, int] = TTLCache(ttl=10)
+        cache.set("a", 1)
+        clock.advance(9.9)
+        assert cache.get("a") == 1
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 0}
+
+    def test_expires_after_ttl(self, clock):
+        cache: TTLCache[str, int] = TTLCache(ttl=10)
+        cache.set("a", 1)
+        clock.advance(10)
+        assert cache.get("a") is None
+        # 期限切れのエントリは参照時に捨てる
+        assert len(cache) == 0
+        assert cache.stats()["misses"] == 1
+
+    def test_set_renews_expiry(self, clock):
+        cache: TTLCache[str, int] = TTLCache(ttl=10)
+        cache.set("a", 1)
+        clock.advance(8)
+        cache.set("a", 2)
+        clock.advance(8)
+        assert cache.get("a") == 2
+
+    def test_evicts_oldest_entry(self, clock):
+        cache: TTLCache[str, int] = TTLCache(ttl=10, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert (cache.get("b"), cache.get("c")) == (2, 3)
+
+    def test_replaced_key_counts_as_newest(self, clock):
+        cache: TTLCache[str, int] = TTLCache(ttl=10, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+        assert cache.get("b") is None
+        assert cache.get("a") == 3
+
+    def test_delete_and_clear(self, clock):
+        cache: TTLCache[str, int] = TTLCache(ttl=10)
+        for key in "abc":
+            cache.set(key, 0)
+        cache.delete(["a", "x"])
+        assert cache.get("a") is None
+        assert len(cache) == 2
+        cache.clear()
+        assert len(cache) == 0
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useEffect, useCallback, useRef } from "react";
+import { useState, useEffect, useCallback } from "react";
 import { PipelineLayout } from "@/components/pipeline-layout";
 import { PipelineSummary } from "@/components/pipeline-summary";
 import { ScraperSettings } from "@/components/scraper-settings";
@@ -9,11 +9,12 @@ import { ScraperStatsPanel } from "@/components/scraper-stats";
 import { ScraperHistory } from "@/components/scraper-history";
 import {
   startScraper,
-  getScraperStatus,
+  subscribeScraperStream,
   cancelScraper,
   getScraperStats,
   getScraperHistory,
   type ScraperStatus,
+  type ScraperJobStatus,
   type ScraperStats,
   type ScraperHistoryItem,
 } from "@/lib/api";
@@ -38,48 +39,47 @@ export default function DashboardPage() {
     }
   }, []);
 
-  // ポーリング用のref（isStartingの最新値を参照するため）
-  const isStartingRef = useRef(isStarting);
-  const wasRunningRef = useRef(false);
-
-  useEffect(() => {
-    isStartingRef.current = isStarting;
-  }, [isStarting]);
-
+  // SSEで進捗を購読（接続直後の snapshot 以降は差分を反映）
+  // イベントが捨てられた場合（lagged）はサーバーが snapshot を送り直す
   useEffect(() => {
-    let intervalId: NodeJS.Timeout | null = null;
-
-    const pollStatus = async () => {
-      try {
-        const statusData = await getScraperStatus();
-        setStatus(statusData);
-
-        // サーバーが実行中になったら isStarting を解除
-        if (statusData.is_running) {
-          setIsStarting(false);
-          wasRunningRef.current = true;
-        }
-
-        // 実行中→停止になった時だけデータを再読み込み
-        // isStarting中は停止しない（サーバーがまだ開始していない可能性がある）
-        if (!statusData.is_running && wasRunningRef.current && !isStartingRef.current) {
-          wasRunningRef.current = false;
-          loadData();
-        }
-      } catch (err) {
-        console.error("Failed to get status:", err);
-        setIsStarting(false);
-      }
+    const jobs = new Map<string, ScraperJobStatus>();
+
+    // 実行中のうち最新、なければ最後に開始したジョブを表示
+    const publish = () => {
+      const all = [...jobs.values()].sort((a, b) => b.started_at.localeCompare(a.started_at));
+      const running = all.filter((job) => job.is_running);
+      const latest = running[0] ?? all[0];
+      if (latest) setStatus({ ...latest, running_jobs: running.length });
+      if (running.length > 0) setIsStarting(false);
     };
 
-    pollStatus();
     loadData();
-    // 常にポーリングを続ける（2秒間隔）
-    intervalId = setInterval(pollStatus, 2000);
-
-    return () => {
-      if (intervalId) clearInterval(intervalId);
-    };
+    return subscribeScraperStream({
+      onSnapshot: (snapshot) => {
+        jobs.clear();
+        snapshot.forEach((job) => jobs.set(job.job_id, job));
+        publish();
+      },
+      onJobStarted: (job) => {
+        jobs.set(job.job_id, job);
+        publish();
+      },
+      onProgress: (delta) => {
+        const job = jobs.get(delta.job_id);
+        if (!job) return;
+        jobs.set(delta.job_id, { ...job, ...delta });
+        publish();
+      },
+      onJobFinished: (job) => {
+        jobs.set(job.job_id, job);
+        publish();
+        loadData();
+      },
+      onLagged: () => {
+        // 取りこぼした job_finished に伴う統計・履歴の更新を補う
+        loadData();
+      },
+    });
   }, [loadData]);
 
   const handleStart = async (settings: {
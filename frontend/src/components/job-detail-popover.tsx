@@ -2,7 +2,7 @@
 
 import { useState } from "react";
 import { Job, CATEGORY_LABELS, JOB_TYPE_LABELS, STATUS_LABELS } from "@/types/job";
-import { formatBudget } from "@/lib/api";
+import { fetchJobRecord, formatBudget } from "@/lib/api";
 import {
   Dialog,
   DialogContent,
@@ -22,12 +22,22 @@ interface JobDetailPopoverProps {
 
 export function JobDetailPopover({ job, children }: JobDetailPopoverProps) {
   const [isOpen, setIsOpen] = useState(false);
+  // 一覧は説明文を省いて取得するため、開いたときに読み込む
+  const [description, setDescription] = useState<string | undefined>(job.description);
+  const [isLoadingDescription, setIsLoadingDescription] = useState(false);
 
   const handleOpenChange = (open: boolean) => {
     setIsOpen(open);
+    if (open && description === undefined && job.job_id) {
+      setIsLoadingDescription(true);
+      fetchJobRecord(job.job_id)
+        .then((record) => setDescription(record.description ?? ""))
+        .catch((err) => console.error("Failed to fetch job description:", err))
+        .finally(() => setIsLoadingDescription(false));
+    }
   };
 
-  const hasDescription = job.description && job.description.length > 0;
+  const hasDescription = description && description.length > 0;
   const tags = job.tags || [];
   const featureTags = job.feature_tags || [];
   const requiredSkills = job.required_skills || [];
@@ -156,9 +166,11 @@ export function JobDetailPopover({ job, children }: JobDetailPopoverProps) {
           <Separator />
           <div>
             <div className="text-muted-foreground text-xs mb-2">説明</div>
-            {hasDescription ? (
+            {isLoadingDescription ? (
+              <p className="text-sm text-muted-foreground italic">読み込み中...</p>
+            ) : hasDescription ? (
               <p className="text-sm text-muted-foreground whitespace-pre-wrap">
-                {job.description}
+                {description}
               </p>
             ) : (
               <p className="text-sm text-muted-foreground italic">
@@ -26,7 +26,10 @@ export function PipelineSummary() {
     const loadCounts = async () => {
       // 案件数をAPIから取得
       try {
-        const res = await fetch(`${API_BASE_URL}/api/jobs?job_types=project`);
+        // 件数のみ必要なので1件・job_id だけ取得し、全件数は with_total で数える
+        const res = await fetch(
+          `${API_BASE_URL}/api/jobs?job_types=project&limit=1&fields=job_id&with_total=true`
+        );
         const data = await res.json();
         setCounts((prev) => ({ ...prev, jobs: data.total || 0 }));
       } catch (e) {
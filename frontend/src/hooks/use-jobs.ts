@@ -2,9 +2,33 @@
 
 import { useState, useEffect, useCallback } from "react";
 import { Job, isExpired } from "@/types/job";
-import { fetchJobs, cleanupExpiredJobs } from "@/lib/api";
+import { fetchJobs, cleanupExpiredJobs, JOB_LIST_FIELDS } from "@/lib/api";
 
 const JOBS_CACHE_KEY = "proposal-generator-jobs-cache";
+const JOB_TYPES = ["project", "task", "competition"];
+// 1リクエストの件数と、一覧に読み込む最大件数
+const JOBS_PAGE_SIZE = 50;
+const JOBS_MAX = 150;
+
+// 説明文を除いたカラムで一覧をページ単位に取得（ページごとに onPage で通知）
+async function fetchJobList(onPage: (jobs: Job[]) => void): Promise<Job[]> {
+  const jobs: Job[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const page = await fetchJobs(null, JOB_TYPES, {
+      limit: Math.min(JOBS_PAGE_SIZE, JOBS_MAX - jobs.length),
+      cursor,
+      fields: JOB_LIST_FIELDS,
+    });
+    // クライアント側でも期限切れをフィルタリング
+    jobs.push(...page.jobs.filter((job: Job) => !isExpired(job)));
+    onPage([...jobs]);
+    cursor = page.next_cursor;
+  } while (cursor && jobs.length < JOBS_MAX);
+
+  return jobs;
+}
 
 export function useJobs() {
   const [allJobs, setAllJobs] = useState<Job[]>([]);
@@ -49,9 +73,13 @@ export function useJobs() {
         console.warn("期限切れ削除をスキップ:", e);
       }
 
-      const result = await fetchJobs(null, ["project", "task", "competition"], 5);
-      // クライアント側でも期限切れをフィルタリング
-      const activeJobs = result.jobs.filter((job: Job) => !isExpired(job));
+      // キャッシュがある場合は全ページの取得後に置き換える
+      const activeJobs = await fetchJobList((jobs) => {
+        if (!hasCache) {
+          setAllJobs(jobs);
+          setIsLoading(false);
+        }
+      });
       setAllJobs(activeJobs);
       // キャッシュを更新
       localStorage.setItem(JOBS_CACHE_KEY, JSON.stringify(activeJobs));
@@ -79,10 +107,11 @@ export function useJobs() {
         console.warn("期限切れ削除をスキップ:", e);
       }
 
-      const result = await fetchJobs(null, ["project", "task", "competition"], 5);
-      // クライアント側でも期限切れをフィルタリング
-      const activeJobs = result.jobs.filter((job: Job) => !isExpired(job));
-      setAllJobs(activeJobs);
+      // 1ページ目が届いた時点で表示する
+      const activeJobs = await fetchJobList((jobs) => {
+        setAllJobs(jobs);
+        setIsLoading(false);
+      });
       // キャッシュを更新
       localStorage.setItem(JOBS_CACHE_KEY, JSON.stringify(activeJobs));
       return activeJobs;
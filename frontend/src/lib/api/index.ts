@@ -2,8 +2,11 @@
 export { API_BASE_URL, formatBudget } from "./base";
 
 // Jobs API
+export type { JobPage, FetchJobsOptions } from "./jobs";
 export {
+  JOB_LIST_FIELDS,
   fetchJobs,
+  fetchJobRecord,
   fetchCategories,
   fetchJobTypes,
   fetchJobDetail,
@@ -16,10 +19,13 @@ export type {
   ScraperStats,
   ScraperHistoryItem,
   ScraperStartRequest,
+  ScraperJobStatus,
+  ScraperStreamHandlers,
 } from "./scraper";
 export {
   startScraper,
   getScraperStatus,
+  subscribeScraperStream,
   cancelScraper,
   getScraperStats,
   getScraperHistory,
@@ -1,19 +1,73 @@
 import { Job, Category, JobType } from "@/types/job";
 import { API_BASE_URL } from "./base";
 
+// 一覧表示で取得するカラム（説明文は表示時に fetchJobRecord で取得する）
+export const JOB_LIST_FIELDS = [
+  "job_id",
+  "title",
+  "category",
+  "subcategory",
+  "budget_type",
+  "job_type",
+  "status",
+  "budget_min",
+  "budget_max",
+  "deadline",
+  "remaining_days",
+  "required_skills",
+  "tags",
+  "feature_tags",
+  "proposal_count",
+  "recruitment_count",
+  "source",
+  "url",
+  "client_name",
+  "client_rating",
+  "client_review_count",
+  "client_order_history",
+  "scraped_at",
+];
+
+export interface JobPage {
+  jobs: Job[];
+  // このページの件数
+  count: number;
+  // 次のページのカーソル（最後のページなら null）
+  next_cursor: string | null;
+  // 条件に一致する全件数（withTotal 指定時のみ）
+  total?: number;
+}
+
+export interface FetchJobsOptions {
+  limit?: number;
+  cursor?: string | null;
+  fields?: string[];
+  withTotal?: boolean;
+}
+
+// 案件一覧を1ページ取得（新しい順、次のページは next_cursor を cursor に渡す）
 export async function fetchJobs(
   category: string | null,
   jobTypes: string[],
-  maxPages: number = 3
-): Promise<{ jobs: Job[]; total: number }> {
+  options: FetchJobsOptions = {}
+): Promise<JobPage> {
   const params = new URLSearchParams({
     job_types: jobTypes.join(","),
-    max_pages: maxPages.toString(),
+    limit: (options.limit ?? 50).toString(),
   });
 
   if (category) {
     params.set("category", category);
   }
+  if (options.cursor) {
+    params.set("cursor", options.cursor);
+  }
+  if (options.fields) {
+    params.set("fields", options.fields.join(","));
+  }
+  if (options.withTotal) {
+    params.set("with_total", "true");
+  }
 
   const response = await fetch(`${API_BASE_URL}/api/jobs?${params}`);
 
@@ -24,6 +78,17 @@ export async function fetchJobs(
   return response.json();
 }
 
+// 保存済みの案件を1件取得（一覧で省いた説明文の表示用）
+export async function fetchJobRecord(jobId: string): Promise<Job> {
+  const response = await fetch(`${API_BASE_URL}/api/jobs/${jobId}/record`);
+
+  if (!response.ok) {
+    throw new Error("Failed to fetch job");
+  }
+
+  return response.json();
+}
+
 export async function fetchCategories(): Promise<Category[]> {
   const response = await fetch(`${API_BASE_URL}/api/categories`);
 
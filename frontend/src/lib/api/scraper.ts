@@ -15,6 +15,8 @@ export interface ScraperStatus {
   total_categories: number;
   detail_current: number;
   detail_total: number;
+  job_id?: string;
+  running_jobs?: number;
 }
 
 export interface ScraperStats {
@@ -25,11 +27,13 @@ export interface ScraperStats {
 }
 
 export interface ScraperHistoryItem {
+  job_id?: string;
   timestamp: string;
   category: string;
   count: number;
   added?: number;
   updated?: number;
+  unchanged?: number;
   status: "success" | "error" | "cancelled";
   error?: string;
   duration_seconds: number | null;
@@ -45,7 +49,7 @@ export interface ScraperStartRequest {
 
 export async function startScraper(
   request: ScraperStartRequest
-): Promise<{ success: boolean; message: string }> {
+): Promise<{ success: boolean; message: string; job_id: string }> {
   const response = await fetch(`${API_BASE_URL}/api/scraper/start`, {
     method: "POST",
     headers: {
@@ -62,6 +66,52 @@ export async function startScraper(
   return response.json();
 }
 
+export interface ScraperJobStatus extends ScraperStatus {
+  job_id: string;
+  status: "running" | "done" | "cancelled" | "error";
+  started_at: string;
+  finished_at: string | null;
+}
+
+export interface ScraperStreamHandlers {
+  onSnapshot?: (jobs: ScraperJobStatus[]) => void;
+  onJobStarted?: (job: ScraperJobStatus) => void;
+  onJobFinished?: (job: ScraperJobStatus) => void;
+  onProgress?: (delta: Partial<ScraperJobStatus> & { job_id: string }) => void;
+  onListed?: (data: { job_id: string; category: string; page: number; jobs: Record<string, unknown>[] }) => void;
+  onDetailed?: (data: { job_id: string; job: Record<string, unknown> }) => void;
+  onSaved?: (data: { job_id: string; job_ids: string[]; added: number; updated: number; unchanged: number }) => void;
+  onLagged?: (data: { dropped: number }) => void;
+}
+
+// スクレイピングの進捗をSSEで購読（戻り値の関数で購読解除）
+export function subscribeScraperStream(
+  handlers: ScraperStreamHandlers,
+  jobId?: string
+): () => void {
+  const url = new URL(`${API_BASE_URL}/api/scraper/stream`);
+  if (jobId) url.searchParams.set("job_id", jobId);
+
+  const source = new EventSource(url.toString());
+  const listen = <T,>(type: string, handler?: (data: T) => void) => {
+    if (!handler) return;
+    source.addEventListener(type, (event) => {
+      handler(JSON.parse((event as MessageEvent).data) as T);
+    });
+  };
+
+  listen<{ jobs: ScraperJobStatus[] }>("snapshot", (data) => handlers.onSnapshot?.(data.jobs));
+  listen("job_started", handlers.onJobStarted);
+  listen("job_finished", handlers.onJobFinished);
+  listen("progress", handlers.onProgress);
+  listen("listed", handlers.onListed);
+  listen("detailed", handlers.onDetailed);
+  listen("saved", handlers.onSaved);
+  listen("lagged", handlers.onLagged);
+
+  return () => source.close();
+}
+
 export async function getScraperStatus(): Promise<ScraperStatus> {
   const response = await fetch(`${API_BASE_URL}/api/scraper/status`);
 
@@ -1,6 +1,7 @@
 export interface Job {
   title: string;
-  description: string;
+  // 一覧取得では省略される（表示時に取得）
+  description?: string;
   category: string;
   subcategory: string | null;
   budget_type: string;
@@ -0,0 +1,8 @@
+-- Migration: Add content_hash column to jobs
+-- Created at: 2025-12-22
+
+-- content_hash カラム追加（scraped_at を除くレコード内容の SHA-256）
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+-- コメント追加
+COMMENT ON COLUMN jobs.content_hash IS 'レコード内容のハッシュ (scraped_at除く、変更検知用)';
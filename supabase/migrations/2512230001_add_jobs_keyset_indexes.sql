@@ -0,0 +1,11 @@
+-- Migration: Add indexes for jobs list keyset pagination and filters
+-- Created at: 2025-12-23
+
+-- 一覧のキーセットページング用（scraped_at, job_id の降順）
+CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at_job_id ON jobs(scraped_at DESC, job_id DESC);
+
+-- 案件形式で絞り込んだ一覧用（既定の job_types=project）
+CREATE INDEX IF NOT EXISTS idx_jobs_job_type_scraped_at_job_id ON jobs(job_type, scraped_at DESC, job_id DESC);
+
+-- 必要スキルの包含検索用（required_skills @> '["Python"]'）
+CREATE INDEX IF NOT EXISTS idx_jobs_required_skills ON jobs USING GIN (required_skills jsonb_path_ops);
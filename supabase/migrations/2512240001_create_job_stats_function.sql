@@ -0,0 +1,29 @@
+-- Migration: Create job_stats function
+-- Created at: 2025-12-24
+
+-- 案件数の統計（今日・今週・全体・カテゴリ別）を1回の集計で返す
+-- /api/scraper/stats から RPC で呼び出す
+CREATE OR REPLACE FUNCTION job_stats(today_start TIMESTAMPTZ, week_start TIMESTAMPTZ)
+RETURNS JSON
+LANGUAGE sql
+STABLE
+AS $$
+  WITH by_category AS (
+    SELECT
+      category,
+      COUNT(*) AS total,
+      COUNT(*) FILTER (WHERE scraped_at >= today_start) AS today,
+      COUNT(*) FILTER (WHERE scraped_at >= week_start) AS this_week
+    FROM jobs
+    GROUP BY category
+  )
+  SELECT json_build_object(
+    'today', COALESCE(SUM(today), 0)::BIGINT,
+    'this_week', COALESCE(SUM(this_week), 0)::BIGINT,
+    'total', COALESCE(SUM(total), 0)::BIGINT,
+    'by_category', COALESCE(json_object_agg(category, total), '{}'::json)
+  )
+  FROM by_category;
+$$;
+
+COMMENT ON FUNCTION job_stats(TIMESTAMPTZ, TIMESTAMPTZ) IS '案件数の統計（今日・今週・全体・カテゴリ別）';
@@ -0,0 +1,22 @@
+-- Migration: Keep jobs.updated_at when only scraped_at is touched
+-- Created at: 2025-12-25
+
+-- 変更のなかった案件は scraped_at だけを更新する（最終取得日時）。
+-- その更新では updated_at（内容の最終更新日時）を進めない。
+CREATE OR REPLACE FUNCTION update_jobs_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF (to_jsonb(NEW) - 'scraped_at' - 'updated_at')
+     IS DISTINCT FROM (to_jsonb(OLD) - 'scraped_at' - 'updated_at') THEN
+    NEW.updated_at = NOW();
+  END IF;
+  RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS update_jobs_updated_at ON jobs;
+
+CREATE TRIGGER update_jobs_updated_at
+  BEFORE UPDATE ON jobs
+  FOR EACH ROW
+  EXECUTE FUNCTION update_jobs_updated_at_column();